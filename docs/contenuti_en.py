@@ -0,0 +1,915 @@
+"""
+Contenuti inglesi del Manuale Utente di Tramando.
+
+Caricati da genera_manuale.py solo quando si genera la versione inglese.
+"""
+
+CONTENUTI = {
+    'filename': 'Tramando_Manual_English.pdf',
+    'tagline': 'Weave your story',
+    'manual_title': 'User Manual',
+    'version': 'Version 2.0',
+    'toc_title': 'Contents',
+
+    'chapters': [
+        '1. Introduction',
+        '2. Usage Modes',
+        '3. Getting Started',
+        '4. What is Markup',
+        '5. The Interface',
+        '6. Narrative Structure',
+        '7. Aspects',
+        '8. Connections',
+        '9. Annotations',
+        '10. Search and Replace',
+        '11. Radial Map',
+        '12. PDF, Word and Markdown Export',
+        '13. Settings',
+        '14. The .trmd File Format',
+        '15. Keyboard Shortcuts',
+        '16. AI Assistant (optional)',
+        '17. Collaborative Mode',
+        'Appendix: Quick Reference',
+    ],
+
+    'captions': {
+        'splash_tauri': 'The welcome screen (desktop version)',
+        'splash_webapp': 'The welcome screen (webapp with login)',
+        'main': 'Tramando\'s main interface',
+        'filter': 'Global filter and search in action',
+        'map': 'The radial map with connections between elements',
+        'settings': 'The settings panel',
+        'priority_sidebar': 'The priority threshold widget in the sidebar',
+        'priority_editor': 'The priority field in the aspect editor',
+    },
+
+    # =========================================================================
+    # CHAPTER 1: INTRODUCTION
+    # =========================================================================
+    'ch1': {
+        'title': '1. Introduction',
+
+        's1_title': 'What is Tramando',
+        's1_p1': 'Tramando is a tool designed for writers who need to manage complex stories. Whether you\'re writing a novel with dozens of characters, a screenplay with multiple narrative threads, or building an imaginary world with its own history and geography, Tramando helps you keep everything under control.',
+        's1_p2': 'Unlike a regular word processor, Tramando doesn\'t just let you write text. It lets you organize your story into modular blocks called "chunks", define characters, places and themes as separate entities, and connect them together to see how they interweave in the narrative.',
+        's1_p3': 'The result is an overview of your work that would be impossible to achieve with traditional tools: you can see in which scenes a character appears, track the development of a theme through chapters, or verify timeline consistency.',
+
+        's2_title': 'The Origin of the Name',
+        's2_p1': 'The name "Tramando" comes from a play on words in Italian. On one hand there\'s <b>trama</b> (plot), because writing is essentially weaving narrative threads, intertwining stories and destinies. On the other hand there\'s <b>tramando</b> (plotting), which evokes the sense of planning something, perhaps even a crime. As someone said, the difference between a writer and a murderer is thin: the former simply doesn\'t execute the plan.',
+
+        's3_title': 'The Philosophy: Everything is a Chunk',
+        's3_p1': 'In Tramando, the basic unit is the <b>chunk</b>: a block of text with a title and its own identity. A chapter is a chunk. A scene is a chunk. But also a character is a chunk, a place is a chunk, even a single note can be a chunk.',
+        's3_p2': 'Chunks can contain other chunks, creating a completely flexible tree structure. There are no rigid rules on how to organize your work: you can have Book > Part > Chapter > Scene, or simply a flat list of scenes. Tramando adapts to your way of thinking and writing, not the other way around.',
+
+        's4_title': 'Who is Tramando For',
+        's4_items': [
+            '<b>Novelists</b> managing large casts and intertwined plots, who need to track who appears where and when',
+            '<b>Screenwriters</b> who need to keep track of scenes, characters, and narrative arcs across multiple episodes or acts',
+            '<b>Series authors</b> who must maintain consistency across volumes, remembering details established in previous books',
+            '<b>Worldbuilders</b> constructing complex worlds with their own history, geography, and cast of characters',
+            'Anyone writing stories with <b>many interconnected elements</b> who wants a tool to visualize and manage them',
+        ],
+    },
+
+    # =========================================================================
+    # CHAPTER 2: USAGE MODES
+    # =========================================================================
+    'ch2_modes': {
+        'title': '2. Usage Modes',
+
+        'intro': 'Tramando is available in three different modes, each designed for specific needs. You can choose the one that best fits your workflow.',
+
+        's1_title': 'Desktop Application (Tauri)',
+        's1_p1': 'The desktop version is a native application for <b>Mac</b>, <b>Windows</b>, and <b>Linux</b>. It works completely offline and saves your projects as .trmd files on your computer.',
+        's1_items': [
+            '<b>Works offline</b> - No internet connection required',
+            '<b>Local files</b> - Projects are saved on your disk as .trmd files',
+            '<b>Native performance</b> - Fast and responsive interface',
+            '<b>System integration</b> - Full support for shortcuts, drag&drop, and file management',
+        ],
+        's1_note': 'This is the recommended version for most users.',
+
+        's2_title': 'Local Webapp',
+        's2_p1': 'You can also use Tramando directly in your browser by opening the webapp on a local server. This mode is identical to desktop but requires a modern browser.',
+        's2_items': [
+            '<b>No installation</b> - Just a web browser',
+            '<b>Local files</b> - Save to disk via browser API',
+            '<b>Cross-platform</b> - Works on any system with a modern browser',
+        ],
+
+        's3_title': 'Collaborative Webapp',
+        's3_p1': 'The collaborative mode allows multiple people to work on the same project. It requires a Tramando server (self-hosted or cloud).',
+        's3_items': [
+            '<b>Real-time collaboration</b> - Multiple authors on the same project',
+            '<b>Role management</b> - Owner, Admin and Collaborator with different permissions',
+            '<b>Chunk ownership</b> - Each chunk has an owner who can be transferred',
+            '<b>Proposals and discussions</b> - System for suggesting changes',
+            '<b>Integrated chat</b> - Communication between collaborators for each chunk',
+        ],
+        's3_note': 'For details on collaborative mode, see the dedicated chapter.',
+
+        's4_title': 'Main Differences',
+        's4_table': [
+            ['Feature', 'Desktop', 'Local Webapp', 'Collaborative'],
+            ['Connection', 'Offline', 'Offline', 'Required'],
+            ['Saving', '.trmd file', '.trmd file', 'Server'],
+            ['Versions/Backup', 'Yes', 'Yes', 'No (server)'],
+            ['Collaboration', 'No', 'No', 'Yes'],
+            ['Ownership', 'No', 'No', 'Yes'],
+            ['Chat', 'No', 'No', 'Yes'],
+            ['Proposals', 'No', 'No', 'Yes'],
+        ],
+
+        's5_title': 'Which one to choose?',
+        's5_items': [
+            '<b>Writing alone?</b> - Use the desktop application',
+            '<b>Don\'t want to install anything?</b> - Use the local webapp',
+            '<b>Working in a team?</b> - Use collaborative mode',
+        ],
+    },
+
+    # =========================================================================
+    # CHAPTER 3: GETTING STARTED
+    # =========================================================================
+    'ch3': {
+        'title': '3. Getting Started',
+
+        's1_title': 'Launching Tramando',
+        's1_p1': 'Tramando is available as a desktop application for Mac, Windows, and Linux. Once installed and launched, you\'ll be greeted by the welcome screen with three clear options to get started:',
+        's1_items': [
+            '<b>Continue current work</b> - Automatically resumes the last project you were working on, exactly where you left off',
+            '<b>New project</b> - Creates a completely empty project, ready to welcome your new story',
+            '<b>Open file...</b> - Lets you load an existing .trmd file from your computer',
+        ],
+
+        's2_title': 'Your First Project',
+        's2_p1': 'When you create a new project, Tramando presents a clean and intuitive interface, divided into two main areas. On the left you\'ll find the <b>sidebar</b>, which contains your project structure: here you\'ll see the tree of your chapters, scenes, and all story elements grow.',
+        's2_p2': 'On the right is the <b>editor</b>, the space where you actually write and edit content. The editor includes advanced features like syntax highlighting for markup, line numbers, and the ability to quickly switch from writing mode to reading mode.',
+
+        's3_title': 'Saving Your Work',
+        's3_p1': 'Tramando automatically saves your work every few seconds. You can configure the autosave interval in settings, choosing a value between 1 and 10 seconds. This means you\'ll never lose more than a few seconds of work even in case of a crash or accidental closure.',
+        's3_p2': 'In addition to autosave, you can manually save to a file by clicking the <b>Save</b> button in the top bar. The file will have a <b>.trmd</b> extension and will be a readable text file, which you can also open with a regular text editor if needed.',
+        's3_tip': '<i>Tip: even with autosave active, it\'s good practice to save to file regularly. This way you\'ll always have an external backup you can copy to cloud or USB drive.</i>',
+
+        's4_title': 'Versions and Backup',
+        's4_p1': 'Tramando includes a complete version management system. Next to the Save buttons you\'ll find a <b>Version</b> dropdown menu with three options:',
+        's4_items': [
+            '<b>Save version</b> - Creates a snapshot of your work with date/time and an optional description. Useful before major changes or to mark significant milestones.',
+            '<b>Version list</b> - Shows all saved versions. For each version you can: <b>Open copy</b> (opens the version as a new unsaved document, without touching the current file) or <b>Restore</b> (replaces the current file with the selected version, first creating an automatic backup).',
+            '<b>Restore backup</b> - Recovers the last automatic backup. Tramando creates a .backup file every time you save, allowing you to return to the previous state.',
+        ],
+        's4_p2': 'When the document has unsaved changes, a <b>dot</b> appears next to the filename in the top bar. This indicator reminds you that there are changes to save.',
+        's4_note': '<i>Note: versions are saved in the application data folder, not next to the original file. This ensures compatibility with cloud folders like iCloud.</i>',
+    },
+
+    # =========================================================================
+    # CHAPTER 4: WHAT IS MARKUP
+    # =========================================================================
+    'ch4': {
+        'title': '4. What is Markup',
+
+        'intro': 'If you\'ve always used programs like Microsoft Word or Google Docs, you may have never heard of "markup". Don\'t worry: it\'s a simple concept that, once understood, will seem natural and powerful.',
+
+        's1_title': 'Visual Formatting vs Markup',
+        's1_p1': 'In Word, when you want to make a word bold, you select it with the mouse and click the B button in the toolbar. This approach is called <b>visual formatting</b> or WYSIWYG (What You See Is What You Get): what you see on screen is exactly what you get.',
+        's1_p2': 'With <b>markup</b>, instead, you insert special symbols directly into the text. These symbols are then interpreted and transformed into the desired formatting. For example, instead of clicking a button for bold, you write:',
+        's1_code': 'This word is **important**',
+        's1_result': 'And the result will be: This word is <b>important</b>',
+
+        's2_title': 'Why Use Markup?',
+        's2_items': [
+            '<b>Speed</b> - You never have to take your hands off the keyboard to search for buttons or menus. You write and format in a continuous flow',
+            '<b>Portability</b> - Files are pure text, readable on any device and with any program',
+            '<b>Control</b> - You always see exactly what\'s in the document, with no hidden formatting or mysterious styles',
+            '<b>Lightness</b> - Small and fast files, no proprietary format, no risk of corruption',
+        ],
+
+        's3_title': 'Markdown: The Standard',
+        's3_p1': 'Tramando uses <b>Markdown</b>, the most widespread markup language in the world. You\'ll find it on GitHub, Reddit, Discord, Notion, and hundreds of other platforms. Learning it once will serve you everywhere.',
+        's3_table_title': 'Basic Markdown commands:',
+        's3_table': [
+            ['What you want', 'What you write', 'Result'],
+            ['Bold', '**text**', 'text in bold'],
+            ['Italic', '*text*', 'text in italic'],
+            ['Title', '# Title', 'Large heading'],
+            ['Subtitle', '## Subtitle', 'Medium heading'],
+            ['Bullet list', '- item', '* item'],
+            ['Numbered list', '1. item', '1. item'],
+        ],
+
+        's4_title': 'Tramando\'s Special Markup',
+        's4_p1': 'In addition to standard Markdown, Tramando adds its own syntax for specific features:',
+        's4_table': [
+            ['Function', 'Syntax', 'Example'],
+            ['Aspect reference', '[@id]', '[@elena]'],
+            ['TODO annotation', '[!TODO:text:priority:comment]', '[!TODO:rewrite:1:too long]'],
+            ['NOTE annotation', '[!NOTE:text::comment]', '[!NOTE:verify date::]'],
+            ['FIX annotation', '[!FIX:text:priority:]', '[!FIX:name error:2:]'],
+            ['Arabic number', '[:ORD]', '1, 2, 3...'],
+            ['Roman number', '[:ORD-ROM]', 'I, II, III...'],
+        ],
+
+        's5_title': 'Don\'t Worry!',
+        's5_p1': 'Tramando highlights all markup with different colors, making it easy to distinguish special symbols from regular text. Additionally, the <b>Reading</b> tab always shows you the final result, without any visible symbols.',
+        's5_tip': '<i>After a few days of use, writing **bold** or [@character] will feel as natural as clicking a button. And you\'ll be much faster.</i>',
+    },
+
+    # =========================================================================
+    # CHAPTER 5: THE INTERFACE
+    # =========================================================================
+    'ch5': {
+        'title': '5. The Interface',
+
+        's1_title': 'The Top Bar',
+        's1_p1': 'The bar at the top contains all the main application commands:',
+        's1_items': [
+            '<b>Tramando Logo</b> - Clicking it returns you to the welcome screen',
+            '<b>Project Title</b> - Shows the current project name; clicking it lets you edit metadata (title, author, year...)',
+            '<b>Load</b> - Opens a .trmd file from your computer',
+            '<b>Save</b> - Downloads the current project as a .trmd file',
+            '<b>Version</b> - Menu to save versions, view version list, or restore a backup',
+            '<b>Export</b> - Dropdown menu for exporting to PDF, Markdown or Word (.docx)',
+            '<b>Annotations Badge</b> - Shows the total number of annotations; clicking it opens the annotations panel',
+            '<b>Map/Editor Toggle</b> - Switches between the radial map view and text editor',
+            '<b>Gear Icon</b> - Opens the settings panel',
+        ],
+
+        's2_title': 'The Sidebar',
+        's2_p1': 'The left side panel is your project\'s navigation center:',
+        's2_sub1': 'Filter Field',
+        's2_sub1_p': 'At the top of the sidebar you\'ll find a search field that filters the entire project. As you type, you\'ll see only elements that contain the searched text, both in title and content.',
+        's2_sub2': 'STRUCTURE',
+        's2_sub2_p': 'This section contains your actual narrative: chapters, scenes, parts. It\'s organized as an expandable tree. The number in parentheses indicates how many elements it contains.',
+        's2_sub3': 'ASPECTS',
+        's2_sub3_p': 'Here you\'ll find the five types of cross-cutting elements, each with its distinctive icon: <b>Characters</b> (👤), <b>Places</b> (📍), <b>Themes</b> (💡), <b>Sequences</b> (🔗), <b>Timeline</b> (📅). For each category you can set a priority threshold using the −/+ buttons.',
+
+        's3_title': 'The Editor',
+        's3_p1': 'The main area on the right is where writing happens. It includes three tabs (four for aspects):',
+        's3_items': [
+            '<b>Edit</b> - The actual editor, with syntax highlighting for markup',
+            '<b>Used by</b> - Aspects only: shows the scenes that use this element',
+            '<b>Reading</b> - Clean preview of the text, without visible markup',
+        ],
+        's3_p2': 'Above the editor you\'ll find: the field to edit the title, tags of connected aspects, and the "+ Aspect" button to add connections. The context menu (⋮) allows you to move the element, create children, edit the ID and other actions.',
+    },
+
+    # =========================================================================
+    # CHAPTER 6: NARRATIVE STRUCTURE
+    # =========================================================================
+    'ch6': {
+        'title': '6. Narrative Structure',
+
+        's1_title': 'Tree Organization',
+        's1_p1': 'The STRUCTURE section in the sidebar contains your story\'s text, organized as a hierarchical tree. Each element can contain other elements, allowing you to create whatever structure you prefer.',
+        's1_p2': 'A typical structure might be: <b>Book</b> > <b>Part</b> > <b>Chapter</b> > <b>Scene</b>. But there are no fixed rules: you might have only chapters, or scenes without chapters, or a completely different structure. Tramando adapts to you.',
+
+        's2_title': 'Creating New Elements',
+        's2_items': [
+            'Click <b>"+ New Chunk"</b> in the sidebar to create an element at the root level',
+            'To create a nested element, select a chunk and use the menu (⋮) > <b>"+ Child"</b>',
+            'Each chunk automatically receives a unique ID (e.g., cap-1, scene-2)',
+            'You can modify the ID from the menu (⋮) > <b>"Edit ID"</b> to make it more meaningful (e.g., "prologue", "climax")',
+        ],
+
+        's3_title': 'Automatic Numbering',
+        's3_p1': 'Tramando supports special macros in the title that are replaced with automatic numbers, based on the element\'s position among its siblings.',
+        's3_table': [
+            ['Macro', 'Result', 'Example'],
+            ['[:ORD]', 'Arabic numbers', '1, 2, 3, 4...'],
+            ['[:ORD-ROM]', 'Uppercase Roman', 'I, II, III, IV...'],
+            ['[:ORD-rom]', 'Lowercase Roman', 'i, ii, iii, iv...'],
+            ['[:ORD-ALPHA]', 'Uppercase letters', 'A, B, C, D...'],
+            ['[:ORD-alpha]', 'Lowercase letters', 'a, b, c, d...'],
+        ],
+        's3_example': 'If you write "Chapter [:ORD]: The Awakening" as the title of the first chapter, it will appear as "Chapter 1: The Awakening". The second chapter with "Chapter [:ORD]: The Departure" will become "Chapter 2: The Departure", and so on.',
+    },
+
+    # =========================================================================
+    # CHAPTER 7: ASPECTS
+    # =========================================================================
+    'ch7': {
+        'title': '7. Aspects',
+
+        'intro': 'Aspects are elements that cross through the story transversally. They\'re not part of the linear narrative sequence, but connect to it at various points. Tramando defines five types of aspects, each with a distinctive color.',
+
+        's1_title': 'Characters',
+        's1_color': 'Color: red (#c44a4a)',
+        's1_p1': 'Characters are the entities that inhabit your narrative world. Each character can have a profile with their description, and you can create sub-elements to organize information: physical appearance, background, narrative arc, relationships with other characters.',
+        's1_p2': 'By connecting a character to the scenes where they appear, you\'ll always know where and when they intervene in the story, making consistency checks easier.',
+
+        's2_title': 'Places',
+        's2_color': 'Color: green (#4a9a6a)',
+        's2_p1': 'Places are the spaces where things happen. You can organize them hierarchically: a Country contains Cities, which contain Districts, which contain Buildings, which contain Rooms.',
+        's2_p2': 'Each place can have its detailed description, and by connecting it to scenes you\'ll always know where each moment of the story takes place.',
+
+        's3_title': 'Themes',
+        's3_color': 'Color: orange (#b87333)',
+        's3_p1': 'Themes are the recurring ideas and motifs of your story: revenge, redemption, love, betrayal, personal growth. By defining them as aspects and connecting them to relevant scenes, you can track how each theme develops through the narrative.',
+        's3_p2': 'This is particularly useful during revision, when you want to ensure a theme has been adequately developed or hasn\'t been abandoned mid-story.',
+
+        's4_title': 'Sequences',
+        's4_color': 'Color: purple (#8a5ac2)',
+        's4_p1': 'Sequences are cause-and-effect chains that cross through the story. Unlike narrative structure (which follows reading order), sequences follow the internal logic of events.',
+        's4_p2': 'For example, a "Marco\'s Revenge" sequence might have as children: "Discovery of betrayal" > "Planning" > "First failed attempt" > "Success" > "Consequences". These steps might be scattered across different chapters, but the sequence keeps them connected.',
+
+        's5_title': 'Timeline',
+        's5_color': 'Color: blue (#4a90c2)',
+        's5_p1': 'The timeline contains events in actual chronological order, regardless of how they appear in the narrative. It\'s particularly useful when your story isn\'t linear: flashbacks, flash-forwards, or parallel narratives.',
+        's5_p2': 'You can use dates or timestamps in event titles (e.g., "2024-03-15 08:00 - Awakening") to maintain the correct order.',
+        's5_tip': '<i>Tip: use ISO date format (YYYY-MM-DD) in timeline titles for alphabetical sorting that matches chronological order.</i>',
+
+        's6_title': 'Creating Aspects',
+        's6_p1': 'To create a new aspect, click the <b>"+ New aspect"</b> button in the sidebar, under the desired category. Each aspect will have its own unique ID and you can give it a descriptive title.',
+
+        's7_title': 'Aspect Priority',
+        's7_p1': 'Each aspect can have a <b>priority</b> from 0 (low) to 10 (high). This lets you distinguish between main and minor elements of your story.',
+        's7_items': [
+            'In the aspect editor, you\'ll find the <b>Priority</b> field with a numeric value',
+            'Higher priority aspects appear first in the sidebar',
+            'You can use the threshold to hide minor aspects',
+        ],
+
+        's8_title': 'Threshold Filter',
+        's8_p1': 'In each aspect category (Characters, Places, etc.) you\'ll find a <b>threshold</b> widget with −0+ buttons. This sets the minimum priority level visible:',
+        's8_items': [
+            'If threshold is <b>0</b>, all aspects are visible',
+            'If threshold is <b>3</b>, only aspects with priority >= 3 are visible',
+            'Filtered aspects don\'t appear in sidebar or radial map',
+            'Tags for filtered aspects appear faded in the editor',
+        ],
+        's8_tip': '<i>Tip: use priorities to focus on main characters while writing, then lower the threshold during revision to check that minor characters are also consistent.</i>',
+    },
+
+    # =========================================================================
+    # CHAPTER 8: CONNECTIONS
+    # =========================================================================
+    'ch8': {
+        'title': '8. Connections',
+
+        'intro': 'Tramando\'s real power lies in the connections between narrative structure and aspects. By connecting scenes to characters, places, and themes, you create a network of relationships that lets you navigate and analyze your story in ways impossible with traditional tools.',
+
+        's1_title': '[@id] Syntax',
+        's1_p1': 'The most direct way to create a connection is to write <b>[@id]</b> in the scene\'s text, where "id" is the identifier of the aspect you want to connect.',
+        's1_p2': 'For example, if you have a character with ID "elena", writing [@elena] in a scene automatically creates a connection. This method is particularly useful when you want to mark the exact point where an element appears in the text.',
+
+        's2_title': 'Tag Method',
+        's2_p1': 'An alternative is to use the visual tags above the editor:',
+        's2_items': [
+            'Select the scene you want to connect',
+            'Click the <b>"+ Aspect"</b> button above the editor',
+            'Choose the aspect from the menu that appears',
+            'The tag will appear below the scene\'s title',
+        ],
+        's2_p2': 'To remove a connection, click the <b>x</b> next to the tag.',
+
+        's3_title': '"Used by" Tab',
+        's3_p1': 'When you select an aspect (character, place, theme...), the "Used by" tab shows you all the scenes that reference it. It\'s a quick way to answer the question: "Where does this element appear in the story?"',
+
+        's4_title': 'Count in Sidebar',
+        's4_p1': 'In the sidebar, next to each aspect, you see a number in parentheses (e.g., "Elena (6)"). This indicates how many scenes the element is connected to, giving you an immediate idea of its importance in the story.',
+
+        's5_title': 'Best Practices',
+        's5_items': [
+            'Use short and meaningful IDs: "elena" is better than "character-001"',
+            'Create connections as you write, not after - it\'s easier and maintains consistency',
+            'Don\'t overdo it: only connect aspects that are truly relevant to each scene',
+            'Use tags for recurring aspects, [@id] in text for specific references',
+        ],
+    },
+
+    # =========================================================================
+    # CHAPTER 9: ANNOTATIONS
+    # =========================================================================
+    'ch9': {
+        'title': '9. Annotations',
+
+        'intro': 'Annotations are notes you leave for yourself during writing. They\'re visible in Tramando but will never appear in the final exported product. They\'re your space for notes, reminders, and flags.',
+
+        's1_title': 'Annotation Types',
+        's1_items': [
+            '<b>TODO</b> - Things to do: "add location description", "develop the dialogue", "research historical details"',
+            '<b>NOTE</b> - Notes and reflections: "verify this date", "idea for sequel", "perhaps too long"',
+            '<b>FIX</b> - Problems to fix: "inconsistency with chapter 3", "name error", "timeline doesn\'t work"',
+        ],
+
+        's2_title': 'Creating Annotations',
+        's2_p1': 'There are two ways to create an annotation:',
+        's2_items': [
+            'Select the text to annotate, right-click, and choose the annotation type from the menu',
+            'Write the syntax directly in the text',
+        ],
+
+        's3_title': 'The Syntax',
+        's3_p1': 'The annotation format is:',
+        's3_code': '[!TYPE:text:priority:comment]',
+        's3_examples_title': 'Examples:',
+        's3_examples': [
+            '[!TODO:rewrite this dialogue:1:too formal]',
+            '[!NOTE:verify historical date::check encyclopedia]',
+            '[!FIX:Marco is called Luca here:3:]',
+        ],
+
+        's4_title': 'Annotations Panel',
+        's4_p1': 'In the sidebar, the ANNOTATIONS section collects all project annotations, grouped by type (TODO, FIX, NOTE). Clicking an annotation takes you directly to the point in the text where it\'s located.',
+        's4_p2': 'The badge in the top bar shows the total number of annotations, always giving you visibility on how much revision work awaits.',
+
+        's5_note': '<b>Important:</b> annotations do NOT appear in PDF export. They\'re exclusively for the author during the writing process.',
+    },
+
+    # =========================================================================
+    # CHAPTER 10: SEARCH AND REPLACE
+    # =========================================================================
+    'ch10': {
+        'title': '10. Search and Replace',
+
+        'intro': 'Tramando offers powerful search tools for navigating even the largest projects. There are two levels of search: global (across the entire project) and local (on the current chunk).',
+
+        's1_title': 'Global Filter',
+        's1_p1': 'The search field at the top of the sidebar filters the entire project. As you type, the sidebar shows only elements that contain the searched text, both in title and content.',
+        's1_features': [
+            '<b>[Aa]</b> - Toggle for case-sensitive search',
+            '<b>[.*]</b> - Toggle to enable regular expressions',
+            'Results appear as a flat list with the full path',
+            'Clicking a result opens it in the editor with matches highlighted',
+        ],
+
+        's2_title': 'Local Search',
+        's2_p1': 'Press <b>Ctrl+F</b> (or <b>Cmd+F</b> on Mac) to open the search bar above the editor. This searches only in the current chunk.',
+        's2_features': [
+            'All matches are highlighted in yellow',
+            'The current match is highlighted in more intense orange',
+            'The <b>&lt;</b> and <b>&gt;</b> arrows navigate between matches',
+            'The <b>up/down arrow</b> keys work as an alternative',
+            'The counter (e.g., "3/12") shows current position out of total',
+        ],
+
+        's3_title': 'Replace',
+        's3_p1': 'Press <b>Ctrl+H</b> (or <b>Cmd+H</b> on Mac) to open the replace bar. A second field appears for the replacement text.',
+        's3_features': [
+            '<b>Replace</b> - Changes the current match and moves to the next',
+            '<b>Replace all</b> - Changes all occurrences at once',
+            'A message confirms how many replacements were made',
+            '<b>Ctrl+Z</b> undoes the replacements',
+        ],
+
+        's4_title': 'Regular Expressions',
+        's4_p1': 'By activating the [.*] toggle you can use regular expressions for advanced searches:',
+        's4_examples': [
+            '<b>\\bword\\b</b> - Finds "word" as a whole word, not as part of other words',
+            '<b>chap[ter]</b> - Finds both "chapter" and "chaptor"',
+            '<b>\\d{4}</b> - Finds 4-digit sequences (useful for searching years)',
+            '<b>^beginning</b> - Finds "beginning" only at the start of a line',
+        ],
+    },
+
+    # =========================================================================
+    # CHAPTER 11: RADIAL MAP
+    # =========================================================================
+    'ch11': {
+        'title': '11. Radial Map',
+
+        'intro': 'The radial map is a graphical visualization of your story. It lets you "see" the plot as a whole, with all the connections between structure and aspects represented visually.',
+
+        's1_title': 'Reading the Map',
+        's1_items': [
+            '<b>Center</b> - The project title',
+            '<b>Inner ring (gray)</b> - The narrative structure: chapters and scenes',
+            '<b>Outer rings</b> - The aspects, each with its color (red characters, green places, etc.)',
+            '<b>Lines</b> - The connections between scenes and aspects',
+        ],
+
+        's2_title': 'Interaction',
+        's2_items': [
+            '<b>Scroll</b> - Zoom in and out',
+            '<b>Click</b> - Select an element',
+            '<b>Hover</b> - Shows details in the info panel',
+            '<b>Drag</b> - Move the view when zoomed in',
+        ],
+
+        's3_title': 'Info Panel',
+        's3_p1': 'At the bottom left of the map you\'ll find the info panel, divided into two sections:',
+        's3_items': [
+            '<b>HOVER</b> - Shows information about the element under the cursor',
+            '<b>SELECTION</b> - Shows information about the element selected by clicking',
+        ],
+        's3_p2': 'For each element you see: name, type, ID, and number of connections.',
+
+        's4_title': 'What It\'s For',
+        's4_p1': 'The radial map is useful for:',
+        's4_items': [
+            'Seeing character distribution in the story',
+            'Identifying overloaded scenes (too many lines = too many elements)',
+            'Discovering isolated elements (aspects defined but never used)',
+            'Understanding relationships between different elements',
+            'Getting an overview for structural decisions',
+        ],
+    },
+
+    # =========================================================================
+    # CHAPTER 12: PDF, WORD AND MARKDOWN EXPORT
+    # =========================================================================
+    'ch12': {
+        'title': '12. PDF, Word and Markdown Export',
+
+        's1_title': 'How to Export',
+        's1_items': [
+            'Click on <b>"Export"</b> in the top bar',
+            'Choose the desired format: <b>PDF</b>, <b>Word (.docx)</b> or <b>Markdown</b>',
+            'The file is generated and downloaded automatically',
+        ],
+
+        's2_title': 'What\'s Included',
+        's2_items': [
+            'Title page with title and author (taken from project metadata)',
+            'Chapters with title at top and page break',
+            'Scenes separated by <b>***</b> centered',
+            'Markdown formatting: bold, italic, headings, lists',
+        ],
+
+        's3_title': 'What\'s Excluded',
+        's3_items': [
+            'YAML frontmatter (technical metadata)',
+            '[@id] aspect references',
+            'Chunk IDs and metadata',
+            'Annotations (TODO, NOTE, FIX)',
+            'Aspect containers and their content',
+        ],
+
+        's4_note': '<b>In practice:</b> the export contains only clean narrative, ready for reading or printing. All the "behind the scenes" remains hidden.',
+
+        's5_title': 'PDF Format - Technical Specs',
+        's5_table': [
+            ['Property', 'Value'],
+            ['Page format', 'A5'],
+            ['Margins', '60pt top, 70pt bottom, 50pt sides'],
+            ['Font', 'Roboto'],
+            ['Chapter title', '18pt bold'],
+            ['Body text', '11pt, justified'],
+            ['Line spacing', '1.4'],
+            ['Page numbers', 'Centered at bottom'],
+        ],
+
+        's6_title': 'Word Export (.docx)',
+        's6_p1': 'The Word export generates a .docx document compatible with Microsoft Word, LibreOffice and Google Docs. It maintains basic formatting (bold, italic, headings) and is ideal for revision with editors or literary agents.',
+
+        's7_title': 'Markdown Export',
+        's7_p1': 'The Markdown export generates a plain text .md file. Useful for importing text into other programs (Scrivener, Obsidian, etc.) or for having a readable text backup.',
+    },
+
+    # =========================================================================
+    # CHAPTER 13: SETTINGS
+    # =========================================================================
+    'ch13': {
+        'title': '13. Settings',
+
+        's1_title': 'Themes',
+        's1_p1': 'Tramando includes four preset themes:',
+        's1_table': [
+            ['Theme', 'Description'],
+            ['Tessuto', 'Warm beige with paper texture (default)'],
+            ['Dark', 'Dark theme with pink accents, for night writing'],
+            ['Light', 'Light and minimal theme'],
+            ['Sepia', 'Vintage and warm tones, simulates aged paper'],
+        ],
+
+        's2_title': 'Autosave',
+        's2_p1': 'A slider lets you set the autosave interval from 1 to 10 seconds. The default value is 3 seconds. Autosave occurs N seconds after the last modification.',
+
+        's3_title': 'Language',
+        's3_p1': 'Tramando is available in Italian and English. Changing the language only modifies the interface; your project content is not altered.',
+
+        's4_title': 'Import/Export Settings',
+        's4_p1': 'You can export your settings to an .edn file and reimport them on another device. Useful for maintaining the same theme and configuration across multiple computers.',
+
+        's5_title': 'Tutorial',
+        's5_p1': 'The "Review tutorial" button reopens the interactive guide you saw on first launch. Useful if you want to refresh your memory on the features.',
+    },
+
+    # =========================================================================
+    # CHAPTER 14: THE .TRMD FILE FORMAT
+    # =========================================================================
+    'ch14': {
+        'title': '14. The .trmd File Format',
+
+        'intro': '.trmd files are pure text files, readable with any editor. This ensures your data is always accessible, even without Tramando.',
+
+        's1_title': 'General Structure',
+        's1_items': [
+            '<b>YAML Frontmatter</b> - Project metadata, enclosed between ---',
+            '<b>Content</b> - Chunks with their hierarchy',
+        ],
+
+        's2_title': 'Frontmatter',
+        's2_p1': 'The frontmatter contains project metadata:',
+        's2_code': '''---
+title: "My Novel"
+author: "Author Name"
+language: "en"
+year: 2024
+isbn: ""
+publisher: ""
+custom:
+  genre: "Thriller"
+---''',
+
+        's3_title': 'Chunk Syntax',
+        's3_code': '''[C:id"Chunk Title"][@aspect1][@aspect2]
+Chunk content here...
+
+  [C:child"Child Title"]
+  Child content indented with 2 spaces''',
+        's3_items': [
+            '<b>[C:id"title"]</b> defines a chunk with its ID and title',
+            '<b>[@id]</b> creates a connection to an aspect',
+            '<b>2 spaces</b> of indentation = 1 level of nesting',
+        ],
+
+        's4_title': 'Reserved IDs',
+        's4_p1': 'Some IDs are reserved for aspect containers:',
+        's4_items': ['personaggi', 'luoghi', 'temi', 'sequenze', 'timeline'],
+        's4_note': 'These IDs cannot be used for other elements.',
+
+        's5_title': 'Annotations in File',
+        's5_code': 'Text with [!TODO:to complete:1:urgent] annotation.',
+
+        's6_title': 'Extended Metadata (v2.0)',
+        's6_p1': 'Starting from version 2.0, chunks can have additional metadata:',
+        's6_table': [
+            ['Syntax', 'Meaning'],
+            ['[#owner:username]', 'Chunk owner (collaborative mode)'],
+            ['[#priority:N]', 'Aspect priority (0-10)'],
+            ['[!DISCUSSION:base64]', 'Base64-encoded discussions'],
+            ['[!PROPOSAL:original_text:proposed_text]', 'Inline edit proposal'],
+        ],
+        's6_note': '<i>These metadata are used internally and usually don\'t need manual editing.</i>',
+    },
+
+    # =========================================================================
+    # CHAPTER 15: KEYBOARD SHORTCUTS
+    # =========================================================================
+    'ch15': {
+        'title': '15. Keyboard Shortcuts',
+
+        's1_table': [
+            ['Shortcut', 'Action'],
+            ['Ctrl/Cmd + Z', 'Undo'],
+            ['Ctrl/Cmd + Shift + Z', 'Redo'],
+            ['Escape', 'Close modals and search bar'],
+            ['Ctrl/Cmd + F', 'Open search in chunk'],
+            ['Ctrl/Cmd + H', 'Open search and replace'],
+            ['Ctrl/Cmd + Shift + F', 'Focus on global filter'],
+            ['Up/Down arrow', 'Navigate search results'],
+            ['F3 / Shift + F3', 'Next/previous result'],
+        ],
+
+        's2_note': '<i>Note: Cmd is for macOS, Ctrl is for Windows/Linux.</i>',
+
+        's3_title': 'Undo History',
+        's3_p1': 'Tramando keeps the last 100 changes in the undo history. You can freely undo and redo with the shortcuts indicated above.',
+    },
+
+    # =========================================================================
+    # CHAPTER 16: AI ASSISTANT
+    # =========================================================================
+    'ch16': {
+        'title': '16. AI Assistant (optional)',
+
+        # Introduction
+        's1_title': 'Introduction',
+        's1_p1': 'The AI Assistant is a completely optional feature. Tramando works perfectly without it, and many writers prefer to work without AI support. If you\'re not interested, you can simply skip this chapter.',
+        's1_p2': 'If you decide to try it, know that Tramando\'s approach is non-invasive: the AI proposes, you always decide. No automatic changes to your text. Every suggestion goes through your approval. You can disable it at any time.',
+        's1_items': [
+            'Overcome creative blocks',
+            'Explore phrase variations',
+            'Generate character sheet drafts',
+            'Verify narrative consistency',
+        ],
+        's1_note': '<i>Remember: AI is a tool, not a co-author. The story remains yours.</i>',
+
+        # Configuration
+        's2_title': 'Configuration',
+        's2_p1': 'To enable the AI Assistant, go to Settings (gear icon) and find the "AI Assistant" section. Check "Enable AI assistant" to activate the feature.',
+        's2_sub1': 'Choosing a provider',
+        's2_table': [
+            ['Provider', 'Cost', 'Pros', 'Cons'],
+            ['Ollama', 'Free', 'Local, private', 'Requires installation'],
+            ['Groq', 'Free', 'Fast, good models', 'Usage limits'],
+            ['Anthropic', 'Paid', 'Excellent models', '~$3/million tokens'],
+            ['OpenAI', 'Paid', 'Excellent models', '~$2.50/million tokens'],
+        ],
+        's2_sub2': 'Ollama (free, local)',
+        's2_ollama': 'Ollama runs AI models on your computer. No data leaves your machine. Install Ollama from ollama.ai, start it, select "Ollama (local)" in Tramando, and download a model with: ollama pull llama3.2',
+        's2_sub3': 'Groq (free, cloud)',
+        's2_groq': 'Groq offers free APIs with fast Llama models. Register at console.groq.com, create an API Key, and paste it in Tramando selecting "Groq (Llama, fast)".',
+        's2_sub4': 'Anthropic and OpenAI (paid)',
+        's2_paid': 'For Anthropic (Claude) register at console.anthropic.com, for OpenAI at platform.openai.com. Add credit ($5 minimum), create an API key and paste it in Tramando. For normal use you\'ll spend a few cents per day.',
+
+        # Using AI without API
+        's3_title': 'Using AI without API',
+        's3_p1': 'If you don\'t want to configure APIs, you can use Tramando with Claude chat (claude.ai) or ChatGPT (chat.openai.com) using a manual workflow.',
+        's3_items': [
+            '<b>Step 1</b>: Select text, open the AI panel, write your request',
+            '<b>Step 2</b>: Click "Copy for chat" - the prompt is copied to clipboard',
+            '<b>Step 3</b>: Paste in external chat, wait for response, copy it',
+            '<b>Step 4</b>: Return to Tramando, click "Inject response", paste and confirm',
+        ],
+        's3_note': 'Tramando will process the response as if it arrived via API.',
+
+        # The panel
+        's4_title': 'The AI Assistant panel',
+        's4_p1': 'The panel opens with the AI button in the top bar or the shortcut Ctrl+Shift+A (Cmd+Shift+A on Mac).',
+        's4_items': [
+            '<b>Chat area</b>: shows the conversation with the AI',
+            '<b>Input field</b>: write your request',
+            '<b>Context selector</b>: choose what information to send to the AI',
+            '<b>Word indicator</b>: shows context size (green/yellow/red)',
+        ],
+        's4_sub1': 'The context selector',
+        's4_context': 'AI works better with context about your story. Quick presets: <b>Minimal</b> (current chunk only), <b>Scene</b> (+ linked characters/places), <b>Narrative</b> (+ sequences/timeline), <b>Complete</b> (everything). You can also customize individual options.',
+
+        # AI Actions
+        's5_title': 'Available AI actions',
+        's5_p1': 'Select text in the editor, right-click, and choose "AI Assistant":',
+        's5_sub1': 'Actions that propose alternatives',
+        's5_items1': [
+            '<b>Expand/develop</b>: enriches text with details',
+            '<b>Rephrase</b>: proposes alternative versions',
+            '<b>Make more...</b>: changes tone (dark, light, formal, casual, poetic)',
+        ],
+        's5_sub2': 'Actions that respond in chat',
+        's5_items2': [
+            '<b>Suggest conflict</b>: proposes narrative tensions',
+            '<b>Analyze consistency</b>: looks for inconsistencies',
+        ],
+        's5_sub3': 'Actions on aspects',
+        's5_items3': [
+            '<b>Create character/place sheet</b>: generates a sheet from text',
+            '<b>Extract info for...</b>: enriches an existing sheet with new information',
+        ],
+
+        # AI Annotations
+        's6_title': 'AI annotations',
+        's6_p1': 'When you ask the AI to rephrase or expand text, Tramando creates a special annotation.',
+        's6_flow': [
+            'Select text and ask "Rephrase"',
+            'An annotation [!NOTE:text:AI:] appears in the text',
+            'The request is sent (or you copy it for external chat)',
+            'When the response arrives, the annotation becomes [!NOTE:text:AI-DONE:...]',
+            'The proposed alternatives are stored in the annotation',
+        ],
+        's6_sub1': 'Choosing an alternative',
+        's6_choose': 'Right-click on the annotation. A menu appears with alternatives (radio buttons). Select the one you prefer, then "Apply selection" to replace the text, or "Cancel changes" to return to the original.',
+        's6_note': 'You can change your mind as many times as you want before confirming.',
+
+        # Tips
+        's7_title': 'Tips for better results',
+        's7_items': [
+            '<b>Right context</b>: Minimal for rephrasing, Scene for developing, Complete for consistency',
+            '<b>Right model</b>: large models (70B, Claude, GPT-4) for complex tasks',
+            '<b>AI as assistant</b>: use AI to explore possibilities, not to write for you',
+            '<b>Better prompts</b>: be specific, give context, ask for alternatives',
+        ],
+    },
+
+    # =========================================================================
+    # CHAPTER 17: COLLABORATIVE MODE
+    # =========================================================================
+    'ch17': {
+        'title': '17. Collaborative Mode',
+
+        'intro': 'Collaborative mode allows multiple authors to work together on the same project. This feature requires a Tramando server and a user account.',
+
+        's1_title': 'Requirements',
+        's1_items': [
+            'An active Tramando server (self-hosted or cloud)',
+            'A user account on the server',
+            'Internet connection during work',
+        ],
+
+        's2_title': 'Login and Projects',
+        's2_p1': 'From the welcome screen, in the <b>Server</b> section, enter your account credentials. After login, you\'ll see the list of projects you have access to.',
+        's2_items': [
+            '<b>Your projects</b> - Projects created by you',
+            '<b>Shared projects</b> - Projects you\'ve been invited to as a collaborator',
+        ],
+
+        's3_title': 'Roles and Permissions',
+        's3_p1': 'In each collaborative project there are three roles:',
+        's3_table': [
+            ['Role', 'Permissions'],
+            ['Owner', 'Full control: edit everything, manage collaborators, transfer ownership'],
+            ['Admin', 'Can edit everything, but cannot manage collaborators'],
+            ['Collaborator', 'Can only edit chunks they own'],
+        ],
+
+        's4_title': 'Chunk Ownership',
+        's4_p1': 'In collaborative mode, each chunk has an <b>owner</b>. This determines who can modify the content:',
+        's4_items': [
+            'When you create a new chunk, you automatically become its owner',
+            'Only the owner, an Admin, or the project Owner can modify a chunk',
+            'Ownership can be transferred to another collaborator',
+            'In the editor, the "Owner" field shows who owns the chunk',
+        ],
+
+        's5_title': 'Proposals (PROPOSAL)',
+        's5_p1': 'If you\'re not the owner of a chunk but want to suggest a change, you can create a <b>proposal</b>:',
+        's5_items': [
+            'Select the text you want to modify',
+            'Use the context menu and choose "Propose edit"',
+            'Write the alternative text you suggest',
+            'The proposal will appear highlighted in the text',
+        ],
+        's5_p2': 'The chunk owner will see the proposal and can <b>accept</b> (text is replaced) or <b>reject</b> it (proposal is removed).',
+
+        's6_title': 'Discussions',
+        's6_p1': 'Each chunk has a <b>Discussion</b> section where collaborators can leave comments and discuss the content without modifying the main text.',
+        's6_items': [
+            'Click the "Discussion" tab in the editor',
+            'Write your comment in the field below',
+            'Messages show author and date',
+            'Useful for feedback, questions, or coordination',
+        ],
+
+        's7_title': 'Project Chat',
+        's7_p1': 'In the top bar, the <b>chat</b> button (speech bubble icon) opens the general project chat. Here you can communicate with all collaborators in real time, regardless of which chunk you\'re working on.',
+
+        's8_title': 'Synchronization',
+        's8_p1': 'Changes are automatically synchronized with the server. In the top bar you\'ll see a status indicator:',
+        's8_items': [
+            '<b>Synchronized</b> - All changes have been saved',
+            '<b>Syncing...</b> - Synchronization in progress',
+            '<b>Error</b> - Connection problem (retry or check network)',
+        ],
+
+        's9_title': 'Managing Collaborators',
+        's9_p1': 'If you\'re the project Owner, you can manage collaborators:',
+        's9_items': [
+            'Click the collaborators icon in the top bar',
+            'To add: enter username and select role',
+            'To remove: click the X next to the name',
+            'To change role: use the dropdown next to the name',
+        ],
+        's9_note': '<i>Only the project Owner can add or remove collaborators.</i>',
+    },
+
+    # =========================================================================
+    # APPENDIX
+    # =========================================================================
+    'appendix': {
+        'title': 'Appendix: Quick Reference',
+
+        's1_title': 'Base Syntax',
+        's1_table': [
+            ['Element', 'Syntax'],
+            ['Chunk', '[C:id"Title"]'],
+            ['Aspect reference', '[@id]'],
+            ['TODO', '[!TODO:text:priority:comment]'],
+            ['NOTE', '[!NOTE:text:priority:comment]'],
+            ['FIX', '[!FIX:text:priority:comment]'],
+            ['Arabic number', '[:ORD]'],
+            ['Uppercase Roman', '[:ORD-ROM]'],
+            ['Lowercase Roman', '[:ORD-rom]'],
+            ['Uppercase letter', '[:ORD-ALPHA]'],
+            ['Lowercase letter', '[:ORD-alpha]'],
+        ],
+
+        's1b_title': 'v2.0 Syntax',
+        's1b_table': [
+            ['Element', 'Syntax'],
+            ['Chunk owner', '[#owner:username]'],
+            ['Aspect priority', '[#priority:N]'],
+            ['Proposal', '[!PROPOSAL:original:proposed]'],
+            ['Discussion', '[!DISCUSSION:base64]'],
+        ],
+
+        's2_title': 'Reserved IDs',
+        's2_table': [
+            ['ID', 'Type'],
+            ['personaggi', 'Characters container'],
+            ['luoghi', 'Places container'],
+            ['temi', 'Themes container'],
+            ['sequenze', 'Sequences container'],
+            ['timeline', 'Timeline container'],
+        ],
+
+        's3_title': 'Map Colors',
+        's3_table': [
+            ['Type', 'Color', 'Hex'],
+            ['Structure', 'Blue', '#4a90c2'],
+            ['Characters', 'Red', '#c44a4a'],
+            ['Places', 'Green', '#4a9a6a'],
+            ['Themes', 'Orange', '#b87333'],
+            ['Sequences', 'Purple', '#8a5ac2'],
+            ['Timeline', 'Blue', '#4a90c2'],
+        ],
+
+        's4_title': 'Technical Limits',
+        's4_items': [
+            'Undo history: 100 states',
+            'Roman numerals: 1-3999',
+            '.trmd projects are text files saved to disk. There is no practical size limit: a complete novel with all aspects typically takes less than 1 MB.',
+        ],
+
+        'footer': 'Tramando - Weave your story',
+    },
+}
@@ -0,0 +1,915 @@
+"""
+Contenuti italiani del Manuale Utente di Tramando.
+
+Caricati da genera_manuale.py solo quando si genera la versione italiana.
+"""
+
+CONTENUTI = {
+    'filename': 'Tramando_Manuale_Italiano.pdf',
+    'tagline': 'Tessi la tua storia',
+    'manual_title': 'Manuale Utente',
+    'version': 'Versione 2.0',
+    'toc_title': 'Indice',
+
+    'chapters': [
+        '1. Introduzione',
+        '2. Modalita di utilizzo',
+        '3. Primi passi',
+        '4. Cos\'e il markup',
+        '5. L\'interfaccia',
+        '6. La Struttura narrativa',
+        '7. Gli Aspetti',
+        '8. I collegamenti',
+        '9. Le annotazioni',
+        '10. Cerca e sostituisci',
+        '11. La mappa radiale',
+        '12. Export PDF, Word e Markdown',
+        '13. Impostazioni',
+        '14. Il formato file .trmd',
+        '15. Scorciatoie da tastiera',
+        '16. Assistente AI (opzionale)',
+        '17. Modalita collaborativa',
+        'Appendice: Riferimento rapido',
+    ],
+
+    'captions': {
+        'splash_tauri': 'La schermata di benvenuto (versione desktop)',
+        'splash_webapp': 'La schermata di benvenuto (versione webapp con login)',
+        'main': 'L\'interfaccia principale di Tramando',
+        'filter': 'Il filtro globale e la ricerca in azione',
+        'map': 'La mappa radiale con i collegamenti tra elementi',
+        'settings': 'Il pannello delle impostazioni',
+        'priority_sidebar': 'Il widget soglia priorita nella sidebar',
+        'priority_editor': 'Il campo priorita nell\'editor aspetto',
+    },
+
+    # =========================================================================
+    # CAPITOLO 1: INTRODUZIONE
+    # =========================================================================
+    'ch1': {
+        'title': '1. Introduzione',
+
+        's1_title': 'Cos\'e Tramando',
+        's1_p1': 'Tramando e uno strumento pensato per scrittori che devono gestire storie complesse. Se stai scrivendo un romanzo con decine di personaggi, una sceneggiatura con molteplici linee narrative, o stai costruendo un mondo immaginario con la sua storia e geografia, Tramando ti aiuta a tenere tutto sotto controllo.',
+        's1_p2': 'A differenza di un normale word processor, Tramando non si limita a farti scrivere testo. Ti permette di organizzare la tua storia in blocchi modulari chiamati "chunk", di definire personaggi, luoghi e temi come entita separate, e di collegarli tra loro per vedere come si intrecciano nella narrazione.',
+        's1_p3': 'Il risultato e una visione d\'insieme della tua opera che sarebbe impossibile ottenere con strumenti tradizionali: puoi vedere in quali scene appare un personaggio, tracciare lo sviluppo di un tema attraverso i capitoli, o verificare la coerenza della timeline.',
+
+        's2_title': 'L\'origine del nome',
+        's2_p1': 'Il nome "Tramando" nasce da un gioco di parole. Da un lato c\'e <b>trama</b>, perche scrivere e essenzialmente tessere fili narrativi, intrecciare storie e destini. Dall\'altro c\'e <b>tramando</b>, il gerundio che evoca il senso di progettare qualcosa, magari anche un crimine. Come diceva qualcuno, la differenza tra lo scrittore e l\'assassino e tenue: semplicemente il primo il progetto non lo mette in atto.',
+
+        's3_title': 'La filosofia: tutto e un chunk',
+        's3_p1': 'In Tramando, l\'unita base e il <b>chunk</b>: un blocco di testo con un titolo e un\'identita propria. Un capitolo e un chunk. Una scena e un chunk. Ma anche un personaggio e un chunk, un luogo e un chunk, persino una singola nota puo essere un chunk.',
+        's3_p2': 'I chunk possono contenere altri chunk, creando una struttura ad albero completamente flessibile. Non ci sono regole rigide su come organizzare il tuo lavoro: puoi avere Libro > Parte > Capitolo > Scena, oppure semplicemente una lista piatta di scene. Tramando si adatta al tuo modo di pensare e scrivere, non il contrario.',
+
+        's4_title': 'Per chi e Tramando',
+        's4_items': [
+            '<b>Romanzieri</b> che gestiscono cast numerosi e trame intrecciate, e hanno bisogno di tracciare chi appare dove e quando',
+            '<b>Sceneggiatori</b> che devono tenere sotto controllo scene, personaggi, e archi narrativi su piu episodi o atti',
+            '<b>Autori di serie</b> che devono mantenere coerenza tra volumi, ricordando dettagli stabiliti nei libri precedenti',
+            '<b>Worldbuilder</b> che costruiscono mondi complessi con la loro storia, geografia, e cast di personaggi',
+            'Chiunque scriva storie con <b>molti elementi interconnessi</b> e voglia uno strumento per visualizzarli e gestirli',
+        ],
+    },
+
+    # =========================================================================
+    # CAPITOLO 2: MODALITA DI UTILIZZO
+    # =========================================================================
+    'ch2_modes': {
+        'title': '2. Modalita di utilizzo',
+
+        'intro': 'Tramando e disponibile in tre diverse modalita, ognuna pensata per esigenze specifiche. Puoi scegliere quella piu adatta al tuo modo di lavorare.',
+
+        's1_title': 'Applicazione desktop (Tauri)',
+        's1_p1': 'La versione desktop e un\'applicazione nativa per <b>Mac</b>, <b>Windows</b> e <b>Linux</b>. Funziona completamente offline e salva i tuoi progetti come file .trmd sul tuo computer.',
+        's1_items': [
+            '<b>Funziona offline</b> - Non richiede connessione internet',
+            '<b>File locali</b> - I progetti sono salvati sul tuo disco come file .trmd',
+            '<b>Prestazioni native</b> - Interfaccia veloce e reattiva',
+            '<b>Integrazione sistema</b> - Supporto completo per scorciatoie, drag&drop, e gestione file',
+        ],
+        's1_note': 'Questa e la versione consigliata per la maggior parte degli utenti.',
+
+        's2_title': 'Webapp locale',
+        's2_p1': 'Puoi usare Tramando anche direttamente nel browser, aprendo la webapp su un server locale. Questa modalita e identica al desktop ma richiede un browser moderno.',
+        's2_items': [
+            '<b>Nessuna installazione</b> - Basta un browser web',
+            '<b>File locali</b> - Salvataggio su disco tramite API del browser',
+            '<b>Multipiattaforma</b> - Funziona su qualsiasi sistema con un browser moderno',
+        ],
+
+        's3_title': 'Webapp collaborativa',
+        's3_p1': 'La modalita collaborativa permette a piu persone di lavorare sullo stesso progetto. Richiede un server Tramando (self-hosted o in cloud).',
+        's3_items': [
+            '<b>Collaborazione in tempo reale</b> - Piu autori sullo stesso progetto',
+            '<b>Gestione ruoli</b> - Owner, Admin e Collaborator con permessi diversi',
+            '<b>Ownership chunk</b> - Ogni chunk ha un proprietario che puo essere trasferito',
+            '<b>Proposte e discussioni</b> - Sistema di proposte per suggerire modifiche',
+            '<b>Chat integrata</b> - Comunicazione tra collaboratori per ogni chunk',
+        ],
+        's3_note': 'Per i dettagli sulla modalita collaborativa, vedi il capitolo dedicato.',
+
+        's4_title': 'Differenze principali',
+        's4_table': [
+            ['Funzionalita', 'Desktop', 'Webapp locale', 'Collaborativa'],
+            ['Connessione', 'Offline', 'Offline', 'Richiesta'],
+            ['Salvataggio', 'File .trmd', 'File .trmd', 'Server'],
+            ['Versioni/Backup', 'Si', 'Si', 'No (server)'],
+            ['Collaborazione', 'No', 'No', 'Si'],
+            ['Ownership', 'No', 'No', 'Si'],
+            ['Chat', 'No', 'No', 'Si'],
+            ['Proposte', 'No', 'No', 'Si'],
+        ],
+
+        's5_title': 'Quale scegliere?',
+        's5_items': [
+            '<b>Scrivi da solo?</b> - Usa l\'applicazione desktop',
+            '<b>Non vuoi installare nulla?</b> - Usa la webapp locale',
+            '<b>Lavori in team?</b> - Usa la modalita collaborativa',
+        ],
+    },
+
+    # =========================================================================
+    # CAPITOLO 3: PRIMI PASSI
+    # =========================================================================
+    'ch3': {
+        'title': '3. Primi passi',
+
+        's1_title': 'Avviare Tramando',
+        's1_p1': 'Tramando e disponibile come applicazione desktop per Mac, Windows e Linux. Una volta installato e avviato, ti accogliera la schermata di benvenuto con tre opzioni chiare per iniziare:',
+        's1_items': [
+            '<b>Continua il lavoro in corso</b> - Riprende automaticamente l\'ultimo progetto su cui stavi lavorando, esattamente dove l\'avevi lasciato',
+            '<b>Nuovo progetto</b> - Crea un progetto completamente vuoto, pronto per accogliere la tua nuova storia',
+            '<b>Apri file...</b> - Ti permette di caricare un file .trmd esistente dal tuo computer',
+        ],
+
+        's2_title': 'Il primo progetto',
+        's2_p1': 'Quando crei un nuovo progetto, Tramando ti presenta un\'interfaccia pulita e intuitiva, divisa in due aree principali. A sinistra trovi la <b>sidebar</b>, che contiene la struttura del tuo progetto: qui vedrai crescere l\'albero dei tuoi capitoli, scene, e tutti gli elementi della storia.',
+        's2_p2': 'A destra c\'e l\'<b>editor</b>, lo spazio dove effettivamente scrivi e modifichi i contenuti. L\'editor include funzionalita avanzate come syntax highlighting per il markup, numeri di riga, e la possibilita di passare rapidamente dalla modalita scrittura alla modalita lettura.',
+
+        's3_title': 'Salvare il lavoro',
+        's3_p1': 'Tramando salva automaticamente il tuo lavoro ogni pochi secondi. Puoi configurare l\'intervallo di autosalvataggio nelle impostazioni, scegliendo un valore tra 1 e 10 secondi. Questo significa che non perderai mai piu di qualche secondo di lavoro anche in caso di crash o chiusura accidentale.',
+        's3_p2': 'Oltre all\'autosalvataggio, puoi salvare manualmente su file cliccando il pulsante <b>Salva</b> nella barra superiore. Il file avra estensione <b>.trmd</b> e sara un file di testo leggibile, che potrai aprire anche con un normale editor di testo se necessario.',
+        's3_tip': '<i>Consiglio: anche se l\'autosalvataggio e attivo, e buona pratica salvare regolarmente su file. Cosi avrai sempre un backup esterno che potrai copiare su cloud o chiavetta USB.</i>',
+
+        's4_title': 'Versioni e backup',
+        's4_p1': 'Tramando include un sistema completo di gestione versioni. Accanto ai pulsanti Salva trovi un menu a tendina <b>Versione</b> con tre opzioni:',
+        's4_items': [
+            '<b>Salva versione</b> - Crea uno snapshot del tuo lavoro con data/ora e una descrizione opzionale. Utile prima di modifiche importanti o per segnare tappe significative.',
+            '<b>Lista versioni</b> - Mostra tutte le versioni salvate. Per ogni versione puoi: <b>Apri copia</b> (apre la versione come nuovo documento non salvato, senza toccare il file corrente) oppure <b>Ripristina</b> (sostituisce il file corrente con la versione selezionata, creando prima un backup automatico).',
+            '<b>Ripristina backup</b> - Recupera l\'ultimo backup automatico. Tramando crea un file .backup ogni volta che salvi, permettendoti di tornare allo stato precedente.',
+        ],
+        's4_p2': 'Quando il documento ha modifiche non salvate, appare un <b>pallino</b> accanto al nome del file nella barra superiore. Questo indicatore ti ricorda che ci sono cambiamenti da salvare.',
+        's4_note': '<i>Nota: le versioni vengono salvate nella cartella dati dell\'applicazione, non accanto al file originale. Questo garantisce compatibilita con cartelle cloud come iCloud.</i>',
+    },
+
+    # =========================================================================
+    # CAPITOLO 4: COS'E IL MARKUP
+    # =========================================================================
+    'ch4': {
+        'title': '4. Cos\'e il markup',
+
+        'intro': 'Se hai sempre usato programmi come Microsoft Word o Google Docs, potresti non aver mai sentito parlare di "markup". Niente paura: e un concetto semplice che, una volta capito, ti sembrera naturale e potente.',
+
+        's1_title': 'Formattazione visuale vs markup',
+        's1_p1': 'In Word, quando vuoi mettere una parola in grassetto, la selezioni con il mouse e clicchi sul pulsante B nella toolbar. Questo approccio si chiama <b>formattazione visuale</b> o WYSIWYG (What You See Is What You Get): quello che vedi sullo schermo e esattamente quello che ottieni.',
+        's1_p2': 'Con il <b>markup</b>, invece, inserisci dei simboli speciali direttamente nel testo. Questi simboli vengono poi interpretati e trasformati nella formattazione desiderata. Per esempio, invece di cliccare un pulsante per il grassetto, scrivi:',
+        's1_code': 'Questa parola e **importante**',
+        's1_result': 'E il risultato sara: Questa parola e <b>importante</b>',
+
+        's2_title': 'Perche usare il markup?',
+        's2_items': [
+            '<b>Velocita</b> - Non devi mai togliere le mani dalla tastiera per cercare pulsanti o menu. Scrivi e formatti in un flusso continuo',
+            '<b>Portabilita</b> - I file sono puro testo, leggibili su qualsiasi dispositivo e con qualsiasi programma',
+            '<b>Controllo</b> - Vedi sempre esattamente cosa c\'e nel documento, senza formattazioni nascoste o stili misteriosi',
+            '<b>Leggerezza</b> - File piccoli e veloci, nessun formato proprietario, nessun rischio di corruzione',
+        ],
+
+        's3_title': 'Markdown: lo standard',
+        's3_p1': 'Tramando usa <b>Markdown</b>, il linguaggio di markup piu diffuso al mondo. Lo trovi su GitHub, Reddit, Discord, Notion, e centinaia di altre piattaforme. Impararlo una volta ti servira ovunque.',
+        's3_table_title': 'Comandi Markdown base:',
+        's3_table': [
+            ['Cosa vuoi', 'Cosa scrivi', 'Risultato'],
+            ['Grassetto', '**testo**', 'testo in grassetto'],
+            ['Corsivo', '*testo*', 'testo in corsivo'],
+            ['Titolo', '# Titolo', 'Intestazione grande'],
+            ['Sottotitolo', '## Sottotitolo', 'Intestazione media'],
+            ['Elenco puntato', '- elemento', '* elemento'],
+            ['Elenco numerato', '1. elemento', '1. elemento'],
+        ],
+
+        's4_title': 'Il markup speciale di Tramando',
+        's4_p1': 'Oltre al Markdown standard, Tramando aggiunge una sua sintassi per funzionalita specifiche:',
+        's4_table': [
+            ['Funzione', 'Sintassi', 'Esempio'],
+            ['Riferimento aspetto', '[@id]', '[@elena]'],
+            ['Annotazione TODO', '[!TODO:testo:priorita:commento]', '[!TODO:riscrivere:1:troppo lungo]'],
+            ['Annotazione NOTE', '[!NOTE:testo::commento]', '[!NOTE:verificare data::]'],
+            ['Annotazione FIX', '[!FIX:testo:priorita:]', '[!FIX:errore nome:2:]'],
+            ['Numero arabo', '[:ORD]', '1, 2, 3...'],
+            ['Numero romano', '[:ORD-ROM]', 'I, II, III...'],
+        ],
+
+        's5_title': 'Non preoccuparti!',
+        's5_p1': 'Tramando evidenzia tutto il markup con colori diversi, rendendo facile distinguere i simboli speciali dal testo normale. Inoltre, il tab <b>Lettura</b> ti mostra sempre il risultato finale, senza alcun simbolo visibile.',
+        's5_tip': '<i>Dopo qualche giorno di utilizzo, scrivere **grassetto** o [@personaggio] ti verra naturale quanto cliccare un pulsante. E sarai molto piu veloce.</i>',
+    },
+
+    # =========================================================================
+    # CAPITOLO 5: L'INTERFACCIA
+    # =========================================================================
+    'ch5': {
+        'title': '5. L\'interfaccia',
+
+        's1_title': 'La barra superiore',
+        's1_p1': 'La barra in alto contiene tutti i comandi principali dell\'applicazione:',
+        's1_items': [
+            '<b>Logo Tramando</b> - Cliccandolo torni alla schermata di benvenuto',
+            '<b>Titolo progetto</b> - Mostra il nome del progetto corrente; cliccandolo puoi modificare i metadati (titolo, autore, anno...)',
+            '<b>Carica</b> - Apre un file .trmd dal tuo computer',
+            '<b>Salva</b> - Scarica il progetto corrente come file .trmd',
+            '<b>Versione</b> - Menu per salvare versioni, vedere la lista versioni, o ripristinare un backup',
+            '<b>Esporta</b> - Menu a tendina per esportare in PDF, Markdown o Word (.docx)',
+            '<b>Badge Annotazioni</b> - Mostra il numero totale di annotazioni; cliccandolo apri il pannello annotazioni',
+            '<b>Toggle Mappa/Editor</b> - Alterna tra la vista mappa radiale e l\'editor di testo',
+            '<b>Ingranaggio</b> - Apre il pannello delle impostazioni',
+        ],
+
+        's2_title': 'La sidebar',
+        's2_p1': 'Il pannello laterale sinistro e il centro di navigazione del tuo progetto:',
+        's2_sub1': 'Campo filtro',
+        's2_sub1_p': 'In cima alla sidebar trovi un campo di ricerca che filtra l\'intero progetto. Digitando, vedrai solo gli elementi che contengono il testo cercato, sia nel titolo che nel contenuto.',
+        's2_sub2': 'STRUTTURA',
+        's2_sub2_p': 'Questa sezione contiene la tua narrativa vera e propria: capitoli, scene, parti. E organizzata come un albero espandibile. Il numero tra parentesi indica quanti elementi contiene.',
+        's2_sub3': 'ASPETTI',
+        's2_sub3_p': 'Qui trovi i cinque tipi di elementi trasversali, ognuno con la sua icona distintiva: <b>Personaggi</b> (👤), <b>Luoghi</b> (📍), <b>Temi</b> (💡), <b>Sequenze</b> (🔗), <b>Timeline</b> (📅). Per ogni categoria puoi impostare una soglia di priorita con i pulsanti −/+.',
+
+        's3_title': 'L\'editor',
+        's3_p1': 'L\'area principale a destra e dove avviene la scrittura. Include tre tab (quattro per gli aspetti):',
+        's3_items': [
+            '<b>Modifica</b> - L\'editor vero e proprio, con syntax highlighting per il markup',
+            '<b>Usato da</b> - Solo per gli aspetti: mostra le scene che usano questo elemento',
+            '<b>Lettura</b> - Anteprima pulita del testo, senza markup visibile',
+        ],
+        's3_p2': 'Sopra l\'editor trovi: il campo per modificare il titolo, i tag degli aspetti collegati, e il pulsante "+ Aspetto" per aggiungere collegamenti. Il menu contestuale (⋮) permette di spostare l\'elemento, creare figli, modificare l\'ID e altre azioni.',
+    },
+
+    # =========================================================================
+    # CAPITOLO 6: LA STRUTTURA NARRATIVA
+    # =========================================================================
+    'ch6': {
+        'title': '6. La Struttura narrativa',
+
+        's1_title': 'Organizzazione ad albero',
+        's1_p1': 'La sezione STRUTTURA nella sidebar contiene il testo della tua storia, organizzato come un albero gerarchico. Ogni elemento puo contenere altri elementi, permettendoti di creare la struttura che preferisci.',
+        's1_p2': 'Una struttura tipica potrebbe essere: <b>Libro</b> > <b>Parte</b> > <b>Capitolo</b> > <b>Scena</b>. Ma non ci sono regole fisse: potresti avere solo capitoli, oppure scene senza capitoli, oppure una struttura completamente diversa. Tramando si adatta a te.',
+
+        's2_title': 'Creare nuovi elementi',
+        's2_items': [
+            'Clicca <b>"+ Nuovo Chunk"</b> nella sidebar per creare un elemento al livello root',
+            'Per creare un elemento annidato, seleziona un chunk e usa il menu (⋮) > <b>"+ Figlio"</b>',
+            'Ogni chunk riceve automaticamente un ID unico (es. cap-1, scene-2)',
+            'Puoi modificare l\'ID dal menu (⋮) > <b>"Modifica ID"</b> per renderlo piu significativo (es. "prologo", "climax")',
+        ],
+
+        's3_title': 'Numerazione automatica',
+        's3_p1': 'Tramando supporta macro speciali nel titolo che vengono sostituite con numeri automatici, basati sulla posizione dell\'elemento tra i suoi fratelli.',
+        's3_table': [
+            ['Macro', 'Risultato', 'Esempio'],
+            ['[:ORD]', 'Numeri arabi', '1, 2, 3, 4...'],
+            ['[:ORD-ROM]', 'Romani maiuscoli', 'I, II, III, IV...'],
+            ['[:ORD-rom]', 'Romani minuscoli', 'i, ii, iii, iv...'],
+            ['[:ORD-ALPHA]', 'Lettere maiuscole', 'A, B, C, D...'],
+            ['[:ORD-alpha]', 'Lettere minuscole', 'a, b, c, d...'],
+        ],
+        's3_example': 'Se scrivi "Capitolo [:ORD]: Il risveglio" come titolo del primo capitolo, apparira come "Capitolo 1: Il risveglio". Il secondo capitolo con "Capitolo [:ORD]: La partenza" diventera "Capitolo 2: La partenza", e cosi via.',
+    },
+
+    # =========================================================================
+    # CAPITOLO 7: GLI ASPETTI
+    # =========================================================================
+    'ch7': {
+        'title': '7. Gli Aspetti',
+
+        'intro': 'Gli aspetti sono elementi che attraversano la storia in modo trasversale. Non fanno parte della sequenza narrativa lineare, ma si collegano ad essa in vari punti. Tramando definisce cinque tipi di aspetti, ognuno con un colore distintivo.',
+
+        's1_title': 'Personaggi',
+        's1_color': 'Colore: rosso (#c44a4a)',
+        's1_p1': 'I personaggi sono le entita che abitano il tuo mondo narrativo. Ogni personaggio puo avere una scheda con la sua descrizione, e puoi creare sotto-elementi per organizzare le informazioni: aspetto fisico, background, arco narrativo, relazioni con altri personaggi.',
+        's1_p2': 'Collegando un personaggio alle scene in cui appare, potrai sempre sapere dove e quando interviene nella storia, facilitando il controllo della coerenza.',
+
+        's2_title': 'Luoghi',
+        's2_color': 'Colore: verde (#4a9a6a)',
+        's2_p1': 'I luoghi sono gli spazi dove accadono le cose. Puoi organizzarli gerarchicamente: un Paese contiene Citta, che contengono Quartieri, che contengono Edifici, che contengono Stanze.',
+        's2_p2': 'Ogni luogo puo avere la sua descrizione dettagliata, e collegandolo alle scene saprai sempre dove si svolge ogni momento della storia.',
+
+        's3_title': 'Temi',
+        's3_color': 'Colore: arancione (#b87333)',
+        's3_p1': 'I temi sono le idee e i motivi ricorrenti della tua storia: vendetta, redenzione, amore, tradimento, crescita personale. Definendoli come aspetti e collegandoli alle scene pertinenti, puoi tracciare come ogni tema si sviluppa attraverso la narrazione.',
+        's3_p2': 'Questo e particolarmente utile in fase di revisione, quando vuoi assicurarti che un tema sia stato sviluppato adeguatamente o che non sia stato abbandonato a meta storia.',
+
+        's4_title': 'Sequenze',
+        's4_color': 'Colore: viola (#8a5ac2)',
+        's4_p1': 'Le sequenze sono catene di causa-effetto che attraversano la storia. A differenza della struttura narrativa (che segue l\'ordine di lettura), le sequenze seguono la logica interna degli eventi.',
+        's4_p2': 'Per esempio, una sequenza "Vendetta di Marco" potrebbe avere come figli: "Scoperta del tradimento" > "Pianificazione" > "Primo tentativo fallito" > "Successo" > "Conseguenze". Questi passi potrebbero essere sparsi in capitoli diversi, ma la sequenza li tiene collegati.',
+
+        's5_title': 'Timeline',
+        's5_color': 'Colore: blu (#4a90c2)',
+        's5_p1': 'La timeline contiene eventi in ordine cronologico reale, indipendentemente da come appaiono nella narrazione. E particolarmente utile quando la tua storia non e lineare: flashback, flashforward, o narrazioni parallele.',
+        's5_p2': 'Puoi usare date o timestamp nei titoli degli eventi (es. "2024-03-15 08:00 - Risveglio") per mantenere l\'ordine corretto.',
+        's5_tip': '<i>Consiglio: usa il formato data ISO (AAAA-MM-GG) nei titoli della timeline per un ordinamento alfabetico che corrisponda all\'ordine cronologico.</i>',
+
+        's6_title': 'Creare aspetti',
+        's6_p1': 'Per creare un nuovo aspetto, clicca il pulsante <b>"+ Nuovo aspetto"</b> nella sidebar, sotto la categoria desiderata. Ogni aspetto avra il suo ID univoco e potrai dargli un titolo descrittivo.',
+
+        's7_title': 'Priorita degli aspetti',
+        's7_p1': 'Ogni aspetto puo avere una <b>priorita</b> da 0 (bassa) a 10 (alta). Questo ti permette di distinguere tra elementi principali e secondari della tua storia.',
+        's7_items': [
+            'Nell\'editor di un aspetto, trovi il campo <b>Priorita</b> con un valore numerico',
+            'Aspetti con priorita piu alta appaiono per primi nella sidebar',
+            'Puoi usare la soglia per nascondere aspetti minori',
+        ],
+
+        's8_title': 'Filtro soglia',
+        's8_p1': 'In ogni categoria di aspetti (Personaggi, Luoghi, ecc.) trovi un widget <b>soglia</b> con i pulsanti −0+. Questo imposta il livello minimo di priorita visibile:',
+        's8_items': [
+            'Se la soglia e <b>0</b>, tutti gli aspetti sono visibili',
+            'Se la soglia e <b>3</b>, solo aspetti con priorita >= 3 sono visibili',
+            'Gli aspetti filtrati non compaiono nella sidebar ne nella mappa radiale',
+            'I tag degli aspetti filtrati appaiono sbiaditi nell\'editor',
+        ],
+        's8_tip': '<i>Consiglio: usa le priorita per concentrarti sui personaggi principali durante la scrittura, poi abbassa la soglia durante la revisione per verificare che anche i secondari siano coerenti.</i>',
+    },
+
+    # =========================================================================
+    # CAPITOLO 8: I COLLEGAMENTI
+    # =========================================================================
+    'ch8': {
+        'title': '8. I collegamenti',
+
+        'intro': 'La vera potenza di Tramando sta nei collegamenti tra la struttura narrativa e gli aspetti. Collegando scene a personaggi, luoghi e temi, crei una rete di relazioni che ti permette di navigare e analizzare la tua storia in modi impossibili con strumenti tradizionali.',
+
+        's1_title': 'Sintassi [@id]',
+        's1_p1': 'Il modo piu diretto per creare un collegamento e scrivere <b>[@id]</b> nel testo della scena, dove "id" e l\'identificatore dell\'aspetto che vuoi collegare.',
+        's1_p2': 'Per esempio, se hai un personaggio con ID "elena", scrivendo [@elena] in una scena crei automaticamente un collegamento. Questo metodo e particolarmente utile quando vuoi segnare il punto esatto in cui un elemento appare nel testo.',
+
+        's2_title': 'Metodo tag',
+        's2_p1': 'Un\'alternativa e usare i tag visivi sopra l\'editor:',
+        's2_items': [
+            'Seleziona la scena che vuoi collegare',
+            'Clicca sul pulsante <b>"+ Aspetto"</b> sopra l\'editor',
+            'Scegli l\'aspetto dal menu che appare',
+            'Il tag apparira sotto il titolo della scena',
+        ],
+        's2_p2': 'Per rimuovere un collegamento, clicca sulla <b>x</b> accanto al tag.',
+
+        's3_title': 'Tab "Usato da"',
+        's3_p1': 'Quando selezioni un aspetto (personaggio, luogo, tema...), il tab "Usato da" ti mostra tutte le scene che lo referenziano. E un modo veloce per rispondere alla domanda: "Dove appare questo elemento nella storia?"',
+
+        's4_title': 'Conteggio nella sidebar',
+        's4_p1': 'Nella sidebar, accanto a ogni aspetto, vedi un numero tra parentesi (es. "Elena (6)"). Questo indica in quante scene l\'elemento e collegato, dandoti subito un\'idea della sua importanza nella storia.',
+
+        's5_title': 'Best practices',
+        's5_items': [
+            'Usa ID brevi e significativi: "elena" e meglio di "personaggio-001"',
+            'Crea i collegamenti mentre scrivi, non dopo - e piu facile e mantiene la consistenza',
+            'Non esagerare: collega solo gli aspetti veramente rilevanti per ogni scena',
+            'Usa i tag per aspetti ricorrenti, [@id] nel testo per riferimenti specifici',
+        ],
+    },
+
+    # =========================================================================
+    # CAPITOLO 9: LE ANNOTAZIONI
+    # =========================================================================
+    'ch9': {
+        'title': '9. Le annotazioni',
+
+        'intro': 'Le annotazioni sono note che lasci per te stesso durante la scrittura. Sono visibili in Tramando ma non appariranno mai nel prodotto finale esportato. Sono il tuo spazio per appunti, promemoria e segnalazioni.',
+
+        's1_title': 'Tipi di annotazione',
+        's1_items': [
+            '<b>TODO</b> - Cose da fare: "aggiungere descrizione del luogo", "sviluppare il dialogo", "ricercare dettagli storici"',
+            '<b>NOTE</b> - Appunti e riflessioni: "verificare questa data", "idea per il sequel", "forse troppo lungo"',
+            '<b>FIX</b> - Problemi da correggere: "incongruenza con capitolo 3", "errore nel nome", "timeline non torna"',
+        ],
+
+        's2_title': 'Creare annotazioni',
+        's2_p1': 'Ci sono due modi per creare un\'annotazione:',
+        's2_items': [
+            'Seleziona il testo da annotare, clicca destro, e scegli il tipo di annotazione dal menu',
+            'Scrivi direttamente la sintassi nel testo',
+        ],
+
+        's3_title': 'La sintassi',
+        's3_p1': 'Il formato delle annotazioni e:',
+        's3_code': '[!TIPO:testo:priorita:commento]',
+        's3_examples_title': 'Esempi:',
+        's3_examples': [
+            '[!TODO:riscrivere questo dialogo:1:troppo formale]',
+            '[!NOTE:verificare data storica::controllare enciclopedia]',
+            '[!FIX:Marco qui si chiama Luca:3:]',
+        ],
+
+        's4_title': 'Pannello Annotazioni',
+        's4_p1': 'Nella sidebar, la sezione ANNOTAZIONI raccoglie tutte le annotazioni del progetto, raggruppate per tipo (TODO, FIX, NOTE). Cliccando su un\'annotazione, salti direttamente al punto del testo dove si trova.',
+        's4_p2': 'Il badge nella barra superiore mostra il numero totale di annotazioni, dandoti sempre visibilita su quanto lavoro di revisione ti aspetta.',
+
+        's5_note': '<b>Importante:</b> le annotazioni NON appaiono nell\'export PDF. Sono esclusivamente per l\'autore durante il processo di scrittura.',
+    },
+
+    # =========================================================================
+    # CAPITOLO 10: CERCA E SOSTITUISCI
+    # =========================================================================
+    'ch10': {
+        'title': '10. Cerca e sostituisci',
+
+        'intro': 'Tramando offre strumenti di ricerca potenti per navigare anche i progetti piu grandi. Ci sono due livelli di ricerca: globale (su tutto il progetto) e locale (sul chunk corrente).',
+
+        's1_title': 'Filtro globale',
+        's1_p1': 'Il campo di ricerca in cima alla sidebar filtra l\'intero progetto. Mentre digiti, la sidebar mostra solo gli elementi che contengono il testo cercato, sia nel titolo che nel contenuto.',
+        's1_features': [
+            '<b>[Aa]</b> - Toggle per ricerca case-sensitive (distingue maiuscole/minuscole)',
+            '<b>[.*]</b> - Toggle per attivare le espressioni regolari',
+            'I risultati appaiono come lista piatta con il percorso completo',
+            'Cliccando un risultato, si apre nell\'editor con i match evidenziati',
+        ],
+
+        's2_title': 'Ricerca locale',
+        's2_p1': 'Premi <b>Ctrl+F</b> (o <b>Cmd+F</b> su Mac) per aprire la barra di ricerca sopra l\'editor. Questa cerca solo nel chunk corrente.',
+        's2_features': [
+            'Tutti i match sono evidenziati in giallo',
+            'Il match corrente e evidenziato in arancione piu intenso',
+            'Le frecce <b>&lt;</b> e <b>&gt;</b> navigano tra i match',
+            'I tasti <b>freccia su/giu</b> funzionano come alternativa',
+            'Il contatore (es. "3/12") mostra la posizione corrente sul totale',
+        ],
+
+        's3_title': 'Sostituisci',
+        's3_p1': 'Premi <b>Ctrl+H</b> (o <b>Cmd+H</b> su Mac) per aprire la barra di sostituzione. Appare un secondo campo per il testo di sostituzione.',
+        's3_features': [
+            '<b>Sostituisci</b> - Cambia il match corrente e passa al successivo',
+            '<b>Sostituisci tutti</b> - Cambia tutte le occorrenze in una volta',
+            'Un messaggio conferma quante sostituzioni sono state effettuate',
+            '<b>Ctrl+Z</b> annulla le sostituzioni',
+        ],
+
+        's4_title': 'Espressioni regolari',
+        's4_p1': 'Attivando il toggle [.*] puoi usare espressioni regolari per ricerche avanzate:',
+        's4_examples': [
+            '<b>\\bparola\\b</b> - Trova "parola" come parola intera, non come parte di altre parole',
+            '<b>cap[ií]tolo</b> - Trova sia "capitolo" che "capítolo"',
+            '<b>\\d{4}</b> - Trova sequenze di 4 cifre (utile per cercare anni)',
+            '<b>^inizio</b> - Trova "inizio" solo a inizio riga',
+        ],
+    },
+
+    # =========================================================================
+    # CAPITOLO 11: LA MAPPA RADIALE
+    # =========================================================================
+    'ch11': {
+        'title': '11. La mappa radiale',
+
+        'intro': 'La mappa radiale e una visualizzazione grafica della tua storia. Ti permette di "vedere" la trama nel suo insieme, con tutti i collegamenti tra struttura e aspetti rappresentati visivamente.',
+
+        's1_title': 'Leggere la mappa',
+        's1_items': [
+            '<b>Centro</b> - Il titolo del progetto',
+            '<b>Anello interno (grigio)</b> - La struttura narrativa: capitoli e scene',
+            '<b>Anelli esterni</b> - Gli aspetti, ognuno con il suo colore',
+            '<b>Linee</b> - I collegamenti tra scene e aspetti',
+        ],
+
+        's2_title': 'Interazione',
+        's2_items': [
+            '<b>Scroll</b> - Zoom in e out',
+            '<b>Click</b> - Seleziona un elemento',
+            '<b>Hover</b> - Mostra dettagli nel pannello informativo',
+            '<b>Drag</b> - Sposta la vista quando sei in zoom',
+        ],
+
+        's3_title': 'Pannello informativo',
+        's3_p1': 'In basso a sinistra della mappa trovi il pannello informativo, diviso in due sezioni:',
+        's3_items': [
+            '<b>HOVER</b> - Mostra informazioni sull\'elemento sotto il cursore',
+            '<b>SELEZIONE</b> - Mostra informazioni sull\'elemento selezionato con click',
+        ],
+        's3_p2': 'Per ogni elemento vedi: nome, tipo, ID, e numero di collegamenti.',
+
+        's4_title': 'A cosa serve',
+        's4_p1': 'La mappa radiale e utile per:',
+        's4_items': [
+            'Vedere la distribuzione dei personaggi nella storia',
+            'Identificare scene sovraccariche (troppe linee = troppi elementi)',
+            'Scoprire elementi isolati (aspetti definiti ma mai usati)',
+            'Capire le relazioni tra elementi diversi',
+            'Avere una visione d\'insieme per decisioni strutturali',
+        ],
+    },
+
+    # =========================================================================
+    # CAPITOLO 12: EXPORT PDF, WORD E MARKDOWN
+    # =========================================================================
+    'ch12': {
+        'title': '12. Export PDF, Word e Markdown',
+
+        's1_title': 'Come esportare',
+        's1_items': [
+            'Clicca su <b>"Esporta"</b> nella barra superiore',
+            'Scegli il formato desiderato: <b>PDF</b>, <b>Word (.docx)</b> o <b>Markdown</b>',
+            'Il file viene generato e scaricato automaticamente',
+        ],
+
+        's2_title': 'Cosa viene incluso',
+        's2_items': [
+            'Pagina titolo con titolo e autore (presi dai metadati del progetto)',
+            'Capitoli con titolo in testa e interruzione di pagina',
+            'Scene separate da <b>***</b> centrato',
+            'Formattazione Markdown: grassetto, corsivo, intestazioni, liste',
+        ],
+
+        's3_title': 'Cosa viene escluso',
+        's3_items': [
+            'Frontmatter YAML (metadati tecnici)',
+            'Riferimenti [@id] agli aspetti',
+            'ID e metadati dei chunk',
+            'Annotazioni (TODO, NOTE, FIX)',
+            'Container degli aspetti e il loro contenuto',
+        ],
+
+        's4_note': '<b>In pratica:</b> l\'export contiene solo la narrativa pulita, pronta per la lettura o la stampa. Tutto il "dietro le quinte" rimane nascosto.',
+
+        's5_title': 'Formato PDF - specifiche tecniche',
+        's5_table': [
+            ['Proprieta', 'Valore'],
+            ['Formato pagina', 'A5'],
+            ['Margini', '60pt sopra, 70pt sotto, 50pt lati'],
+            ['Font', 'Roboto'],
+            ['Titolo capitolo', '18pt bold'],
+            ['Corpo testo', '11pt, giustificato'],
+            ['Interlinea', '1.4'],
+            ['Numeri pagina', 'Centrati in basso'],
+        ],
+
+        's6_title': 'Export Word (.docx)',
+        's6_p1': 'L\'export Word genera un documento .docx compatibile con Microsoft Word, LibreOffice e Google Docs. Mantiene la formattazione base (grassetto, corsivo, titoli) ed e ideale per la revisione con editor o agenti letterari.',
+
+        's7_title': 'Export Markdown',
+        's7_p1': 'L\'export Markdown genera un file .md in testo semplice. Utile per importare il testo in altri programmi (Scrivener, Obsidian, etc.) o per avere un backup testuale leggibile.',
+    },
+
+    # =========================================================================
+    # CAPITOLO 13: IMPOSTAZIONI
+    # =========================================================================
+    'ch13': {
+        'title': '13. Impostazioni',
+
+        's1_title': 'Temi',
+        's1_p1': 'Tramando include quattro temi predefiniti:',
+        's1_table': [
+            ['Tema', 'Descrizione'],
+            ['Tessuto', 'Beige caldo con texture di carta (default)'],
+            ['Dark', 'Tema scuro con accenti rosa, per scrittura notturna'],
+            ['Light', 'Tema chiaro e minimale'],
+            ['Sepia', 'Toni vintage e caldi, simula carta invecchiata'],
+        ],
+
+        's2_title': 'Autosalvataggio',
+        's2_p1': 'Uno slider ti permette di impostare l\'intervallo di autosalvataggio da 1 a 10 secondi. Il valore predefinito e 3 secondi. L\'autosalvataggio avviene dopo N secondi dall\'ultima modifica.',
+
+        's3_title': 'Lingua',
+        's3_p1': 'Tramando e disponibile in Italiano e Inglese. Il cambio lingua modifica solo l\'interfaccia; il contenuto dei tuoi progetti non viene alterato.',
+
+        's4_title': 'Import/Export impostazioni',
+        's4_p1': 'Puoi esportare le tue impostazioni in un file .edn e reimportarle su un altro dispositivo. Utile per mantenere lo stesso tema e configurazione su piu computer.',
+
+        's5_title': 'Tutorial',
+        's5_p1': 'Il pulsante "Rivedi tutorial" riapre la guida interattiva che hai visto al primo avvio. Utile se vuoi rinfrescare la memoria sulle funzionalita.',
+    },
+
+    # =========================================================================
+    # CAPITOLO 14: IL FORMATO FILE .TRMD
+    # =========================================================================
+    'ch14': {
+        'title': '14. Il formato file .trmd',
+
+        'intro': 'I file .trmd sono file di testo puro, leggibili con qualsiasi editor. Questo garantisce che i tuoi dati siano sempre accessibili, anche senza Tramando.',
+
+        's1_title': 'Struttura generale',
+        's1_items': [
+            '<b>Frontmatter YAML</b> - Metadati del progetto, racchiusi tra ---',
+            '<b>Contenuto</b> - I chunk con la loro gerarchia',
+        ],
+
+        's2_title': 'Frontmatter',
+        's2_p1': 'Il frontmatter contiene i metadati del progetto:',
+        's2_code': '''---
+title: "Il mio romanzo"
+author: "Nome Autore"
+language: "it"
+year: 2024
+isbn: ""
+publisher: ""
+custom:
+  genere: "Thriller"
+---''',
+
+        's3_title': 'Sintassi chunk',
+        's3_code': '''[C:id"Titolo del chunk"][@aspetto1][@aspetto2]
+Contenuto del chunk qui...
+
+  [C:figlio"Titolo figlio"]
+  Contenuto figlio indentato con 2 spazi''',
+        's3_items': [
+            '<b>[C:id"titolo"]</b> definisce un chunk con il suo ID e titolo',
+            '<b>[@id]</b> crea un collegamento a un aspetto',
+            '<b>2 spazi</b> di indentazione = 1 livello di nidificazione',
+        ],
+
+        's4_title': 'ID riservati',
+        's4_p1': 'Alcuni ID sono riservati per i container degli aspetti:',
+        's4_items': ['personaggi', 'luoghi', 'temi', 'sequenze', 'timeline'],
+        's4_note': 'Questi ID non possono essere usati per altri elementi.',
+
+        's5_title': 'Annotazioni nel file',
+        's5_code': 'Testo con [!TODO:da completare:1:urgente] annotazione.',
+
+        's6_title': 'Metadati estesi (v2.0)',
+        's6_p1': 'A partire dalla versione 2.0, i chunk possono avere metadati aggiuntivi:',
+        's6_table': [
+            ['Sintassi', 'Significato'],
+            ['[#owner:username]', 'Proprietario del chunk (modalita collaborativa)'],
+            ['[#priority:N]', 'Priorita dell\'aspetto (0-10)'],
+            ['[!DISCUSSION:base64]', 'Discussioni codificate in base64'],
+            ['[!PROPOSAL:testo_originale:testo_proposto]', 'Proposta di modifica inline'],
+        ],
+        's6_note': '<i>Questi metadati sono usati internamente e di solito non serve modificarli a mano.</i>',
+    },
+
+    # =========================================================================
+    # CAPITOLO 15: SCORCIATOIE DA TASTIERA
+    # =========================================================================
+    'ch15': {
+        'title': '15. Scorciatoie da tastiera',
+
+        's1_table': [
+            ['Scorciatoia', 'Azione'],
+            ['Ctrl/Cmd + Z', 'Annulla (Undo)'],
+            ['Ctrl/Cmd + Shift + Z', 'Ripristina (Redo)'],
+            ['Escape', 'Chiude modali e barra ricerca'],
+            ['Ctrl/Cmd + F', 'Apre ricerca nel chunk'],
+            ['Ctrl/Cmd + H', 'Apre cerca e sostituisci'],
+            ['Ctrl/Cmd + Shift + F', 'Focus su filtro globale'],
+            ['Freccia su/giu', 'Naviga risultati ricerca'],
+            ['F3 / Shift + F3', 'Prossimo/precedente risultato'],
+        ],
+
+        's2_note': '<i>Nota: Cmd e per macOS, Ctrl e per Windows/Linux.</i>',
+
+        's3_title': 'Cronologia Undo',
+        's3_p1': 'Tramando mantiene le ultime 100 modifiche nella cronologia di undo. Puoi annullare e ripristinare liberamente con le scorciatoie sopra indicate.',
+    },
+
+    # =========================================================================
+    # CAPITOLO 16: ASSISTENTE AI
+    # =========================================================================
+    'ch16': {
+        'title': '16. Assistente AI (opzionale)',
+
+        # Introduzione
+        's1_title': 'Introduzione',
+        's1_p1': 'L\'Assistente AI e una funzionalita completamente opzionale. Tramando funziona perfettamente senza, e molti scrittori preferiscono lavorare senza supporto AI. Se non ti interessa, puoi semplicemente ignorare questo capitolo.',
+        's1_p2': 'Se decidi di provarlo, sappi che l\'approccio di Tramando e non invasivo: l\'AI propone, tu decidi sempre. Nessuna modifica automatica al tuo testo. Ogni suggerimento passa attraverso la tua approvazione. Puoi disabilitarlo in qualsiasi momento.',
+        's1_items': [
+            'Superare blocchi creativi',
+            'Esplorare varianti di una frase',
+            'Generare bozze di schede personaggio',
+            'Verificare coerenza narrativa',
+        ],
+        's1_note': '<i>Ricorda: l\'AI e uno strumento, non un co-autore. La storia resta tua.</i>',
+
+        # Configurazione
+        's2_title': 'Configurazione',
+        's2_p1': 'Per abilitare l\'Assistente AI, vai in Impostazioni (icona ingranaggio) e trova la sezione "Assistente AI". Spunta "Abilita assistente AI" per attivare la funzionalita.',
+        's2_sub1': 'Scegliere un provider',
+        's2_table': [
+            ['Provider', 'Costo', 'Pro', 'Contro'],
+            ['Ollama', 'Gratuito', 'Locale, privato', 'Richiede installazione'],
+            ['Groq', 'Gratuito', 'Veloce, modelli buoni', 'Limiti di utilizzo'],
+            ['Anthropic', 'A pagamento', 'Modelli eccellenti', '~$3/milione token'],
+            ['OpenAI', 'A pagamento', 'Modelli eccellenti', '~$2.50/milione token'],
+        ],
+        's2_sub2': 'Ollama (gratuito, locale)',
+        's2_ollama': 'Ollama esegue modelli AI sul tuo computer. Nessun dato esce dalla tua macchina. Installa Ollama da ollama.ai, avvialo, seleziona "Ollama (locale)" in Tramando, e scarica un modello con: ollama pull llama3.2',
+        's2_sub3': 'Groq (gratuito, cloud)',
+        's2_groq': 'Groq offre API gratuite con modelli Llama veloci. Registrati su console.groq.com, crea una API Key, e incollala in Tramando selezionando "Groq (Llama, veloce)".',
+        's2_sub4': 'Anthropic e OpenAI (a pagamento)',
+        's2_paid': 'Per Anthropic (Claude) registrati su console.anthropic.com, per OpenAI su platform.openai.com. Aggiungi credito ($5 minimo), crea una API key e incollala in Tramando. Per un uso normale spenderai pochi centesimi al giorno.',
+
+        # Usare AI senza API
+        's3_title': 'Usare l\'AI senza API',
+        's3_p1': 'Se non vuoi configurare API, puoi usare Tramando con la chat di Claude (claude.ai) o ChatGPT (chat.openai.com) usando un workflow manuale.',
+        's3_items': [
+            '<b>Passo 1</b>: Seleziona testo, apri il pannello AI, scrivi la richiesta',
+            '<b>Passo 2</b>: Clicca "Copia per chat" - il prompt viene copiato negli appunti',
+            '<b>Passo 3</b>: Incolla nella chat esterna, aspetta la risposta, copiala',
+            '<b>Passo 4</b>: Torna in Tramando, clicca "Inietta risposta", incolla e conferma',
+        ],
+        's3_note': 'Tramando processera la risposta come se fosse arrivata via API.',
+
+        # Il pannello
+        's4_title': 'Il pannello Assistente AI',
+        's4_p1': 'Il pannello si apre con il pulsante AI nella barra superiore o la scorciatoia Ctrl+Shift+A (Cmd+Shift+A su Mac).',
+        's4_items': [
+            '<b>Area chat</b>: mostra la conversazione con l\'AI',
+            '<b>Campo input</b>: scrivi la tua richiesta',
+            '<b>Selettore contesto</b>: scegli quali informazioni inviare all\'AI',
+            '<b>Indicatore parole</b>: mostra la dimensione del contesto (verde/giallo/rosso)',
+        ],
+        's4_sub1': 'Il selettore contesto',
+        's4_context': 'L\'AI lavora meglio con contesto sulla tua storia. Preset rapidi: <b>Minimo</b> (solo chunk corrente), <b>Scena</b> (+ personaggi/luoghi collegati), <b>Narrativo</b> (+ sequenze/timeline), <b>Completo</b> (tutto). Puoi anche personalizzare le singole opzioni.',
+
+        # Azioni AI
+        's5_title': 'Azioni AI disponibili',
+        's5_p1': 'Seleziona del testo nell\'editor, fai click destro, e scegli "Assistente AI":',
+        's5_sub1': 'Azioni che propongono alternative',
+        's5_items1': [
+            '<b>Espandi/sviluppa</b>: arricchisce il testo con dettagli',
+            '<b>Riformula</b>: propone versioni alternative',
+            '<b>Rendi piu...</b>: cambia il tono (cupo, leggero, formale, colloquiale, poetico)',
+        ],
+        's5_sub2': 'Azioni che rispondono in chat',
+        's5_items2': [
+            '<b>Suggerisci conflitto</b>: propone tensioni narrative',
+            '<b>Analizza coerenza</b>: cerca incongruenze',
+        ],
+        's5_sub3': 'Azioni su aspetti',
+        's5_items3': [
+            '<b>Crea scheda personaggio/luogo</b>: genera una scheda dal testo',
+            '<b>Estrai info per...</b>: arricchisce una scheda esistente con nuove informazioni',
+        ],
+
+        # Annotazioni AI
+        's6_title': 'Le annotazioni AI',
+        's6_p1': 'Quando chiedi all\'AI di riformulare o espandere del testo, Tramando crea un\'annotazione speciale.',
+        's6_flow': [
+            'Selezioni testo e chiedi "Riformula"',
+            'Appare un\'annotazione [!NOTE:testo:AI:] nel testo',
+            'La richiesta viene inviata (o la copi per chat esterna)',
+            'Quando arriva la risposta, l\'annotazione diventa [!NOTE:testo:AI-DONE:...]',
+            'Le alternative proposte sono memorizzate nell\'annotazione',
+        ],
+        's6_sub1': 'Scegliere un\'alternativa',
+        's6_choose': 'Fai click destro sull\'annotazione. Appare un menu con le alternative (radio button). Seleziona quella che preferisci, poi "Applica selezione" per sostituire il testo, o "Annulla modifiche" per tornare all\'originale.',
+        's6_note': 'Puoi cambiare idea quante volte vuoi prima di confermare.',
+
+        # Consigli
+        's7_title': 'Consigli per risultati migliori',
+        's7_items': [
+            '<b>Contesto giusto</b>: Minimo per riformulare, Scena per sviluppare, Completo per coerenza',
+            '<b>Modello giusto</b>: modelli grandi (70B, Claude, GPT-4) per task complessi',
+            '<b>L\'AI come assistente</b>: usa l\'AI per esplorare possibilita, non per scrivere al posto tuo',
+            '<b>Prompt migliori</b>: sii specifico, dai contesto, chiedi alternative',
+        ],
+    },
+
+    # =========================================================================
+    # CAPITOLO 17: MODALITA COLLABORATIVA
+    # =========================================================================
+    'ch17': {
+        'title': '17. Modalita collaborativa',
+
+        'intro': 'La modalita collaborativa permette a piu autori di lavorare insieme sullo stesso progetto. Questa funzionalita richiede un server Tramando e un account utente.',
+
+        's1_title': 'Requisiti',
+        's1_items': [
+            'Un server Tramando attivo (self-hosted o in cloud)',
+            'Un account utente sul server',
+            'Connessione internet durante il lavoro',
+        ],
+
+        's2_title': 'Login e progetti',
+        's2_p1': 'Dalla schermata di benvenuto, nella sezione <b>Server</b>, inserisci le credenziali del tuo account. Dopo il login vedrai la lista dei progetti a cui hai accesso.',
+        's2_items': [
+            '<b>I tuoi progetti</b> - Progetti creati da te',
+            '<b>Progetti condivisi</b> - Progetti a cui sei stato invitato come collaboratore',
+        ],
+
+        's3_title': 'Ruoli e permessi',
+        's3_p1': 'In ogni progetto collaborativo ci sono tre ruoli:',
+        's3_table': [
+            ['Ruolo', 'Permessi'],
+            ['Owner', 'Controllo totale: modifica tutto, gestisce collaboratori, trasferisce ownership'],
+            ['Admin', 'Puo modificare tutto, ma non gestisce collaboratori'],
+            ['Collaborator', 'Puo modificare solo i chunk di cui e owner'],
+        ],
+
+        's4_title': 'Ownership dei chunk',
+        's4_p1': 'In modalita collaborativa, ogni chunk ha un <b>owner</b> (proprietario). Questo determina chi puo modificare il contenuto:',
+        's4_items': [
+            'Quando crei un nuovo chunk, ne diventi automaticamente l\'owner',
+            'Solo l\'owner, un Admin o l\'Owner del progetto possono modificare un chunk',
+            'L\'ownership puo essere trasferita ad un altro collaboratore',
+            'Nell\'editor, il campo "Owner" mostra chi possiede il chunk',
+        ],
+
+        's5_title': 'Proposte (PROPOSAL)',
+        's5_p1': 'Se non sei l\'owner di un chunk ma vuoi suggerire una modifica, puoi creare una <b>proposta</b>:',
+        's5_items': [
+            'Seleziona il testo che vuoi modificare',
+            'Usa il menu contestuale e scegli "Proponi modifica"',
+            'Scrivi il testo alternativo che suggerisci',
+            'La proposta apparira evidenziata nel testo',
+        ],
+        's5_p2': 'L\'owner del chunk vedra la proposta e potra <b>accettarla</b> (il testo viene sostituito) o <b>rifiutarla</b> (la proposta viene rimossa).',
+
+        's6_title': 'Discussioni',
+        's6_p1': 'Ogni chunk ha una sezione <b>Discussion</b> dove i collaboratori possono lasciare commenti e discutere del contenuto senza modificare il testo principale.',
+        's6_items': [
+            'Clicca sulla tab "Discussion" nell\'editor',
+            'Scrivi il tuo commento nel campo in basso',
+            'I messaggi mostrano l\'autore e la data',
+            'Utile per feedback, domande, o coordinamento',
+        ],
+
+        's7_title': 'Chat di progetto',
+        's7_p1': 'Nella barra superiore, il pulsante <b>chat</b> (icona fumetto) apre la chat generale del progetto. Qui puoi comunicare con tutti i collaboratori in tempo reale, indipendentemente dal chunk su cui stai lavorando.',
+
+        's8_title': 'Sincronizzazione',
+        's8_p1': 'Le modifiche vengono sincronizzate automaticamente con il server. Nella barra superiore vedrai un indicatore di stato:',
+        's8_items': [
+            '<b>Sincronizzato</b> - Tutte le modifiche sono state salvate',
+            '<b>In sync...</b> - Sincronizzazione in corso',
+            '<b>Errore</b> - Problema di connessione (riprova o controlla la rete)',
+        ],
+
+        's9_title': 'Gestire i collaboratori',
+        's9_p1': 'Se sei l\'Owner del progetto, puoi gestire i collaboratori:',
+        's9_items': [
+            'Clicca sull\'icona collaboratori nella barra superiore',
+            'Per aggiungere: inserisci username e seleziona il ruolo',
+            'Per rimuovere: clicca sulla X accanto al nome',
+            'Per cambiare ruolo: usa il dropdown accanto al nome',
+        ],
+        's9_note': '<i>Solo l\'Owner del progetto puo aggiungere o rimuovere collaboratori.</i>',
+    },
+
+    # =========================================================================
+    # APPENDICE
+    # =========================================================================
+    'appendix': {
+        'title': 'Appendice: Riferimento rapido',
+
+        's1_title': 'Sintassi base',
+        's1_table': [
+            ['Elemento', 'Sintassi'],
+            ['Chunk', '[C:id"Titolo"]'],
+            ['Riferimento aspetto', '[@id]'],
+            ['TODO', '[!TODO:testo:priorita:commento]'],
+            ['NOTE', '[!NOTE:testo:priorita:commento]'],
+            ['FIX', '[!FIX:testo:priorita:commento]'],
+            ['Numero arabo', '[:ORD]'],
+            ['Romano maiuscolo', '[:ORD-ROM]'],
+            ['Romano minuscolo', '[:ORD-rom]'],
+            ['Lettera maiuscola', '[:ORD-ALPHA]'],
+            ['Lettera minuscola', '[:ORD-alpha]'],
+        ],
+
+        's1b_title': 'Sintassi v2.0',
+        's1b_table': [
+            ['Elemento', 'Sintassi'],
+            ['Owner chunk', '[#owner:username]'],
+            ['Priorita aspetto', '[#priority:N]'],
+            ['Proposta', '[!PROPOSAL:originale:proposto]'],
+            ['Discussione', '[!DISCUSSION:base64]'],
+        ],
+
+        's2_title': 'ID riservati',
+        's2_table': [
+            ['ID', 'Tipo'],
+            ['personaggi', 'Container personaggi'],
+            ['luoghi', 'Container luoghi'],
+            ['temi', 'Container temi'],
+            ['sequenze', 'Container sequenze'],
+            ['timeline', 'Container timeline'],
+        ],
+
+        's3_title': 'Colori mappa',
+        's3_table': [
+            ['Tipo', 'Colore', 'Hex'],
+            ['Struttura', 'Blu', '#4a90c2'],
+            ['Personaggi', 'Rosso', '#c44a4a'],
+            ['Luoghi', 'Verde', '#4a9a6a'],
+            ['Temi', 'Arancione', '#b87333'],
+            ['Sequenze', 'Viola', '#8a5ac2'],
+            ['Timeline', 'Blu', '#4a90c2'],
+        ],
+
+        's4_title': 'Limiti tecnici',
+        's4_items': [
+            'Cronologia Undo: 100 stati',
+            'Numeri romani: 1-3999',
+            'I progetti .trmd sono file di testo salvati su disco. Non c\'e limite pratico alla dimensione: un romanzo completo con tutti gli aspetti occupa tipicamente meno di 1 MB.',
+        ],
+
+        'footer': 'Tramando - Tessi la tua storia',
+    },
+}
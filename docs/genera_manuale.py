@@ -5,6 +5,8 @@ Generatore del Manuale Utente di Tramando
 
 Genera manuali utente professionali in italiano e inglese.
 
+I testi si trovano in contenuti_it.py e contenuti_en.py.
+
 Requisiti:
     pip install reportlab pillow
 
@@ -16,16 +18,28 @@ Utilizzo:
 
 import sys
 import os
+import io
+import copy
+import math
+import hashlib
+import functools
+import importlib.util
+from concurrent.futures import ProcessPoolExecutor
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm
+from reportlab.lib.units import cm, inch
 from reportlab.lib.colors import HexColor, white
 from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY, TA_LEFT
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Image, PageBreak,
     Table, TableStyle, KeepTogether
 )
-from reportlab.lib.utils import ImageReader
+from PIL import Image as PILImage
+
+# Gli stream delle immagini restano binari (solo zlib): la codifica ASCII85
+# di ReportLab e' in Python puro e da sola occupava la maggior parte del build
+rl_config.useA85 = 0
 
 # =============================================================================
 # COSTANTI
@@ -39,13 +53,22 @@ COLOR_LIGHT = HexColor('#faf8f5')      # Sfondo alternato tabelle
 
 MARGIN = 2 * cm
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGES_DIR = os.path.join(SCRIPT_DIR, 'images')
+CACHE_DIR = os.path.join(SCRIPT_DIR, '.cache')   # Immagini ridotte
+IMAGE_DPI = 200                                  # Risoluzione delle immagini nel PDF
 
 # =============================================================================
 # STILI
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def create_styles():
-    """Crea gli stili per il documento."""
+    """
+    Crea gli stili per il documento.
+
+    Gli stili non dipendono dalla lingua: il risultato viene memorizzato
+    e condiviso tra le build IT ed EN.
+    """
     styles = getSampleStyleSheet()
 
     styles.add(ParagraphStyle(
@@ -164,6 +187,7 @@ def create_styles():
         'TOCEntry',
         parent=styles['Normal'],
         fontSize=12,
+        leading=16,  # 12 + 4 di spazio fra le voci: l'indice e' un solo paragrafo
         textColor=COLOR_TEXT,
         spaceBefore=4,
         spaceAfter=4,
@@ -194,8 +218,68 @@ def create_styles():
 # =============================================================================
 
 def get_image_path(lang, filename):
-    """Restituisce il percorso completo di un'immagine."""
-    return os.path.join(SCRIPT_DIR, 'images', lang, filename)
+    """
+    Restituisce il percorso completo di un'immagine.
+
+    Il percorso e' internato: le ricerche nella cache di _probe_image
+    si risolvono per identita' invece che confrontando le stringhe.
+    """
+    return sys.intern(os.path.join(IMAGES_DIR, lang, filename))
+
+
+@functools.lru_cache(maxsize=None)
+def _image_index(lang):
+    """Elenca una sola volta le immagini disponibili per una lingua."""
+    try:
+        return frozenset(os.listdir(os.path.join(IMAGES_DIR, lang)))
+    except FileNotFoundError:
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=256)
+def _probe_image(path):
+    """
+    Restituisce (larghezza, altezza) di un'immagine in pixel.
+
+    Pillow legge solo l'intestazione del file: i pixel li decodifica
+    ReportLab quando disegna, una volta sola.
+    """
+    with PILImage.open(path) as img:
+        return img.size
+
+
+@functools.lru_cache(maxsize=256)
+def _resized_image(path, width_px):
+    """
+    Restituisce una copia dell'immagine ridotta a width_px di larghezza.
+
+    Le copie restano in .cache/ tra un'esecuzione e l'altra; la chiave
+    include la data di modifica, quindi un originale aggiornato produce
+    una nuova copia. Se la cache non e' scrivibile si usa l'originale.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    key = hashlib.sha1(f"{path}|{width_px}|{mtime}".encode()).hexdigest()
+    cached = os.path.join(CACHE_DIR, key + '.png')
+
+    if not os.path.exists(cached):
+        with PILImage.open(path) as src:
+            height_px = max(1, round(src.height * width_px / src.width))
+            small = src.resize((width_px, height_px), PILImage.Resampling.LANCZOS)
+        # Scrittura atomica: le due lingue possono girare in parallelo
+        tmp = f"{cached}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            small.save(tmp, 'PNG')
+            os.replace(tmp, cached)
+        except OSError as e:
+            print(f"  [!] Cache immagini non scrivibile, uso l'originale: {e}")
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            return path
+
+    return cached
 
 
 def add_image(story, lang, filename, caption, styles, width=14*cm):
@@ -204,13 +288,12 @@ def add_image(story, lang, filename, caption, styles, width=14*cm):
     """
     path = get_image_path(lang, filename)
 
-    if not os.path.exists(path):
+    if filename not in _image_index(lang):
         print(f"  [!] Immagine non trovata: {path}")
         return False
 
     try:
-        img_reader = ImageReader(path)
-        orig_w, orig_h = img_reader.getSize()
+        orig_w, orig_h = _probe_image(path)
         aspect = orig_h / float(orig_w)
 
         height = width * aspect
@@ -221,12 +304,16 @@ def add_image(story, lang, filename, caption, styles, width=14*cm):
             height = MAX_HEIGHT
             width = height / aspect
 
-        img = Image(path, width=width, height=height)
+        # Oltre IMAGE_DPI i pixel in piu' non si vedono ma vanno comunque
+        # compressi e scritti nel PDF: si usa una copia ridotta
+        width_px = math.ceil(width / inch * IMAGE_DPI)
+        src = _resized_image(path, width_px) if orig_w > width_px else path
+        img = Image(src, width=width, height=height)
         img.hAlign = 'CENTER'
         story.append(img)
 
         if caption:
-            story.append(Paragraph(caption, styles['Caption']))
+            story.append(_para(caption, styles['Caption']))
 
         return True
 
@@ -235,2587 +322,795 @@ def add_image(story, lang, filename, caption, styles, width=14*cm):
         return False
 
 
+# Parte statica dello stile tabelle, costruita una sola volta
+_BASE_TABLE_STYLE = (
+    ('BACKGROUND', (0, 0), (-1, 0), COLOR_PRIMARY),
+    ('TEXTCOLOR', (0, 0), (-1, 0), white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+    ('TOPPADDING', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
+    ('TOPPADDING', (0, 1), (-1, -1), 8),
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 0.5, COLOR_MUTED),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _table_style_for(n_rows):
+    """Stile tabella per un dato numero di righe (dipende solo da quello)."""
+    base_style = list(_BASE_TABLE_STYLE)
+
+    # Righe alternate (le righe pari dopo l'intestazione)
+    base_style.extend(
+        ('BACKGROUND', (0, i), (-1, i), COLOR_LIGHT)
+        for i in range(2, n_rows, 2)
+    )
+
+    return TableStyle(base_style)
+
+
 def make_table(data, col_widths=None, style_type='default'):
     """Crea una tabella con stile Tramando."""
     table = Table(data, colWidths=col_widths)
-
-    base_style = [
-        ('BACKGROUND', (0, 0), (-1, 0), COLOR_PRIMARY),
-        ('TEXTCOLOR', (0, 0), (-1, 0), white),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('TOPPADDING', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 1), (-1, -1), 8),
-        ('TOPPADDING', (0, 1), (-1, -1), 8),
-        ('LEFTPADDING', (0, 0), (-1, -1), 8),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 0.5, COLOR_MUTED),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]
-
-    # Righe alternate
-    for i in range(1, len(data)):
-        if i % 2 == 0:
-            base_style.append(('BACKGROUND', (0, i), (-1, i), COLOR_LIGHT))
-
-    table.setStyle(TableStyle(base_style))
+    table.setStyle(_table_style_for(len(data)))
     return table
 
 
+@functools.lru_cache(maxsize=1024)
+def _parsed_paragraph(text, style, bullet_text=None):
+    """Esegue il parsing del markup una sola volta per (testo, stile, bullet)."""
+    return Paragraph(text, style, bulletText=bullet_text)
+
+
+def _para(text, style, bullet_text=None):
+    """
+    Restituisce un Paragraph pronto per lo story.
+
+    Il layout di ReportLab modifica il flowable, quindi si restituisce
+    una copia del paragrafo in cache: il parsing non viene ripetuto.
+    """
+    return copy.copy(_parsed_paragraph(text, style, bullet_text))
+
+
+def spacer(height):
+    """
+    Restituisce un nuovo Spacer per l'altezza richiesta.
+
+    Gli Spacer non si possono condividere: quando uno non entra nella pagina
+    ReportLab lo marca con _postponed e non lo ripulisce, e la seconda volta
+    che la stessa istanza finisce in fondo a una pagina il build fallisce
+    con LayoutError.
+    """
+    return Spacer(1, height)
+
+
+# Un PageBreak invece viene gestito prima di arrivare al frame e non viene
+# mai rimandato: ne basta uno per tutto lo story
+PAGE_BREAK = PageBreak()
+
+
+def add_paragraphs(story, ch, keys, style):
+    """Aggiunge in blocco i paragrafi di un capitolo con lo stesso stile."""
+    story.extend(_para(ch[key], style) for key in keys)
+
+
 def add_bullet_list(story, items, styles):
     """Aggiunge una lista puntata."""
+    style = styles['BulletItem']
     for item in items:
-        story.append(Paragraph(f"• {item}", styles['BulletItem']))
+        story.append(_para(item, style, "•"))
 
 
 def add_numbered_list(story, items, styles):
     """Aggiunge una lista numerata."""
+    style = styles['BulletItem']
     for i, item in enumerate(items, 1):
-        story.append(Paragraph(f"{i}. {item}", styles['BulletItem']))
+        story.append(_para(item, style, f"{i}."))
 
 # =============================================================================
-# CONTENUTI ITALIANO
+# CONTENUTI
 # =============================================================================
 
-IT = {
-    'filename': 'Tramando_Manuale_Italiano.pdf',
-    'tagline': 'Tessi la tua storia',
-    'manual_title': 'Manuale Utente',
-    'version': 'Versione 2.0',
-    'toc_title': 'Indice',
-
-    'chapters': [
-        '1. Introduzione',
-        '2. Modalita di utilizzo',
-        '3. Primi passi',
-        '4. Cos\'e il markup',
-        '5. L\'interfaccia',
-        '6. La Struttura narrativa',
-        '7. Gli Aspetti',
-        '8. I collegamenti',
-        '9. Le annotazioni',
-        '10. Cerca e sostituisci',
-        '11. La mappa radiale',
-        '12. Export PDF, Word e Markdown',
-        '13. Impostazioni',
-        '14. Il formato file .trmd',
-        '15. Scorciatoie da tastiera',
-        '16. Assistente AI (opzionale)',
-        '17. Modalita collaborativa',
-        'Appendice: Riferimento rapido',
-    ],
-
-    'captions': {
-        'splash_tauri': 'La schermata di benvenuto (versione desktop)',
-        'splash_webapp': 'La schermata di benvenuto (versione webapp con login)',
-        'main': 'L\'interfaccia principale di Tramando',
-        'filter': 'Il filtro globale e la ricerca in azione',
-        'map': 'La mappa radiale con i collegamenti tra elementi',
-        'settings': 'Il pannello delle impostazioni',
-        'priority_sidebar': 'Il widget soglia priorita nella sidebar',
-        'priority_editor': 'Il campo priorita nell\'editor aspetto',
-    },
-
-    # =========================================================================
-    # CAPITOLO 1: INTRODUZIONE
-    # =========================================================================
-    'ch1': {
-        'title': '1. Introduzione',
-
-        's1_title': 'Cos\'e Tramando',
-        's1_p1': 'Tramando e uno strumento pensato per scrittori che devono gestire storie complesse. Se stai scrivendo un romanzo con decine di personaggi, una sceneggiatura con molteplici linee narrative, o stai costruendo un mondo immaginario con la sua storia e geografia, Tramando ti aiuta a tenere tutto sotto controllo.',
-        's1_p2': 'A differenza di un normale word processor, Tramando non si limita a farti scrivere testo. Ti permette di organizzare la tua storia in blocchi modulari chiamati "chunk", di definire personaggi, luoghi e temi come entita separate, e di collegarli tra loro per vedere come si intrecciano nella narrazione.',
-        's1_p3': 'Il risultato e una visione d\'insieme della tua opera che sarebbe impossibile ottenere con strumenti tradizionali: puoi vedere in quali scene appare un personaggio, tracciare lo sviluppo di un tema attraverso i capitoli, o verificare la coerenza della timeline.',
-
-        's2_title': 'L\'origine del nome',
-        's2_p1': 'Il nome "Tramando" nasce da un gioco di parole. Da un lato c\'e <b>trama</b>, perche scrivere e essenzialmente tessere fili narrativi, intrecciare storie e destini. Dall\'altro c\'e <b>tramando</b>, il gerundio che evoca il senso di progettare qualcosa, magari anche un crimine. Come diceva qualcuno, la differenza tra lo scrittore e l\'assassino e tenue: semplicemente il primo il progetto non lo mette in atto.',
-
-        's3_title': 'La filosofia: tutto e un chunk',
-        's3_p1': 'In Tramando, l\'unita base e il <b>chunk</b>: un blocco di testo con un titolo e un\'identita propria. Un capitolo e un chunk. Una scena e un chunk. Ma anche un personaggio e un chunk, un luogo e un chunk, persino una singola nota puo essere un chunk.',
-        's3_p2': 'I chunk possono contenere altri chunk, creando una struttura ad albero completamente flessibile. Non ci sono regole rigide su come organizzare il tuo lavoro: puoi avere Libro > Parte > Capitolo > Scena, oppure semplicemente una lista piatta di scene. Tramando si adatta al tuo modo di pensare e scrivere, non il contrario.',
-
-        's4_title': 'Per chi e Tramando',
-        's4_items': [
-            '<b>Romanzieri</b> che gestiscono cast numerosi e trame intrecciate, e hanno bisogno di tracciare chi appare dove e quando',
-            '<b>Sceneggiatori</b> che devono tenere sotto controllo scene, personaggi, e archi narrativi su piu episodi o atti',
-            '<b>Autori di serie</b> che devono mantenere coerenza tra volumi, ricordando dettagli stabiliti nei libri precedenti',
-            '<b>Worldbuilder</b> che costruiscono mondi complessi con la loro storia, geografia, e cast di personaggi',
-            'Chiunque scriva storie con <b>molti elementi interconnessi</b> e voglia uno strumento per visualizzarli e gestirli',
-        ],
-    },
-
-    # =========================================================================
-    # CAPITOLO 2: MODALITA DI UTILIZZO
-    # =========================================================================
-    'ch2_modes': {
-        'title': '2. Modalita di utilizzo',
-
-        'intro': 'Tramando e disponibile in tre diverse modalita, ognuna pensata per esigenze specifiche. Puoi scegliere quella piu adatta al tuo modo di lavorare.',
-
-        's1_title': 'Applicazione desktop (Tauri)',
-        's1_p1': 'La versione desktop e un\'applicazione nativa per <b>Mac</b>, <b>Windows</b> e <b>Linux</b>. Funziona completamente offline e salva i tuoi progetti come file .trmd sul tuo computer.',
-        's1_items': [
-            '<b>Funziona offline</b> - Non richiede connessione internet',
-            '<b>File locali</b> - I progetti sono salvati sul tuo disco come file .trmd',
-            '<b>Prestazioni native</b> - Interfaccia veloce e reattiva',
-            '<b>Integrazione sistema</b> - Supporto completo per scorciatoie, drag&drop, e gestione file',
-        ],
-        's1_note': 'Questa e la versione consigliata per la maggior parte degli utenti.',
-
-        's2_title': 'Webapp locale',
-        's2_p1': 'Puoi usare Tramando anche direttamente nel browser, aprendo la webapp su un server locale. Questa modalita e identica al desktop ma richiede un browser moderno.',
-        's2_items': [
-            '<b>Nessuna installazione</b> - Basta un browser web',
-            '<b>File locali</b> - Salvataggio su disco tramite API del browser',
-            '<b>Multipiattaforma</b> - Funziona su qualsiasi sistema con un browser moderno',
-        ],
-
-        's3_title': 'Webapp collaborativa',
-        's3_p1': 'La modalita collaborativa permette a piu persone di lavorare sullo stesso progetto. Richiede un server Tramando (self-hosted o in cloud).',
-        's3_items': [
-            '<b>Collaborazione in tempo reale</b> - Piu autori sullo stesso progetto',
-            '<b>Gestione ruoli</b> - Owner, Admin e Collaborator con permessi diversi',
-            '<b>Ownership chunk</b> - Ogni chunk ha un proprietario che puo essere trasferito',
-            '<b>Proposte e discussioni</b> - Sistema di proposte per suggerire modifiche',
-            '<b>Chat integrata</b> - Comunicazione tra collaboratori per ogni chunk',
-        ],
-        's3_note': 'Per i dettagli sulla modalita collaborativa, vedi il capitolo dedicato.',
-
-        's4_title': 'Differenze principali',
-        's4_table': [
-            ['Funzionalita', 'Desktop', 'Webapp locale', 'Collaborativa'],
-            ['Connessione', 'Offline', 'Offline', 'Richiesta'],
-            ['Salvataggio', 'File .trmd', 'File .trmd', 'Server'],
-            ['Versioni/Backup', 'Si', 'Si', 'No (server)'],
-            ['Collaborazione', 'No', 'No', 'Si'],
-            ['Ownership', 'No', 'No', 'Si'],
-            ['Chat', 'No', 'No', 'Si'],
-            ['Proposte', 'No', 'No', 'Si'],
-        ],
-
-        's5_title': 'Quale scegliere?',
-        's5_items': [
-            '<b>Scrivi da solo?</b> - Usa l\'applicazione desktop',
-            '<b>Non vuoi installare nulla?</b> - Usa la webapp locale',
-            '<b>Lavori in team?</b> - Usa la modalita collaborativa',
-        ],
-    },
-
-    # =========================================================================
-    # CAPITOLO 3: PRIMI PASSI
-    # =========================================================================
-    'ch3': {
-        'title': '3. Primi passi',
-
-        's1_title': 'Avviare Tramando',
-        's1_p1': 'Tramando e disponibile come applicazione desktop per Mac, Windows e Linux. Una volta installato e avviato, ti accogliera la schermata di benvenuto con tre opzioni chiare per iniziare:',
-        's1_items': [
-            '<b>Continua il lavoro in corso</b> - Riprende automaticamente l\'ultimo progetto su cui stavi lavorando, esattamente dove l\'avevi lasciato',
-            '<b>Nuovo progetto</b> - Crea un progetto completamente vuoto, pronto per accogliere la tua nuova storia',
-            '<b>Apri file...</b> - Ti permette di caricare un file .trmd esistente dal tuo computer',
-        ],
-
-        's2_title': 'Il primo progetto',
-        's2_p1': 'Quando crei un nuovo progetto, Tramando ti presenta un\'interfaccia pulita e intuitiva, divisa in due aree principali. A sinistra trovi la <b>sidebar</b>, che contiene la struttura del tuo progetto: qui vedrai crescere l\'albero dei tuoi capitoli, scene, e tutti gli elementi della storia.',
-        's2_p2': 'A destra c\'e l\'<b>editor</b>, lo spazio dove effettivamente scrivi e modifichi i contenuti. L\'editor include funzionalita avanzate come syntax highlighting per il markup, numeri di riga, e la possibilita di passare rapidamente dalla modalita scrittura alla modalita lettura.',
-
-        's3_title': 'Salvare il lavoro',
-        's3_p1': 'Tramando salva automaticamente il tuo lavoro ogni pochi secondi. Puoi configurare l\'intervallo di autosalvataggio nelle impostazioni, scegliendo un valore tra 1 e 10 secondi. Questo significa che non perderai mai piu di qualche secondo di lavoro anche in caso di crash o chiusura accidentale.',
-        's3_p2': 'Oltre all\'autosalvataggio, puoi salvare manualmente su file cliccando il pulsante <b>Salva</b> nella barra superiore. Il file avra estensione <b>.trmd</b> e sara un file di testo leggibile, che potrai aprire anche con un normale editor di testo se necessario.',
-        's3_tip': '<i>Consiglio: anche se l\'autosalvataggio e attivo, e buona pratica salvare regolarmente su file. Cosi avrai sempre un backup esterno che potrai copiare su cloud o chiavetta USB.</i>',
-
-        's4_title': 'Versioni e backup',
-        's4_p1': 'Tramando include un sistema completo di gestione versioni. Accanto ai pulsanti Salva trovi un menu a tendina <b>Versione</b> con tre opzioni:',
-        's4_items': [
-            '<b>Salva versione</b> - Crea uno snapshot del tuo lavoro con data/ora e una descrizione opzionale. Utile prima di modifiche importanti o per segnare tappe significative.',
-            '<b>Lista versioni</b> - Mostra tutte le versioni salvate. Per ogni versione puoi: <b>Apri copia</b> (apre la versione come nuovo documento non salvato, senza toccare il file corrente) oppure <b>Ripristina</b> (sostituisce il file corrente con la versione selezionata, creando prima un backup automatico).',
-            '<b>Ripristina backup</b> - Recupera l\'ultimo backup automatico. Tramando crea un file .backup ogni volta che salvi, permettendoti di tornare allo stato precedente.',
-        ],
-        's4_p2': 'Quando il documento ha modifiche non salvate, appare un <b>pallino</b> accanto al nome del file nella barra superiore. Questo indicatore ti ricorda che ci sono cambiamenti da salvare.',
-        's4_note': '<i>Nota: le versioni vengono salvate nella cartella dati dell\'applicazione, non accanto al file originale. Questo garantisce compatibilita con cartelle cloud come iCloud.</i>',
-    },
-
-    # =========================================================================
-    # CAPITOLO 4: COS'E IL MARKUP
-    # =========================================================================
-    'ch4': {
-        'title': '4. Cos\'e il markup',
-
-        'intro': 'Se hai sempre usato programmi come Microsoft Word o Google Docs, potresti non aver mai sentito parlare di "markup". Niente paura: e un concetto semplice che, una volta capito, ti sembrera naturale e potente.',
-
-        's1_title': 'Formattazione visuale vs markup',
-        's1_p1': 'In Word, quando vuoi mettere una parola in grassetto, la selezioni con il mouse e clicchi sul pulsante B nella toolbar. Questo approccio si chiama <b>formattazione visuale</b> o WYSIWYG (What You See Is What You Get): quello che vedi sullo schermo e esattamente quello che ottieni.',
-        's1_p2': 'Con il <b>markup</b>, invece, inserisci dei simboli speciali direttamente nel testo. Questi simboli vengono poi interpretati e trasformati nella formattazione desiderata. Per esempio, invece di cliccare un pulsante per il grassetto, scrivi:',
-        's1_code': 'Questa parola e **importante**',
-        's1_result': 'E il risultato sara: Questa parola e <b>importante</b>',
-
-        's2_title': 'Perche usare il markup?',
-        's2_items': [
-            '<b>Velocita</b> - Non devi mai togliere le mani dalla tastiera per cercare pulsanti o menu. Scrivi e formatti in un flusso continuo',
-            '<b>Portabilita</b> - I file sono puro testo, leggibili su qualsiasi dispositivo e con qualsiasi programma',
-            '<b>Controllo</b> - Vedi sempre esattamente cosa c\'e nel documento, senza formattazioni nascoste o stili misteriosi',
-            '<b>Leggerezza</b> - File piccoli e veloci, nessun formato proprietario, nessun rischio di corruzione',
-        ],
-
-        's3_title': 'Markdown: lo standard',
-        's3_p1': 'Tramando usa <b>Markdown</b>, il linguaggio di markup piu diffuso al mondo. Lo trovi su GitHub, Reddit, Discord, Notion, e centinaia di altre piattaforme. Impararlo una volta ti servira ovunque.',
-        's3_table_title': 'Comandi Markdown base:',
-        's3_table': [
-            ['Cosa vuoi', 'Cosa scrivi', 'Risultato'],
-            ['Grassetto', '**testo**', 'testo in grassetto'],
-            ['Corsivo', '*testo*', 'testo in corsivo'],
-            ['Titolo', '# Titolo', 'Intestazione grande'],
-            ['Sottotitolo', '## Sottotitolo', 'Intestazione media'],
-            ['Elenco puntato', '- elemento', '* elemento'],
-            ['Elenco numerato', '1. elemento', '1. elemento'],
-        ],
-
-        's4_title': 'Il markup speciale di Tramando',
-        's4_p1': 'Oltre al Markdown standard, Tramando aggiunge una sua sintassi per funzionalita specifiche:',
-        's4_table': [
-            ['Funzione', 'Sintassi', 'Esempio'],
-            ['Riferimento aspetto', '[@id]', '[@elena]'],
-            ['Annotazione TODO', '[!TODO:testo:priorita:commento]', '[!TODO:riscrivere:1:troppo lungo]'],
-            ['Annotazione NOTE', '[!NOTE:testo::commento]', '[!NOTE:verificare data::]'],
-            ['Annotazione FIX', '[!FIX:testo:priorita:]', '[!FIX:errore nome:2:]'],
-            ['Numero arabo', '[:ORD]', '1, 2, 3...'],
-            ['Numero romano', '[:ORD-ROM]', 'I, II, III...'],
-        ],
-
-        's5_title': 'Non preoccuparti!',
-        's5_p1': 'Tramando evidenzia tutto il markup con colori diversi, rendendo facile distinguere i simboli speciali dal testo normale. Inoltre, il tab <b>Lettura</b> ti mostra sempre il risultato finale, senza alcun simbolo visibile.',
-        's5_tip': '<i>Dopo qualche giorno di utilizzo, scrivere **grassetto** o [@personaggio] ti verra naturale quanto cliccare un pulsante. E sarai molto piu veloce.</i>',
-    },
-
-    # =========================================================================
-    # CAPITOLO 5: L'INTERFACCIA
-    # =========================================================================
-    'ch5': {
-        'title': '5. L\'interfaccia',
-
-        's1_title': 'La barra superiore',
-        's1_p1': 'La barra in alto contiene tutti i comandi principali dell\'applicazione:',
-        's1_items': [
-            '<b>Logo Tramando</b> - Cliccandolo torni alla schermata di benvenuto',
-            '<b>Titolo progetto</b> - Mostra il nome del progetto corrente; cliccandolo puoi modificare i metadati (titolo, autore, anno...)',
-            '<b>Carica</b> - Apre un file .trmd dal tuo computer',
-            '<b>Salva</b> - Scarica il progetto corrente come file .trmd',
-            '<b>Versione</b> - Menu per salvare versioni, vedere la lista versioni, o ripristinare un backup',
-            '<b>Esporta</b> - Menu a tendina per esportare in PDF, Markdown o Word (.docx)',
-            '<b>Badge Annotazioni</b> - Mostra il numero totale di annotazioni; cliccandolo apri il pannello annotazioni',
-            '<b>Toggle Mappa/Editor</b> - Alterna tra la vista mappa radiale e l\'editor di testo',
-            '<b>Ingranaggio</b> - Apre il pannello delle impostazioni',
-        ],
-
-        's2_title': 'La sidebar',
-        's2_p1': 'Il pannello laterale sinistro e il centro di navigazione del tuo progetto:',
-        's2_sub1': 'Campo filtro',
-        's2_sub1_p': 'In cima alla sidebar trovi un campo di ricerca che filtra l\'intero progetto. Digitando, vedrai solo gli elementi che contengono il testo cercato, sia nel titolo che nel contenuto.',
-        's2_sub2': 'STRUTTURA',
-        's2_sub2_p': 'Questa sezione contiene la tua narrativa vera e propria: capitoli, scene, parti. E organizzata come un albero espandibile. Il numero tra parentesi indica quanti elementi contiene.',
-        's2_sub3': 'ASPETTI',
-        's2_sub3_p': 'Qui trovi i cinque tipi di elementi trasversali, ognuno con la sua icona distintiva: <b>Personaggi</b> (👤), <b>Luoghi</b> (📍), <b>Temi</b> (💡), <b>Sequenze</b> (🔗), <b>Timeline</b> (📅). Per ogni categoria puoi impostare una soglia di priorita con i pulsanti −/+.',
-
-        's3_title': 'L\'editor',
-        's3_p1': 'L\'area principale a destra e dove avviene la scrittura. Include tre tab (quattro per gli aspetti):',
-        's3_items': [
-            '<b>Modifica</b> - L\'editor vero e proprio, con syntax highlighting per il markup',
-            '<b>Usato da</b> - Solo per gli aspetti: mostra le scene che usano questo elemento',
-            '<b>Lettura</b> - Anteprima pulita del testo, senza markup visibile',
-        ],
-        's3_p2': 'Sopra l\'editor trovi: il campo per modificare il titolo, i tag degli aspetti collegati, e il pulsante "+ Aspetto" per aggiungere collegamenti. Il menu contestuale (⋮) permette di spostare l\'elemento, creare figli, modificare l\'ID e altre azioni.',
-    },
-
-    # =========================================================================
-    # CAPITOLO 6: LA STRUTTURA NARRATIVA
-    # =========================================================================
-    'ch6': {
-        'title': '6. La Struttura narrativa',
-
-        's1_title': 'Organizzazione ad albero',
-        's1_p1': 'La sezione STRUTTURA nella sidebar contiene il testo della tua storia, organizzato come un albero gerarchico. Ogni elemento puo contenere altri elementi, permettendoti di creare la struttura che preferisci.',
-        's1_p2': 'Una struttura tipica potrebbe essere: <b>Libro</b> > <b>Parte</b> > <b>Capitolo</b> > <b>Scena</b>. Ma non ci sono regole fisse: potresti avere solo capitoli, oppure scene senza capitoli, oppure una struttura completamente diversa. Tramando si adatta a te.',
-
-        's2_title': 'Creare nuovi elementi',
-        's2_items': [
-            'Clicca <b>"+ Nuovo Chunk"</b> nella sidebar per creare un elemento al livello root',
-            'Per creare un elemento annidato, seleziona un chunk e usa il menu (⋮) > <b>"+ Figlio"</b>',
-            'Ogni chunk riceve automaticamente un ID unico (es. cap-1, scene-2)',
-            'Puoi modificare l\'ID dal menu (⋮) > <b>"Modifica ID"</b> per renderlo piu significativo (es. "prologo", "climax")',
-        ],
-
-        's3_title': 'Numerazione automatica',
-        's3_p1': 'Tramando supporta macro speciali nel titolo che vengono sostituite con numeri automatici, basati sulla posizione dell\'elemento tra i suoi fratelli.',
-        's3_table': [
-            ['Macro', 'Risultato', 'Esempio'],
-            ['[:ORD]', 'Numeri arabi', '1, 2, 3, 4...'],
-            ['[:ORD-ROM]', 'Romani maiuscoli', 'I, II, III, IV...'],
-            ['[:ORD-rom]', 'Romani minuscoli', 'i, ii, iii, iv...'],
-            ['[:ORD-ALPHA]', 'Lettere maiuscole', 'A, B, C, D...'],
-            ['[:ORD-alpha]', 'Lettere minuscole', 'a, b, c, d...'],
-        ],
-        's3_example': 'Se scrivi "Capitolo [:ORD]: Il risveglio" come titolo del primo capitolo, apparira come "Capitolo 1: Il risveglio". Il secondo capitolo con "Capitolo [:ORD]: La partenza" diventera "Capitolo 2: La partenza", e cosi via.',
-    },
-
-    # =========================================================================
-    # CAPITOLO 7: GLI ASPETTI
-    # =========================================================================
-    'ch7': {
-        'title': '7. Gli Aspetti',
-
-        'intro': 'Gli aspetti sono elementi che attraversano la storia in modo trasversale. Non fanno parte della sequenza narrativa lineare, ma si collegano ad essa in vari punti. Tramando definisce cinque tipi di aspetti, ognuno con un colore distintivo.',
-
-        's1_title': 'Personaggi',
-        's1_color': 'Colore: rosso (#c44a4a)',
-        's1_p1': 'I personaggi sono le entita che abitano il tuo mondo narrativo. Ogni personaggio puo avere una scheda con la sua descrizione, e puoi creare sotto-elementi per organizzare le informazioni: aspetto fisico, background, arco narrativo, relazioni con altri personaggi.',
-        's1_p2': 'Collegando un personaggio alle scene in cui appare, potrai sempre sapere dove e quando interviene nella storia, facilitando il controllo della coerenza.',
-
-        's2_title': 'Luoghi',
-        's2_color': 'Colore: verde (#4a9a6a)',
-        's2_p1': 'I luoghi sono gli spazi dove accadono le cose. Puoi organizzarli gerarchicamente: un Paese contiene Citta, che contengono Quartieri, che contengono Edifici, che contengono Stanze.',
-        's2_p2': 'Ogni luogo puo avere la sua descrizione dettagliata, e collegandolo alle scene saprai sempre dove si svolge ogni momento della storia.',
-
-        's3_title': 'Temi',
-        's3_color': 'Colore: arancione (#b87333)',
-        's3_p1': 'I temi sono le idee e i motivi ricorrenti della tua storia: vendetta, redenzione, amore, tradimento, crescita personale. Definendoli come aspetti e collegandoli alle scene pertinenti, puoi tracciare come ogni tema si sviluppa attraverso la narrazione.',
-        's3_p2': 'Questo e particolarmente utile in fase di revisione, quando vuoi assicurarti che un tema sia stato sviluppato adeguatamente o che non sia stato abbandonato a meta storia.',
-
-        's4_title': 'Sequenze',
-        's4_color': 'Colore: viola (#8a5ac2)',
-        's4_p1': 'Le sequenze sono catene di causa-effetto che attraversano la storia. A differenza della struttura narrativa (che segue l\'ordine di lettura), le sequenze seguono la logica interna degli eventi.',
-        's4_p2': 'Per esempio, una sequenza "Vendetta di Marco" potrebbe avere come figli: "Scoperta del tradimento" > "Pianificazione" > "Primo tentativo fallito" > "Successo" > "Conseguenze". Questi passi potrebbero essere sparsi in capitoli diversi, ma la sequenza li tiene collegati.',
-
-        's5_title': 'Timeline',
-        's5_color': 'Colore: blu (#4a90c2)',
-        's5_p1': 'La timeline contiene eventi in ordine cronologico reale, indipendentemente da come appaiono nella narrazione. E particolarmente utile quando la tua storia non e lineare: flashback, flashforward, o narrazioni parallele.',
-        's5_p2': 'Puoi usare date o timestamp nei titoli degli eventi (es. "2024-03-15 08:00 - Risveglio") per mantenere l\'ordine corretto.',
-        's5_tip': '<i>Consiglio: usa il formato data ISO (AAAA-MM-GG) nei titoli della timeline per un ordinamento alfabetico che corrisponda all\'ordine cronologico.</i>',
-
-        's6_title': 'Creare aspetti',
-        's6_p1': 'Per creare un nuovo aspetto, clicca il pulsante <b>"+ Nuovo aspetto"</b> nella sidebar, sotto la categoria desiderata. Ogni aspetto avra il suo ID univoco e potrai dargli un titolo descrittivo.',
-
-        's7_title': 'Priorita degli aspetti',
-        's7_p1': 'Ogni aspetto puo avere una <b>priorita</b> da 0 (bassa) a 10 (alta). Questo ti permette di distinguere tra elementi principali e secondari della tua storia.',
-        's7_items': [
-            'Nell\'editor di un aspetto, trovi il campo <b>Priorita</b> con un valore numerico',
-            'Aspetti con priorita piu alta appaiono per primi nella sidebar',
-            'Puoi usare la soglia per nascondere aspetti minori',
-        ],
-
-        's8_title': 'Filtro soglia',
-        's8_p1': 'In ogni categoria di aspetti (Personaggi, Luoghi, ecc.) trovi un widget <b>soglia</b> con i pulsanti −0+. Questo imposta il livello minimo di priorita visibile:',
-        's8_items': [
-            'Se la soglia e <b>0</b>, tutti gli aspetti sono visibili',
-            'Se la soglia e <b>3</b>, solo aspetti con priorita >= 3 sono visibili',
-            'Gli aspetti filtrati non compaiono nella sidebar ne nella mappa radiale',
-            'I tag degli aspetti filtrati appaiono sbiaditi nell\'editor',
-        ],
-        's8_tip': '<i>Consiglio: usa le priorita per concentrarti sui personaggi principali durante la scrittura, poi abbassa la soglia durante la revisione per verificare che anche i secondari siano coerenti.</i>',
-    },
-
-    # =========================================================================
-    # CAPITOLO 8: I COLLEGAMENTI
-    # =========================================================================
-    'ch8': {
-        'title': '8. I collegamenti',
-
-        'intro': 'La vera potenza di Tramando sta nei collegamenti tra la struttura narrativa e gli aspetti. Collegando scene a personaggi, luoghi e temi, crei una rete di relazioni che ti permette di navigare e analizzare la tua storia in modi impossibili con strumenti tradizionali.',
-
-        's1_title': 'Sintassi [@id]',
-        's1_p1': 'Il modo piu diretto per creare un collegamento e scrivere <b>[@id]</b> nel testo della scena, dove "id" e l\'identificatore dell\'aspetto che vuoi collegare.',
-        's1_p2': 'Per esempio, se hai un personaggio con ID "elena", scrivendo [@elena] in una scena crei automaticamente un collegamento. Questo metodo e particolarmente utile quando vuoi segnare il punto esatto in cui un elemento appare nel testo.',
-
-        's2_title': 'Metodo tag',
-        's2_p1': 'Un\'alternativa e usare i tag visivi sopra l\'editor:',
-        's2_items': [
-            'Seleziona la scena che vuoi collegare',
-            'Clicca sul pulsante <b>"+ Aspetto"</b> sopra l\'editor',
-            'Scegli l\'aspetto dal menu che appare',
-            'Il tag apparira sotto il titolo della scena',
-        ],
-        's2_p2': 'Per rimuovere un collegamento, clicca sulla <b>x</b> accanto al tag.',
-
-        's3_title': 'Tab "Usato da"',
-        's3_p1': 'Quando selezioni un aspetto (personaggio, luogo, tema...), il tab "Usato da" ti mostra tutte le scene che lo referenziano. E un modo veloce per rispondere alla domanda: "Dove appare questo elemento nella storia?"',
-
-        's4_title': 'Conteggio nella sidebar',
-        's4_p1': 'Nella sidebar, accanto a ogni aspetto, vedi un numero tra parentesi (es. "Elena (6)"). Questo indica in quante scene l\'elemento e collegato, dandoti subito un\'idea della sua importanza nella storia.',
-
-        's5_title': 'Best practices',
-        's5_items': [
-            'Usa ID brevi e significativi: "elena" e meglio di "personaggio-001"',
-            'Crea i collegamenti mentre scrivi, non dopo - e piu facile e mantiene la consistenza',
-            'Non esagerare: collega solo gli aspetti veramente rilevanti per ogni scena',
-            'Usa i tag per aspetti ricorrenti, [@id] nel testo per riferimenti specifici',
-        ],
-    },
-
-    # =========================================================================
-    # CAPITOLO 9: LE ANNOTAZIONI
-    # =========================================================================
-    'ch9': {
-        'title': '9. Le annotazioni',
-
-        'intro': 'Le annotazioni sono note che lasci per te stesso durante la scrittura. Sono visibili in Tramando ma non appariranno mai nel prodotto finale esportato. Sono il tuo spazio per appunti, promemoria e segnalazioni.',
-
-        's1_title': 'Tipi di annotazione',
-        's1_items': [
-            '<b>TODO</b> - Cose da fare: "aggiungere descrizione del luogo", "sviluppare il dialogo", "ricercare dettagli storici"',
-            '<b>NOTE</b> - Appunti e riflessioni: "verificare questa data", "idea per il sequel", "forse troppo lungo"',
-            '<b>FIX</b> - Problemi da correggere: "incongruenza con capitolo 3", "errore nel nome", "timeline non torna"',
-        ],
-
-        's2_title': 'Creare annotazioni',
-        's2_p1': 'Ci sono due modi per creare un\'annotazione:',
-        's2_items': [
-            'Seleziona il testo da annotare, clicca destro, e scegli il tipo di annotazione dal menu',
-            'Scrivi direttamente la sintassi nel testo',
-        ],
-
-        's3_title': 'La sintassi',
-        's3_p1': 'Il formato delle annotazioni e:',
-        's3_code': '[!TIPO:testo:priorita:commento]',
-        's3_examples_title': 'Esempi:',
-        's3_examples': [
-            '[!TODO:riscrivere questo dialogo:1:troppo formale]',
-            '[!NOTE:verificare data storica::controllare enciclopedia]',
-            '[!FIX:Marco qui si chiama Luca:3:]',
-        ],
-
-        's4_title': 'Pannello Annotazioni',
-        's4_p1': 'Nella sidebar, la sezione ANNOTAZIONI raccoglie tutte le annotazioni del progetto, raggruppate per tipo (TODO, FIX, NOTE). Cliccando su un\'annotazione, salti direttamente al punto del testo dove si trova.',
-        's4_p2': 'Il badge nella barra superiore mostra il numero totale di annotazioni, dandoti sempre visibilita su quanto lavoro di revisione ti aspetta.',
-
-        's5_note': '<b>Importante:</b> le annotazioni NON appaiono nell\'export PDF. Sono esclusivamente per l\'autore durante il processo di scrittura.',
-    },
-
-    # =========================================================================
-    # CAPITOLO 10: CERCA E SOSTITUISCI
-    # =========================================================================
-    'ch10': {
-        'title': '10. Cerca e sostituisci',
-
-        'intro': 'Tramando offre strumenti di ricerca potenti per navigare anche i progetti piu grandi. Ci sono due livelli di ricerca: globale (su tutto il progetto) e locale (sul chunk corrente).',
-
-        's1_title': 'Filtro globale',
-        's1_p1': 'Il campo di ricerca in cima alla sidebar filtra l\'intero progetto. Mentre digiti, la sidebar mostra solo gli elementi che contengono il testo cercato, sia nel titolo che nel contenuto.',
-        's1_features': [
-            '<b>[Aa]</b> - Toggle per ricerca case-sensitive (distingue maiuscole/minuscole)',
-            '<b>[.*]</b> - Toggle per attivare le espressioni regolari',
-            'I risultati appaiono come lista piatta con il percorso completo',
-            'Cliccando un risultato, si apre nell\'editor con i match evidenziati',
-        ],
-
-        's2_title': 'Ricerca locale',
-        's2_p1': 'Premi <b>Ctrl+F</b> (o <b>Cmd+F</b> su Mac) per aprire la barra di ricerca sopra l\'editor. Questa cerca solo nel chunk corrente.',
-        's2_features': [
-            'Tutti i match sono evidenziati in giallo',
-            'Il match corrente e evidenziato in arancione piu intenso',
-            'Le frecce <b>&lt;</b> e <b>&gt;</b> navigano tra i match',
-            'I tasti <b>freccia su/giu</b> funzionano come alternativa',
-            'Il contatore (es. "3/12") mostra la posizione corrente sul totale',
-        ],
-
-        's3_title': 'Sostituisci',
-        's3_p1': 'Premi <b>Ctrl+H</b> (o <b>Cmd+H</b> su Mac) per aprire la barra di sostituzione. Appare un secondo campo per il testo di sostituzione.',
-        's3_features': [
-            '<b>Sostituisci</b> - Cambia il match corrente e passa al successivo',
-            '<b>Sostituisci tutti</b> - Cambia tutte le occorrenze in una volta',
-            'Un messaggio conferma quante sostituzioni sono state effettuate',
-            '<b>Ctrl+Z</b> annulla le sostituzioni',
-        ],
-
-        's4_title': 'Espressioni regolari',
-        's4_p1': 'Attivando il toggle [.*] puoi usare espressioni regolari per ricerche avanzate:',
-        's4_examples': [
-            '<b>\\bparola\\b</b> - Trova "parola" come parola intera, non come parte di altre parole',
-            '<b>cap[ií]tolo</b> - Trova sia "capitolo" che "capítolo"',
-            '<b>\\d{4}</b> - Trova sequenze di 4 cifre (utile per cercare anni)',
-            '<b>^inizio</b> - Trova "inizio" solo a inizio riga',
-        ],
-    },
-
-    # =========================================================================
-    # CAPITOLO 11: LA MAPPA RADIALE
-    # =========================================================================
-    'ch11': {
-        'title': '11. La mappa radiale',
-
-        'intro': 'La mappa radiale e una visualizzazione grafica della tua storia. Ti permette di "vedere" la trama nel suo insieme, con tutti i collegamenti tra struttura e aspetti rappresentati visivamente.',
-
-        's1_title': 'Leggere la mappa',
-        's1_items': [
-            '<b>Centro</b> - Il titolo del progetto',
-            '<b>Anello interno (grigio)</b> - La struttura narrativa: capitoli e scene',
-            '<b>Anelli esterni</b> - Gli aspetti, ognuno con il suo colore',
-            '<b>Linee</b> - I collegamenti tra scene e aspetti',
-        ],
-
-        's2_title': 'Interazione',
-        's2_items': [
-            '<b>Scroll</b> - Zoom in e out',
-            '<b>Click</b> - Seleziona un elemento',
-            '<b>Hover</b> - Mostra dettagli nel pannello informativo',
-            '<b>Drag</b> - Sposta la vista quando sei in zoom',
-        ],
-
-        's3_title': 'Pannello informativo',
-        's3_p1': 'In basso a sinistra della mappa trovi il pannello informativo, diviso in due sezioni:',
-        's3_items': [
-            '<b>HOVER</b> - Mostra informazioni sull\'elemento sotto il cursore',
-            '<b>SELEZIONE</b> - Mostra informazioni sull\'elemento selezionato con click',
-        ],
-        's3_p2': 'Per ogni elemento vedi: nome, tipo, ID, e numero di collegamenti.',
-
-        's4_title': 'A cosa serve',
-        's4_p1': 'La mappa radiale e utile per:',
-        's4_items': [
-            'Vedere la distribuzione dei personaggi nella storia',
-            'Identificare scene sovraccariche (troppe linee = troppi elementi)',
-            'Scoprire elementi isolati (aspetti definiti ma mai usati)',
-            'Capire le relazioni tra elementi diversi',
-            'Avere una visione d\'insieme per decisioni strutturali',
-        ],
-    },
-
-    # =========================================================================
-    # CAPITOLO 12: EXPORT PDF, WORD E MARKDOWN
-    # =========================================================================
-    'ch12': {
-        'title': '12. Export PDF, Word e Markdown',
-
-        's1_title': 'Come esportare',
-        's1_items': [
-            'Clicca su <b>"Esporta"</b> nella barra superiore',
-            'Scegli il formato desiderato: <b>PDF</b>, <b>Word (.docx)</b> o <b>Markdown</b>',
-            'Il file viene generato e scaricato automaticamente',
-        ],
-
-        's2_title': 'Cosa viene incluso',
-        's2_items': [
-            'Pagina titolo con titolo e autore (presi dai metadati del progetto)',
-            'Capitoli con titolo in testa e interruzione di pagina',
-            'Scene separate da <b>***</b> centrato',
-            'Formattazione Markdown: grassetto, corsivo, intestazioni, liste',
-        ],
-
-        's3_title': 'Cosa viene escluso',
-        's3_items': [
-            'Frontmatter YAML (metadati tecnici)',
-            'Riferimenti [@id] agli aspetti',
-            'ID e metadati dei chunk',
-            'Annotazioni (TODO, NOTE, FIX)',
-            'Container degli aspetti e il loro contenuto',
-        ],
-
-        's4_note': '<b>In pratica:</b> l\'export contiene solo la narrativa pulita, pronta per la lettura o la stampa. Tutto il "dietro le quinte" rimane nascosto.',
-
-        's5_title': 'Formato PDF - specifiche tecniche',
-        's5_table': [
-            ['Proprieta', 'Valore'],
-            ['Formato pagina', 'A5'],
-            ['Margini', '60pt sopra, 70pt sotto, 50pt lati'],
-            ['Font', 'Roboto'],
-            ['Titolo capitolo', '18pt bold'],
-            ['Corpo testo', '11pt, giustificato'],
-            ['Interlinea', '1.4'],
-            ['Numeri pagina', 'Centrati in basso'],
-        ],
-
-        's6_title': 'Export Word (.docx)',
-        's6_p1': 'L\'export Word genera un documento .docx compatibile con Microsoft Word, LibreOffice e Google Docs. Mantiene la formattazione base (grassetto, corsivo, titoli) ed e ideale per la revisione con editor o agenti letterari.',
-
-        's7_title': 'Export Markdown',
-        's7_p1': 'L\'export Markdown genera un file .md in testo semplice. Utile per importare il testo in altri programmi (Scrivener, Obsidian, etc.) o per avere un backup testuale leggibile.',
-    },
-
-    # =========================================================================
-    # CAPITOLO 13: IMPOSTAZIONI
-    # =========================================================================
-    'ch13': {
-        'title': '13. Impostazioni',
-
-        's1_title': 'Temi',
-        's1_p1': 'Tramando include quattro temi predefiniti:',
-        's1_table': [
-            ['Tema', 'Descrizione'],
-            ['Tessuto', 'Beige caldo con texture di carta (default)'],
-            ['Dark', 'Tema scuro con accenti rosa, per scrittura notturna'],
-            ['Light', 'Tema chiaro e minimale'],
-            ['Sepia', 'Toni vintage e caldi, simula carta invecchiata'],
-        ],
-
-        's2_title': 'Autosalvataggio',
-        's2_p1': 'Uno slider ti permette di impostare l\'intervallo di autosalvataggio da 1 a 10 secondi. Il valore predefinito e 3 secondi. L\'autosalvataggio avviene dopo N secondi dall\'ultima modifica.',
-
-        's3_title': 'Lingua',
-        's3_p1': 'Tramando e disponibile in Italiano e Inglese. Il cambio lingua modifica solo l\'interfaccia; il contenuto dei tuoi progetti non viene alterato.',
-
-        's4_title': 'Import/Export impostazioni',
-        's4_p1': 'Puoi esportare le tue impostazioni in un file .edn e reimportarle su un altro dispositivo. Utile per mantenere lo stesso tema e configurazione su piu computer.',
-
-        's5_title': 'Tutorial',
-        's5_p1': 'Il pulsante "Rivedi tutorial" riapre la guida interattiva che hai visto al primo avvio. Utile se vuoi rinfrescare la memoria sulle funzionalita.',
-    },
-
-    # =========================================================================
-    # CAPITOLO 14: IL FORMATO FILE .TRMD
-    # =========================================================================
-    'ch14': {
-        'title': '14. Il formato file .trmd',
-
-        'intro': 'I file .trmd sono file di testo puro, leggibili con qualsiasi editor. Questo garantisce che i tuoi dati siano sempre accessibili, anche senza Tramando.',
-
-        's1_title': 'Struttura generale',
-        's1_items': [
-            '<b>Frontmatter YAML</b> - Metadati del progetto, racchiusi tra ---',
-            '<b>Contenuto</b> - I chunk con la loro gerarchia',
-        ],
-
-        's2_title': 'Frontmatter',
-        's2_p1': 'Il frontmatter contiene i metadati del progetto:',
-        's2_code': '''---
-title: "Il mio romanzo"
-author: "Nome Autore"
-language: "it"
-year: 2024
-isbn: ""
-publisher: ""
-custom:
-  genere: "Thriller"
----''',
-
-        's3_title': 'Sintassi chunk',
-        's3_code': '''[C:id"Titolo del chunk"][@aspetto1][@aspetto2]
-Contenuto del chunk qui...
-
-  [C:figlio"Titolo figlio"]
-  Contenuto figlio indentato con 2 spazi''',
-        's3_items': [
-            '<b>[C:id"titolo"]</b> definisce un chunk con il suo ID e titolo',
-            '<b>[@id]</b> crea un collegamento a un aspetto',
-            '<b>2 spazi</b> di indentazione = 1 livello di nidificazione',
-        ],
-
-        's4_title': 'ID riservati',
-        's4_p1': 'Alcuni ID sono riservati per i container degli aspetti:',
-        's4_items': ['personaggi', 'luoghi', 'temi', 'sequenze', 'timeline'],
-        's4_note': 'Questi ID non possono essere usati per altri elementi.',
-
-        's5_title': 'Annotazioni nel file',
-        's5_code': 'Testo con [!TODO:da completare:1:urgente] annotazione.',
-
-        's6_title': 'Metadati estesi (v2.0)',
-        's6_p1': 'A partire dalla versione 2.0, i chunk possono avere metadati aggiuntivi:',
-        's6_table': [
-            ['Sintassi', 'Significato'],
-            ['[#owner:username]', 'Proprietario del chunk (modalita collaborativa)'],
-            ['[#priority:N]', 'Priorita dell\'aspetto (0-10)'],
-            ['[!DISCUSSION:base64]', 'Discussioni codificate in base64'],
-            ['[!PROPOSAL:testo_originale:testo_proposto]', 'Proposta di modifica inline'],
-        ],
-        's6_note': '<i>Questi metadati sono usati internamente e di solito non serve modificarli a mano.</i>',
-    },
-
-    # =========================================================================
-    # CAPITOLO 15: SCORCIATOIE DA TASTIERA
-    # =========================================================================
-    'ch15': {
-        'title': '15. Scorciatoie da tastiera',
-
-        's1_table': [
-            ['Scorciatoia', 'Azione'],
-            ['Ctrl/Cmd + Z', 'Annulla (Undo)'],
-            ['Ctrl/Cmd + Shift + Z', 'Ripristina (Redo)'],
-            ['Escape', 'Chiude modali e barra ricerca'],
-            ['Ctrl/Cmd + F', 'Apre ricerca nel chunk'],
-            ['Ctrl/Cmd + H', 'Apre cerca e sostituisci'],
-            ['Ctrl/Cmd + Shift + F', 'Focus su filtro globale'],
-            ['Freccia su/giu', 'Naviga risultati ricerca'],
-            ['F3 / Shift + F3', 'Prossimo/precedente risultato'],
-        ],
-
-        's2_note': '<i>Nota: Cmd e per macOS, Ctrl e per Windows/Linux.</i>',
-
-        's3_title': 'Cronologia Undo',
-        's3_p1': 'Tramando mantiene le ultime 100 modifiche nella cronologia di undo. Puoi annullare e ripristinare liberamente con le scorciatoie sopra indicate.',
-    },
-
-    # =========================================================================
-    # CAPITOLO 16: ASSISTENTE AI
-    # =========================================================================
-    'ch16': {
-        'title': '16. Assistente AI (opzionale)',
+@functools.lru_cache(maxsize=None)
+def get_contents(lang):
+    """
+    Restituisce i contenuti di una lingua (contenuti_it.py, contenuti_en.py).
+
+    Ogni lingua viene caricata solo quando serve: generando una sola
+    versione, i testi dell'altra non vengono mai caricati. Il file si cerca
+    accanto allo script, cosi' funziona anche se il modulo e' importato da
+    un'altra directory.
+    """
+    name = f'contenuti_{lang}'
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(SCRIPT_DIR, f'{name}.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.CONTENUTI
 
+
+# =============================================================================
+# CAPITOLI
+# =============================================================================
+#
+# Ogni capitolo e' una sequenza di passi. Un passo che inizia con il nome
+# di uno stile aggiunge i paragrafi indicati con quello stile; gli altri:
+#
+#   ('bullets', key)                    lista puntata
+#   ('numbers', key)                    lista numerata
+#   ('table', key, col_widths)          tabella
+#   ('spacer', height)                  spazio verticale
+#   ('image', filename, caption, width) immagine con didascalia
+#   ('italic', style, key)              paragrafo in corsivo
+#   ('code_lines', key)                 codice su piu' righe
+#   ('each', style, key)                un paragrafo per ogni elemento
+
+CHAPTERS = (
+    # Capitolo 1: Introduzione
+    ('ch1', (
+        # Cos'e Tramando
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1', 's1_p2', 's1_p3'),
+
+        # Origine del nome
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+
+        # Filosofia
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1', 's3_p2'),
+
+        # Per chi e
+        ('SectionTitle', 's4_title'),
+        ('bullets', 's4_items'),
+    )),
+
+    # Capitolo 2: Modalita di utilizzo
+    ('ch2_modes', (
+        ('Body', 'intro'),
+
+        # Desktop
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1'),
+        ('bullets', 's1_items'),
+        ('Note', 's1_note'),
+
+        # Webapp locale
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('bullets', 's2_items'),
+
+        # Collaborativa
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('bullets', 's3_items'),
+        ('Note', 's3_note'),
+
+        # Tabella differenze
+        ('SectionTitle', 's4_title'),
+        ('table', 's4_table', (4*cm, 3*cm, 3*cm, 4*cm)),
+        ('spacer', 0.3*cm),
+
+        # Quale scegliere
+        ('SectionTitle', 's5_title'),
+        ('bullets', 's5_items'),
+    )),
+
+    # Capitolo 3: Primi passi
+    ('ch3', (
+        # Avviare
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1'),
+        ('bullets', 's1_items'),
+        ('spacer', 0.3*cm),
+        ('image', 'splash_tauri.png', 'splash_tauri', 13*cm),
+
+        # Primo progetto
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1', 's2_p2'),
+
+        # Salvare
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1', 's3_p2'),
+        ('Note', 's3_tip'),
+
+        # Versioni e backup
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+        ('bullets', 's4_items'),
+        ('Body', 's4_p2'),
+        ('Note', 's4_note'),
+    )),
+
+    # Capitolo 4: Cos'e il markup
+    ('ch4', (
+        ('Body', 'intro'),
+
+        # Formattazione vs markup
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1', 's1_p2'),
+        ('CodeBlock', 's1_code'),
+        ('Body', 's1_result'),
+
+        # Perche markup
+        ('SectionTitle', 's2_title'),
+        ('bullets', 's2_items'),
+
+        # Markdown
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1', 's3_table_title'),
+        ('spacer', 0.2*cm),
+        ('table', 's3_table', (5*cm, 4*cm, 5*cm)),
+        ('spacer', 0.3*cm),
+
+        # Markup Tramando
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+        ('spacer', 0.2*cm),
+        ('table', 's4_table', (4.5*cm, 6*cm, 5*cm)),
+        ('spacer', 0.3*cm),
+
+        # Rassicurazione
+        ('SectionTitle', 's5_title'),
+        ('Body', 's5_p1'),
+        ('Note', 's5_tip'),
+    )),
+
+    # Capitolo 5: L'interfaccia
+    ('ch5', (
+        ('image', 'main.png', 'main', 16*cm),
+
+        # Barra superiore
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1'),
+        ('bullets', 's1_items'),
+
+        # Sidebar
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('SubsectionTitle', 's2_sub1'),
+        ('Body', 's2_sub1_p'),
+        ('SubsectionTitle', 's2_sub2'),
+        ('Body', 's2_sub2_p'),
+        ('SubsectionTitle', 's2_sub3'),
+        ('Body', 's2_sub3_p'),
+
+        # Editor
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('bullets', 's3_items'),
+        ('Body', 's3_p2'),
+    )),
+
+    # Capitolo 6: La Struttura narrativa
+    ('ch6', (
+        # Organizzazione
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1', 's1_p2'),
+
+        # Creare elementi
+        ('SectionTitle', 's2_title'),
+        ('bullets', 's2_items'),
+
+        # Numerazione
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('spacer', 0.2*cm),
+        ('table', 's3_table', (4*cm, 5*cm, 5*cm)),
+        ('spacer', 0.3*cm),
+        ('Note', 's3_example'),
+    )),
+
+    # Capitolo 7: Gli Aspetti
+    ('ch7', (
+        ('Body', 'intro'),
+
+        # Personaggi
+        ('SectionTitle', 's1_title'),
+        ('italic', 'Note', 's1_color'),
+        ('Body', 's1_p1', 's1_p2'),
+
+        # Luoghi
+        ('SectionTitle', 's2_title'),
+        ('italic', 'Note', 's2_color'),
+        ('Body', 's2_p1', 's2_p2'),
+
+        # Temi
+        ('SectionTitle', 's3_title'),
+        ('italic', 'Note', 's3_color'),
+        ('Body', 's3_p1', 's3_p2'),
+
+        # Sequenze
+        ('SectionTitle', 's4_title'),
+        ('italic', 'Note', 's4_color'),
+        ('Body', 's4_p1', 's4_p2'),
+
+        # Timeline
+        ('SectionTitle', 's5_title'),
+        ('italic', 'Note', 's5_color'),
+        ('Body', 's5_p1', 's5_p2'),
+        ('Note', 's5_tip'),
+
+        # Creare aspetti
+        ('SectionTitle', 's6_title'),
+        ('Body', 's6_p1'),
+
+        # Priorita (v2.0)
+        ('SectionTitle', 's7_title'),
+        ('Body', 's7_p1'),
+        ('bullets', 's7_items'),
+        ('spacer', 0.3*cm),
+        ('image', 'priority_editor.png', 'priority_editor', 10*cm),
+
+        # Filtro soglia (v2.0)
+        ('SectionTitle', 's8_title'),
+        ('Body', 's8_p1'),
+        ('bullets', 's8_items'),
+        ('spacer', 0.3*cm),
+        ('image', 'priority_sidebar.png', 'priority_sidebar', 8*cm),
+        ('Note', 's8_tip'),
+    )),
+
+    # Capitolo 8: I collegamenti
+    ('ch8', (
+        ('Body', 'intro'),
+
+        # Sintassi [@id]
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1', 's1_p2'),
+
+        # Metodo tag
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('numbers', 's2_items'),
+        ('Body', 's2_p2'),
+
+        # Tab Usato da
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+
+        # Conteggio
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+
+        # Best practices
+        ('SectionTitle', 's5_title'),
+        ('bullets', 's5_items'),
+    )),
+
+    # Capitolo 9: Le annotazioni
+    ('ch9', (
+        ('Body', 'intro'),
+
+        # Tipi
+        ('SectionTitle', 's1_title'),
+        ('bullets', 's1_items'),
+
+        # Creare
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('numbers', 's2_items'),
+
+        # Sintassi
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('CodeBlock', 's3_code'),
+        ('Body', 's3_examples_title'),
+        ('each', 'CodeBlock', 's3_examples'),
+
+        # Pannello
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1', 's4_p2'),
+
+        # Nota importante
+        ('spacer', 0.3*cm),
+        ('Note', 's5_note'),
+    )),
+
+    # Capitolo 10: Cerca e sostituisci
+    ('ch10', (
+        ('image', 'filter.png', 'filter', 14*cm),
+        ('Body', 'intro'),
+
+        # Filtro globale
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1'),
+        ('bullets', 's1_features'),
+
+        # Ricerca locale
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('bullets', 's2_features'),
+
+        # Sostituisci
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('bullets', 's3_features'),
+
+        # Regex
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+        ('bullets', 's4_examples'),
+    )),
+
+    # Capitolo 11: La mappa radiale
+    ('ch11', (
+        ('image', 'map.png', 'map', 14*cm),
+        ('Body', 'intro'),
+
+        # Leggere la mappa
+        ('SectionTitle', 's1_title'),
+        ('bullets', 's1_items'),
+
+        # Interazione
+        ('SectionTitle', 's2_title'),
+        ('bullets', 's2_items'),
+
+        # Pannello info
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('bullets', 's3_items'),
+        ('Body', 's3_p2'),
+
+        # A cosa serve
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+        ('bullets', 's4_items'),
+    )),
+
+    # Capitolo 12: Export PDF, Word e Markdown
+    ('ch12', (
+        # Come esportare
+        ('SectionTitle', 's1_title'),
+        ('numbers', 's1_items'),
+
+        # Cosa incluso
+        ('SectionTitle', 's2_title'),
+        ('bullets', 's2_items'),
+
+        # Cosa escluso
+        ('SectionTitle', 's3_title'),
+        ('bullets', 's3_items'),
+
+        ('Note', 's4_note'),
+
+        # Formato PDF tecnico
+        ('SectionTitle', 's5_title'),
+        ('table', 's5_table', (6*cm, 8*cm)),
+        ('spacer', 0.3*cm),
+
+        # Word
+        ('SectionTitle', 's6_title'),
+        ('Body', 's6_p1'),
+
+        # Markdown
+        ('SectionTitle', 's7_title'),
+        ('Body', 's7_p1'),
+    )),
+
+    # Capitolo 13: Impostazioni
+    ('ch13', (
+        ('image', 'settings.png', 'settings', 10*cm),
+
+        # Temi
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1'),
+        ('table', 's1_table', (4*cm, 10*cm)),
+        ('spacer', 0.3*cm),
+
+        # Autosave
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+
+        # Lingua
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+
+        # Import/Export
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+
+        # Tutorial
+        ('SectionTitle', 's5_title'),
+        ('Body', 's5_p1'),
+    )),
+
+    # Capitolo 14: Il formato file .trmd
+    ('ch14', (
+        ('Body', 'intro'),
+
+        # Struttura generale
+        ('SectionTitle', 's1_title'),
+        ('bullets', 's1_items'),
+
+        # Frontmatter
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('code_lines', 's2_code'),
+
+        # Sintassi chunk
+        ('SectionTitle', 's3_title'),
+        ('code_lines', 's3_code'),
+        ('bullets', 's3_items'),
+
+        # ID riservati
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+        ('bullets', 's4_items'),
+        ('Note', 's4_note'),
+
+        # Annotazioni
+        ('SectionTitle', 's5_title'),
+        ('CodeBlock', 's5_code'),
+
+        # Metadati estesi (v2.0)
+        ('SectionTitle', 's6_title'),
+        ('Body', 's6_p1'),
+        ('table', 's6_table', (6*cm, 8*cm)),
+        ('spacer', 0.3*cm),
+        ('Note', 's6_note'),
+    )),
+
+    # Capitolo 15: Scorciatoie da tastiera
+    ('ch15', (
+        ('table', 's1_table', (6*cm, 8*cm)),
+        ('spacer', 0.3*cm),
+
+        ('Note', 's2_note'),
+
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+    )),
+
+    # Capitolo 16: Assistente AI
+    ('ch16', (
         # Introduzione
-        's1_title': 'Introduzione',
-        's1_p1': 'L\'Assistente AI e una funzionalita completamente opzionale. Tramando funziona perfettamente senza, e molti scrittori preferiscono lavorare senza supporto AI. Se non ti interessa, puoi semplicemente ignorare questo capitolo.',
-        's1_p2': 'Se decidi di provarlo, sappi che l\'approccio di Tramando e non invasivo: l\'AI propone, tu decidi sempre. Nessuna modifica automatica al tuo testo. Ogni suggerimento passa attraverso la tua approvazione. Puoi disabilitarlo in qualsiasi momento.',
-        's1_items': [
-            'Superare blocchi creativi',
-            'Esplorare varianti di una frase',
-            'Generare bozze di schede personaggio',
-            'Verificare coerenza narrativa',
-        ],
-        's1_note': '<i>Ricorda: l\'AI e uno strumento, non un co-autore. La storia resta tua.</i>',
+        ('SectionTitle', 's1_title'),
+        ('Body', 's1_p1', 's1_p2'),
+        ('bullets', 's1_items'),
+        ('Note', 's1_note'),
 
         # Configurazione
-        's2_title': 'Configurazione',
-        's2_p1': 'Per abilitare l\'Assistente AI, vai in Impostazioni (icona ingranaggio) e trova la sezione "Assistente AI". Spunta "Abilita assistente AI" per attivare la funzionalita.',
-        's2_sub1': 'Scegliere un provider',
-        's2_table': [
-            ['Provider', 'Costo', 'Pro', 'Contro'],
-            ['Ollama', 'Gratuito', 'Locale, privato', 'Richiede installazione'],
-            ['Groq', 'Gratuito', 'Veloce, modelli buoni', 'Limiti di utilizzo'],
-            ['Anthropic', 'A pagamento', 'Modelli eccellenti', '~$3/milione token'],
-            ['OpenAI', 'A pagamento', 'Modelli eccellenti', '~$2.50/milione token'],
-        ],
-        's2_sub2': 'Ollama (gratuito, locale)',
-        's2_ollama': 'Ollama esegue modelli AI sul tuo computer. Nessun dato esce dalla tua macchina. Installa Ollama da ollama.ai, avvialo, seleziona "Ollama (locale)" in Tramando, e scarica un modello con: ollama pull llama3.2',
-        's2_sub3': 'Groq (gratuito, cloud)',
-        's2_groq': 'Groq offre API gratuite con modelli Llama veloci. Registrati su console.groq.com, crea una API Key, e incollala in Tramando selezionando "Groq (Llama, veloce)".',
-        's2_sub4': 'Anthropic e OpenAI (a pagamento)',
-        's2_paid': 'Per Anthropic (Claude) registrati su console.anthropic.com, per OpenAI su platform.openai.com. Aggiungi credito ($5 minimo), crea una API key e incollala in Tramando. Per un uso normale spenderai pochi centesimi al giorno.',
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('SubsectionTitle', 's2_sub1'),
+        ('table', 's2_table', (3*cm, 3*cm, 4*cm, 4*cm)),
+        ('spacer', 0.3*cm),
+        ('SubsectionTitle', 's2_sub2'),
+        ('Body', 's2_ollama'),
+        ('SubsectionTitle', 's2_sub3'),
+        ('Body', 's2_groq'),
+        ('SubsectionTitle', 's2_sub4'),
+        ('Body', 's2_paid'),
 
         # Usare AI senza API
-        's3_title': 'Usare l\'AI senza API',
-        's3_p1': 'Se non vuoi configurare API, puoi usare Tramando con la chat di Claude (claude.ai) o ChatGPT (chat.openai.com) usando un workflow manuale.',
-        's3_items': [
-            '<b>Passo 1</b>: Seleziona testo, apri il pannello AI, scrivi la richiesta',
-            '<b>Passo 2</b>: Clicca "Copia per chat" - il prompt viene copiato negli appunti',
-            '<b>Passo 3</b>: Incolla nella chat esterna, aspetta la risposta, copiala',
-            '<b>Passo 4</b>: Torna in Tramando, clicca "Inietta risposta", incolla e conferma',
-        ],
-        's3_note': 'Tramando processera la risposta come se fosse arrivata via API.',
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('bullets', 's3_items'),
+        ('Note', 's3_note'),
 
         # Il pannello
-        's4_title': 'Il pannello Assistente AI',
-        's4_p1': 'Il pannello si apre con il pulsante AI nella barra superiore o la scorciatoia Ctrl+Shift+A (Cmd+Shift+A su Mac).',
-        's4_items': [
-            '<b>Area chat</b>: mostra la conversazione con l\'AI',
-            '<b>Campo input</b>: scrivi la tua richiesta',
-            '<b>Selettore contesto</b>: scegli quali informazioni inviare all\'AI',
-            '<b>Indicatore parole</b>: mostra la dimensione del contesto (verde/giallo/rosso)',
-        ],
-        's4_sub1': 'Il selettore contesto',
-        's4_context': 'L\'AI lavora meglio con contesto sulla tua storia. Preset rapidi: <b>Minimo</b> (solo chunk corrente), <b>Scena</b> (+ personaggi/luoghi collegati), <b>Narrativo</b> (+ sequenze/timeline), <b>Completo</b> (tutto). Puoi anche personalizzare le singole opzioni.',
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+        ('bullets', 's4_items'),
+        ('SubsectionTitle', 's4_sub1'),
+        ('Body', 's4_context'),
 
         # Azioni AI
-        's5_title': 'Azioni AI disponibili',
-        's5_p1': 'Seleziona del testo nell\'editor, fai click destro, e scegli "Assistente AI":',
-        's5_sub1': 'Azioni che propongono alternative',
-        's5_items1': [
-            '<b>Espandi/sviluppa</b>: arricchisce il testo con dettagli',
-            '<b>Riformula</b>: propone versioni alternative',
-            '<b>Rendi piu...</b>: cambia il tono (cupo, leggero, formale, colloquiale, poetico)',
-        ],
-        's5_sub2': 'Azioni che rispondono in chat',
-        's5_items2': [
-            '<b>Suggerisci conflitto</b>: propone tensioni narrative',
-            '<b>Analizza coerenza</b>: cerca incongruenze',
-        ],
-        's5_sub3': 'Azioni su aspetti',
-        's5_items3': [
-            '<b>Crea scheda personaggio/luogo</b>: genera una scheda dal testo',
-            '<b>Estrai info per...</b>: arricchisce una scheda esistente con nuove informazioni',
-        ],
+        ('SectionTitle', 's5_title'),
+        ('Body', 's5_p1'),
+        ('SubsectionTitle', 's5_sub1'),
+        ('bullets', 's5_items1'),
+        ('SubsectionTitle', 's5_sub2'),
+        ('bullets', 's5_items2'),
+        ('SubsectionTitle', 's5_sub3'),
+        ('bullets', 's5_items3'),
 
         # Annotazioni AI
-        's6_title': 'Le annotazioni AI',
-        's6_p1': 'Quando chiedi all\'AI di riformulare o espandere del testo, Tramando crea un\'annotazione speciale.',
-        's6_flow': [
-            'Selezioni testo e chiedi "Riformula"',
-            'Appare un\'annotazione [!NOTE:testo:AI:] nel testo',
-            'La richiesta viene inviata (o la copi per chat esterna)',
-            'Quando arriva la risposta, l\'annotazione diventa [!NOTE:testo:AI-DONE:...]',
-            'Le alternative proposte sono memorizzate nell\'annotazione',
-        ],
-        's6_sub1': 'Scegliere un\'alternativa',
-        's6_choose': 'Fai click destro sull\'annotazione. Appare un menu con le alternative (radio button). Seleziona quella che preferisci, poi "Applica selezione" per sostituire il testo, o "Annulla modifiche" per tornare all\'originale.',
-        's6_note': 'Puoi cambiare idea quante volte vuoi prima di confermare.',
+        ('SectionTitle', 's6_title'),
+        ('Body', 's6_p1'),
+        ('bullets', 's6_flow'),
+        ('SubsectionTitle', 's6_sub1'),
+        ('Body', 's6_choose'),
+        ('Note', 's6_note'),
 
         # Consigli
-        's7_title': 'Consigli per risultati migliori',
-        's7_items': [
-            '<b>Contesto giusto</b>: Minimo per riformulare, Scena per sviluppare, Completo per coerenza',
-            '<b>Modello giusto</b>: modelli grandi (70B, Claude, GPT-4) per task complessi',
-            '<b>L\'AI come assistente</b>: usa l\'AI per esplorare possibilita, non per scrivere al posto tuo',
-            '<b>Prompt migliori</b>: sii specifico, dai contesto, chiedi alternative',
-        ],
-    },
-
-    # =========================================================================
-    # CAPITOLO 17: MODALITA COLLABORATIVA
-    # =========================================================================
-    'ch17': {
-        'title': '17. Modalita collaborativa',
-
-        'intro': 'La modalita collaborativa permette a piu autori di lavorare insieme sullo stesso progetto. Questa funzionalita richiede un server Tramando e un account utente.',
-
-        's1_title': 'Requisiti',
-        's1_items': [
-            'Un server Tramando attivo (self-hosted o in cloud)',
-            'Un account utente sul server',
-            'Connessione internet durante il lavoro',
-        ],
-
-        's2_title': 'Login e progetti',
-        's2_p1': 'Dalla schermata di benvenuto, nella sezione <b>Server</b>, inserisci le credenziali del tuo account. Dopo il login vedrai la lista dei progetti a cui hai accesso.',
-        's2_items': [
-            '<b>I tuoi progetti</b> - Progetti creati da te',
-            '<b>Progetti condivisi</b> - Progetti a cui sei stato invitato come collaboratore',
-        ],
-
-        's3_title': 'Ruoli e permessi',
-        's3_p1': 'In ogni progetto collaborativo ci sono tre ruoli:',
-        's3_table': [
-            ['Ruolo', 'Permessi'],
-            ['Owner', 'Controllo totale: modifica tutto, gestisce collaboratori, trasferisce ownership'],
-            ['Admin', 'Puo modificare tutto, ma non gestisce collaboratori'],
-            ['Collaborator', 'Puo modificare solo i chunk di cui e owner'],
-        ],
-
-        's4_title': 'Ownership dei chunk',
-        's4_p1': 'In modalita collaborativa, ogni chunk ha un <b>owner</b> (proprietario). Questo determina chi puo modificare il contenuto:',
-        's4_items': [
-            'Quando crei un nuovo chunk, ne diventi automaticamente l\'owner',
-            'Solo l\'owner, un Admin o l\'Owner del progetto possono modificare un chunk',
-            'L\'ownership puo essere trasferita ad un altro collaboratore',
-            'Nell\'editor, il campo "Owner" mostra chi possiede il chunk',
-        ],
-
-        's5_title': 'Proposte (PROPOSAL)',
-        's5_p1': 'Se non sei l\'owner di un chunk ma vuoi suggerire una modifica, puoi creare una <b>proposta</b>:',
-        's5_items': [
-            'Seleziona il testo che vuoi modificare',
-            'Usa il menu contestuale e scegli "Proponi modifica"',
-            'Scrivi il testo alternativo che suggerisci',
-            'La proposta apparira evidenziata nel testo',
-        ],
-        's5_p2': 'L\'owner del chunk vedra la proposta e potra <b>accettarla</b> (il testo viene sostituito) o <b>rifiutarla</b> (la proposta viene rimossa).',
-
-        's6_title': 'Discussioni',
-        's6_p1': 'Ogni chunk ha una sezione <b>Discussion</b> dove i collaboratori possono lasciare commenti e discutere del contenuto senza modificare il testo principale.',
-        's6_items': [
-            'Clicca sulla tab "Discussion" nell\'editor',
-            'Scrivi il tuo commento nel campo in basso',
-            'I messaggi mostrano l\'autore e la data',
-            'Utile per feedback, domande, o coordinamento',
-        ],
-
-        's7_title': 'Chat di progetto',
-        's7_p1': 'Nella barra superiore, il pulsante <b>chat</b> (icona fumetto) apre la chat generale del progetto. Qui puoi comunicare con tutti i collaboratori in tempo reale, indipendentemente dal chunk su cui stai lavorando.',
-
-        's8_title': 'Sincronizzazione',
-        's8_p1': 'Le modifiche vengono sincronizzate automaticamente con il server. Nella barra superiore vedrai un indicatore di stato:',
-        's8_items': [
-            '<b>Sincronizzato</b> - Tutte le modifiche sono state salvate',
-            '<b>In sync...</b> - Sincronizzazione in corso',
-            '<b>Errore</b> - Problema di connessione (riprova o controlla la rete)',
-        ],
-
-        's9_title': 'Gestire i collaboratori',
-        's9_p1': 'Se sei l\'Owner del progetto, puoi gestire i collaboratori:',
-        's9_items': [
-            'Clicca sull\'icona collaboratori nella barra superiore',
-            'Per aggiungere: inserisci username e seleziona il ruolo',
-            'Per rimuovere: clicca sulla X accanto al nome',
-            'Per cambiare ruolo: usa il dropdown accanto al nome',
-        ],
-        's9_note': '<i>Solo l\'Owner del progetto puo aggiungere o rimuovere collaboratori.</i>',
-    },
-
-    # =========================================================================
-    # APPENDICE
-    # =========================================================================
-    'appendix': {
-        'title': 'Appendice: Riferimento rapido',
-
-        's1_title': 'Sintassi base',
-        's1_table': [
-            ['Elemento', 'Sintassi'],
-            ['Chunk', '[C:id"Titolo"]'],
-            ['Riferimento aspetto', '[@id]'],
-            ['TODO', '[!TODO:testo:priorita:commento]'],
-            ['NOTE', '[!NOTE:testo:priorita:commento]'],
-            ['FIX', '[!FIX:testo:priorita:commento]'],
-            ['Numero arabo', '[:ORD]'],
-            ['Romano maiuscolo', '[:ORD-ROM]'],
-            ['Romano minuscolo', '[:ORD-rom]'],
-            ['Lettera maiuscola', '[:ORD-ALPHA]'],
-            ['Lettera minuscola', '[:ORD-alpha]'],
-        ],
-
-        's1b_title': 'Sintassi v2.0',
-        's1b_table': [
-            ['Elemento', 'Sintassi'],
-            ['Owner chunk', '[#owner:username]'],
-            ['Priorita aspetto', '[#priority:N]'],
-            ['Proposta', '[!PROPOSAL:originale:proposto]'],
-            ['Discussione', '[!DISCUSSION:base64]'],
-        ],
-
-        's2_title': 'ID riservati',
-        's2_table': [
-            ['ID', 'Tipo'],
-            ['personaggi', 'Container personaggi'],
-            ['luoghi', 'Container luoghi'],
-            ['temi', 'Container temi'],
-            ['sequenze', 'Container sequenze'],
-            ['timeline', 'Container timeline'],
-        ],
-
-        's3_title': 'Colori mappa',
-        's3_table': [
-            ['Tipo', 'Colore', 'Hex'],
-            ['Struttura', 'Blu', '#4a90c2'],
-            ['Personaggi', 'Rosso', '#c44a4a'],
-            ['Luoghi', 'Verde', '#4a9a6a'],
-            ['Temi', 'Arancione', '#b87333'],
-            ['Sequenze', 'Viola', '#8a5ac2'],
-            ['Timeline', 'Blu', '#4a90c2'],
-        ],
-
-        's4_title': 'Limiti tecnici',
-        's4_items': [
-            'Cronologia Undo: 100 stati',
-            'Numeri romani: 1-3999',
-            'I progetti .trmd sono file di testo salvati su disco. Non c\'e limite pratico alla dimensione: un romanzo completo con tutti gli aspetti occupa tipicamente meno di 1 MB.',
-        ],
-
-        'footer': 'Tramando - Tessi la tua storia',
-    },
-}
-
-# =============================================================================
-# CONTENUTI ENGLISH
-# =============================================================================
+        ('SectionTitle', 's7_title'),
+        ('bullets', 's7_items'),
+    )),
+
+    # Capitolo 17: Modalita collaborativa
+    ('ch17', (
+        ('Body', 'intro'),
+
+        # Requisiti
+        ('SectionTitle', 's1_title'),
+        ('bullets', 's1_items'),
+
+        # Login e progetti
+        ('SectionTitle', 's2_title'),
+        ('Body', 's2_p1'),
+        ('bullets', 's2_items'),
+
+        # Ruoli e permessi
+        ('SectionTitle', 's3_title'),
+        ('Body', 's3_p1'),
+        ('table', 's3_table', (3*cm, 11*cm)),
+        ('spacer', 0.3*cm),
+
+        # Ownership
+        ('SectionTitle', 's4_title'),
+        ('Body', 's4_p1'),
+        ('bullets', 's4_items'),
+
+        # Proposte
+        ('SectionTitle', 's5_title'),
+        ('Body', 's5_p1'),
+        ('numbers', 's5_items'),
+        ('Body', 's5_p2'),
+
+        # Discussioni
+        ('SectionTitle', 's6_title'),
+        ('Body', 's6_p1'),
+        ('bullets', 's6_items'),
+
+        # Chat
+        ('SectionTitle', 's7_title'),
+        ('Body', 's7_p1'),
+
+        # Sincronizzazione
+        ('SectionTitle', 's8_title'),
+        ('Body', 's8_p1'),
+        ('bullets', 's8_items'),
+
+        # Gestire collaboratori
+        ('SectionTitle', 's9_title'),
+        ('Body', 's9_p1'),
+        ('bullets', 's9_items'),
+        ('Note', 's9_note'),
+    )),
+
+    # Appendice: Riferimento rapido
+    ('appendix', (
+        # Sintassi base
+        ('SectionTitle', 's1_title'),
+        ('table', 's1_table', (5*cm, 9*cm)),
+        ('spacer', 0.3*cm),
+
+        # Sintassi v2.0
+        ('SectionTitle', 's1b_title'),
+        ('table', 's1b_table', (5*cm, 9*cm)),
+        ('spacer', 0.5*cm),
+
+        # ID riservati
+        ('SectionTitle', 's2_title'),
+        ('table', 's2_table', (5*cm, 9*cm)),
+        ('spacer', 0.5*cm),
+
+        # Colori mappa
+        ('SectionTitle', 's3_title'),
+        ('table', 's3_table', (4*cm, 4*cm, 4*cm)),
+        ('spacer', 0.5*cm),
+
+        # Limiti
+        ('SectionTitle', 's4_title'),
+        ('bullets', 's4_items'),
+
+        # Footer
+        ('spacer', 2*cm),
+        ('italic', 'Caption', 'footer'),
+    )),
+)
 
-EN = {
-    'filename': 'Tramando_Manual_English.pdf',
-    'tagline': 'Weave your story',
-    'manual_title': 'User Manual',
-    'version': 'Version 2.0',
-    'toc_title': 'Contents',
-
-    'chapters': [
-        '1. Introduction',
-        '2. Usage Modes',
-        '3. Getting Started',
-        '4. What is Markup',
-        '5. The Interface',
-        '6. Narrative Structure',
-        '7. Aspects',
-        '8. Connections',
-        '9. Annotations',
-        '10. Search and Replace',
-        '11. Radial Map',
-        '12. PDF, Word and Markdown Export',
-        '13. Settings',
-        '14. The .trmd File Format',
-        '15. Keyboard Shortcuts',
-        '16. AI Assistant (optional)',
-        '17. Collaborative Mode',
-        'Appendix: Quick Reference',
-    ],
-
-    'captions': {
-        'splash_tauri': 'The welcome screen (desktop version)',
-        'splash_webapp': 'The welcome screen (webapp with login)',
-        'main': 'Tramando\'s main interface',
-        'filter': 'Global filter and search in action',
-        'map': 'The radial map with connections between elements',
-        'settings': 'The settings panel',
-        'priority_sidebar': 'The priority threshold widget in the sidebar',
-        'priority_editor': 'The priority field in the aspect editor',
-    },
-
-    # =========================================================================
-    # CHAPTER 1: INTRODUCTION
-    # =========================================================================
-    'ch1': {
-        'title': '1. Introduction',
-
-        's1_title': 'What is Tramando',
-        's1_p1': 'Tramando is a tool designed for writers who need to manage complex stories. Whether you\'re writing a novel with dozens of characters, a screenplay with multiple narrative threads, or building an imaginary world with its own history and geography, Tramando helps you keep everything under control.',
-        's1_p2': 'Unlike a regular word processor, Tramando doesn\'t just let you write text. It lets you organize your story into modular blocks called "chunks", define characters, places and themes as separate entities, and connect them together to see how they interweave in the narrative.',
-        's1_p3': 'The result is an overview of your work that would be impossible to achieve with traditional tools: you can see in which scenes a character appears, track the development of a theme through chapters, or verify timeline consistency.',
-
-        's2_title': 'The Origin of the Name',
-        's2_p1': 'The name "Tramando" comes from a play on words in Italian. On one hand there\'s <b>trama</b> (plot), because writing is essentially weaving narrative threads, intertwining stories and destinies. On the other hand there\'s <b>tramando</b> (plotting), which evokes the sense of planning something, perhaps even a crime. As someone said, the difference between a writer and a murderer is thin: the former simply doesn\'t execute the plan.',
-
-        's3_title': 'The Philosophy: Everything is a Chunk',
-        's3_p1': 'In Tramando, the basic unit is the <b>chunk</b>: a block of text with a title and its own identity. A chapter is a chunk. A scene is a chunk. But also a character is a chunk, a place is a chunk, even a single note can be a chunk.',
-        's3_p2': 'Chunks can contain other chunks, creating a completely flexible tree structure. There are no rigid rules on how to organize your work: you can have Book > Part > Chapter > Scene, or simply a flat list of scenes. Tramando adapts to your way of thinking and writing, not the other way around.',
-
-        's4_title': 'Who is Tramando For',
-        's4_items': [
-            '<b>Novelists</b> managing large casts and intertwined plots, who need to track who appears where and when',
-            '<b>Screenwriters</b> who need to keep track of scenes, characters, and narrative arcs across multiple episodes or acts',
-            '<b>Series authors</b> who must maintain consistency across volumes, remembering details established in previous books',
-            '<b>Worldbuilders</b> constructing complex worlds with their own history, geography, and cast of characters',
-            'Anyone writing stories with <b>many interconnected elements</b> who wants a tool to visualize and manage them',
-        ],
-    },
-
-    # =========================================================================
-    # CHAPTER 2: USAGE MODES
-    # =========================================================================
-    'ch2_modes': {
-        'title': '2. Usage Modes',
-
-        'intro': 'Tramando is available in three different modes, each designed for specific needs. You can choose the one that best fits your workflow.',
-
-        's1_title': 'Desktop Application (Tauri)',
-        's1_p1': 'The desktop version is a native application for <b>Mac</b>, <b>Windows</b>, and <b>Linux</b>. It works completely offline and saves your projects as .trmd files on your computer.',
-        's1_items': [
-            '<b>Works offline</b> - No internet connection required',
-            '<b>Local files</b> - Projects are saved on your disk as .trmd files',
-            '<b>Native performance</b> - Fast and responsive interface',
-            '<b>System integration</b> - Full support for shortcuts, drag&drop, and file management',
-        ],
-        's1_note': 'This is the recommended version for most users.',
-
-        's2_title': 'Local Webapp',
-        's2_p1': 'You can also use Tramando directly in your browser by opening the webapp on a local server. This mode is identical to desktop but requires a modern browser.',
-        's2_items': [
-            '<b>No installation</b> - Just a web browser',
-            '<b>Local files</b> - Save to disk via browser API',
-            '<b>Cross-platform</b> - Works on any system with a modern browser',
-        ],
-
-        's3_title': 'Collaborative Webapp',
-        's3_p1': 'The collaborative mode allows multiple people to work on the same project. It requires a Tramando server (self-hosted or cloud).',
-        's3_items': [
-            '<b>Real-time collaboration</b> - Multiple authors on the same project',
-            '<b>Role management</b> - Owner, Admin and Collaborator with different permissions',
-            '<b>Chunk ownership</b> - Each chunk has an owner who can be transferred',
-            '<b>Proposals and discussions</b> - System for suggesting changes',
-            '<b>Integrated chat</b> - Communication between collaborators for each chunk',
-        ],
-        's3_note': 'For details on collaborative mode, see the dedicated chapter.',
-
-        's4_title': 'Main Differences',
-        's4_table': [
-            ['Feature', 'Desktop', 'Local Webapp', 'Collaborative'],
-            ['Connection', 'Offline', 'Offline', 'Required'],
-            ['Saving', '.trmd file', '.trmd file', 'Server'],
-            ['Versions/Backup', 'Yes', 'Yes', 'No (server)'],
-            ['Collaboration', 'No', 'No', 'Yes'],
-            ['Ownership', 'No', 'No', 'Yes'],
-            ['Chat', 'No', 'No', 'Yes'],
-            ['Proposals', 'No', 'No', 'Yes'],
-        ],
-
-        's5_title': 'Which one to choose?',
-        's5_items': [
-            '<b>Writing alone?</b> - Use the desktop application',
-            '<b>Don\'t want to install anything?</b> - Use the local webapp',
-            '<b>Working in a team?</b> - Use collaborative mode',
-        ],
-    },
-
-    # =========================================================================
-    # CHAPTER 3: GETTING STARTED
-    # =========================================================================
-    'ch3': {
-        'title': '3. Getting Started',
-
-        's1_title': 'Launching Tramando',
-        's1_p1': 'Tramando is available as a desktop application for Mac, Windows, and Linux. Once installed and launched, you\'ll be greeted by the welcome screen with three clear options to get started:',
-        's1_items': [
-            '<b>Continue current work</b> - Automatically resumes the last project you were working on, exactly where you left off',
-            '<b>New project</b> - Creates a completely empty project, ready to welcome your new story',
-            '<b>Open file...</b> - Lets you load an existing .trmd file from your computer',
-        ],
-
-        's2_title': 'Your First Project',
-        's2_p1': 'When you create a new project, Tramando presents a clean and intuitive interface, divided into two main areas. On the left you\'ll find the <b>sidebar</b>, which contains your project structure: here you\'ll see the tree of your chapters, scenes, and all story elements grow.',
-        's2_p2': 'On the right is the <b>editor</b>, the space where you actually write and edit content. The editor includes advanced features like syntax highlighting for markup, line numbers, and the ability to quickly switch from writing mode to reading mode.',
-
-        's3_title': 'Saving Your Work',
-        's3_p1': 'Tramando automatically saves your work every few seconds. You can configure the autosave interval in settings, choosing a value between 1 and 10 seconds. This means you\'ll never lose more than a few seconds of work even in case of a crash or accidental closure.',
-        's3_p2': 'In addition to autosave, you can manually save to a file by clicking the <b>Save</b> button in the top bar. The file will have a <b>.trmd</b> extension and will be a readable text file, which you can also open with a regular text editor if needed.',
-        's3_tip': '<i>Tip: even with autosave active, it\'s good practice to save to file regularly. This way you\'ll always have an external backup you can copy to cloud or USB drive.</i>',
-
-        's4_title': 'Versions and Backup',
-        's4_p1': 'Tramando includes a complete version management system. Next to the Save buttons you\'ll find a <b>Version</b> dropdown menu with three options:',
-        's4_items': [
-            '<b>Save version</b> - Creates a snapshot of your work with date/time and an optional description. Useful before major changes or to mark significant milestones.',
-            '<b>Version list</b> - Shows all saved versions. For each version you can: <b>Open copy</b> (opens the version as a new unsaved document, without touching the current file) or <b>Restore</b> (replaces the current file with the selected version, first creating an automatic backup).',
-            '<b>Restore backup</b> - Recovers the last automatic backup. Tramando creates a .backup file every time you save, allowing you to return to the previous state.',
-        ],
-        's4_p2': 'When the document has unsaved changes, a <b>dot</b> appears next to the filename in the top bar. This indicator reminds you that there are changes to save.',
-        's4_note': '<i>Note: versions are saved in the application data folder, not next to the original file. This ensures compatibility with cloud folders like iCloud.</i>',
-    },
-
-    # =========================================================================
-    # CHAPTER 4: WHAT IS MARKUP
-    # =========================================================================
-    'ch4': {
-        'title': '4. What is Markup',
-
-        'intro': 'If you\'ve always used programs like Microsoft Word or Google Docs, you may have never heard of "markup". Don\'t worry: it\'s a simple concept that, once understood, will seem natural and powerful.',
-
-        's1_title': 'Visual Formatting vs Markup',
-        's1_p1': 'In Word, when you want to make a word bold, you select it with the mouse and click the B button in the toolbar. This approach is called <b>visual formatting</b> or WYSIWYG (What You See Is What You Get): what you see on screen is exactly what you get.',
-        's1_p2': 'With <b>markup</b>, instead, you insert special symbols directly into the text. These symbols are then interpreted and transformed into the desired formatting. For example, instead of clicking a button for bold, you write:',
-        's1_code': 'This word is **important**',
-        's1_result': 'And the result will be: This word is <b>important</b>',
-
-        's2_title': 'Why Use Markup?',
-        's2_items': [
-            '<b>Speed</b> - You never have to take your hands off the keyboard to search for buttons or menus. You write and format in a continuous flow',
-            '<b>Portability</b> - Files are pure text, readable on any device and with any program',
-            '<b>Control</b> - You always see exactly what\'s in the document, with no hidden formatting or mysterious styles',
-            '<b>Lightness</b> - Small and fast files, no proprietary format, no risk of corruption',
-        ],
-
-        's3_title': 'Markdown: The Standard',
-        's3_p1': 'Tramando uses <b>Markdown</b>, the most widespread markup language in the world. You\'ll find it on GitHub, Reddit, Discord, Notion, and hundreds of other platforms. Learning it once will serve you everywhere.',
-        's3_table_title': 'Basic Markdown commands:',
-        's3_table': [
-            ['What you want', 'What you write', 'Result'],
-            ['Bold', '**text**', 'text in bold'],
-            ['Italic', '*text*', 'text in italic'],
-            ['Title', '# Title', 'Large heading'],
-            ['Subtitle', '## Subtitle', 'Medium heading'],
-            ['Bullet list', '- item', '* item'],
-            ['Numbered list', '1. item', '1. item'],
-        ],
-
-        's4_title': 'Tramando\'s Special Markup',
-        's4_p1': 'In addition to standard Markdown, Tramando adds its own syntax for specific features:',
-        's4_table': [
-            ['Function', 'Syntax', 'Example'],
-            ['Aspect reference', '[@id]', '[@elena]'],
-            ['TODO annotation', '[!TODO:text:priority:comment]', '[!TODO:rewrite:1:too long]'],
-            ['NOTE annotation', '[!NOTE:text::comment]', '[!NOTE:verify date::]'],
-            ['FIX annotation', '[!FIX:text:priority:]', '[!FIX:name error:2:]'],
-            ['Arabic number', '[:ORD]', '1, 2, 3...'],
-            ['Roman number', '[:ORD-ROM]', 'I, II, III...'],
-        ],
-
-        's5_title': 'Don\'t Worry!',
-        's5_p1': 'Tramando highlights all markup with different colors, making it easy to distinguish special symbols from regular text. Additionally, the <b>Reading</b> tab always shows you the final result, without any visible symbols.',
-        's5_tip': '<i>After a few days of use, writing **bold** or [@character] will feel as natural as clicking a button. And you\'ll be much faster.</i>',
-    },
-
-    # =========================================================================
-    # CHAPTER 5: THE INTERFACE
-    # =========================================================================
-    'ch5': {
-        'title': '5. The Interface',
-
-        's1_title': 'The Top Bar',
-        's1_p1': 'The bar at the top contains all the main application commands:',
-        's1_items': [
-            '<b>Tramando Logo</b> - Clicking it returns you to the welcome screen',
-            '<b>Project Title</b> - Shows the current project name; clicking it lets you edit metadata (title, author, year...)',
-            '<b>Load</b> - Opens a .trmd file from your computer',
-            '<b>Save</b> - Downloads the current project as a .trmd file',
-            '<b>Version</b> - Menu to save versions, view version list, or restore a backup',
-            '<b>Export</b> - Dropdown menu for exporting to PDF, Markdown or Word (.docx)',
-            '<b>Annotations Badge</b> - Shows the total number of annotations; clicking it opens the annotations panel',
-            '<b>Map/Editor Toggle</b> - Switches between the radial map view and text editor',
-            '<b>Gear Icon</b> - Opens the settings panel',
-        ],
-
-        's2_title': 'The Sidebar',
-        's2_p1': 'The left side panel is your project\'s navigation center:',
-        's2_sub1': 'Filter Field',
-        's2_sub1_p': 'At the top of the sidebar you\'ll find a search field that filters the entire project. As you type, you\'ll see only elements that contain the searched text, both in title and content.',
-        's2_sub2': 'STRUCTURE',
-        's2_sub2_p': 'This section contains your actual narrative: chapters, scenes, parts. It\'s organized as an expandable tree. The number in parentheses indicates how many elements it contains.',
-        's2_sub3': 'ASPECTS',
-        's2_sub3_p': 'Here you\'ll find the five types of cross-cutting elements, each with its distinctive icon: <b>Characters</b> (👤), <b>Places</b> (📍), <b>Themes</b> (💡), <b>Sequences</b> (🔗), <b>Timeline</b> (📅). For each category you can set a priority threshold using the −/+ buttons.',
-
-        's3_title': 'The Editor',
-        's3_p1': 'The main area on the right is where writing happens. It includes three tabs (four for aspects):',
-        's3_items': [
-            '<b>Edit</b> - The actual editor, with syntax highlighting for markup',
-            '<b>Used by</b> - Aspects only: shows the scenes that use this element',
-            '<b>Reading</b> - Clean preview of the text, without visible markup',
-        ],
-        's3_p2': 'Above the editor you\'ll find: the field to edit the title, tags of connected aspects, and the "+ Aspect" button to add connections. The context menu (⋮) allows you to move the element, create children, edit the ID and other actions.',
-    },
-
-    # =========================================================================
-    # CHAPTER 6: NARRATIVE STRUCTURE
-    # =========================================================================
-    'ch6': {
-        'title': '6. Narrative Structure',
-
-        's1_title': 'Tree Organization',
-        's1_p1': 'The STRUCTURE section in the sidebar contains your story\'s text, organized as a hierarchical tree. Each element can contain other elements, allowing you to create whatever structure you prefer.',
-        's1_p2': 'A typical structure might be: <b>Book</b> > <b>Part</b> > <b>Chapter</b> > <b>Scene</b>. But there are no fixed rules: you might have only chapters, or scenes without chapters, or a completely different structure. Tramando adapts to you.',
-
-        's2_title': 'Creating New Elements',
-        's2_items': [
-            'Click <b>"+ New Chunk"</b> in the sidebar to create an element at the root level',
-            'To create a nested element, select a chunk and use the menu (⋮) > <b>"+ Child"</b>',
-            'Each chunk automatically receives a unique ID (e.g., cap-1, scene-2)',
-            'You can modify the ID from the menu (⋮) > <b>"Edit ID"</b> to make it more meaningful (e.g., "prologue", "climax")',
-        ],
-
-        's3_title': 'Automatic Numbering',
-        's3_p1': 'Tramando supports special macros in the title that are replaced with automatic numbers, based on the element\'s position among its siblings.',
-        's3_table': [
-            ['Macro', 'Result', 'Example'],
-            ['[:ORD]', 'Arabic numbers', '1, 2, 3, 4...'],
-            ['[:ORD-ROM]', 'Uppercase Roman', 'I, II, III, IV...'],
-            ['[:ORD-rom]', 'Lowercase Roman', 'i, ii, iii, iv...'],
-            ['[:ORD-ALPHA]', 'Uppercase letters', 'A, B, C, D...'],
-            ['[:ORD-alpha]', 'Lowercase letters', 'a, b, c, d...'],
-        ],
-        's3_example': 'If you write "Chapter [:ORD]: The Awakening" as the title of the first chapter, it will appear as "Chapter 1: The Awakening". The second chapter with "Chapter [:ORD]: The Departure" will become "Chapter 2: The Departure", and so on.',
-    },
-
-    # =========================================================================
-    # CHAPTER 7: ASPECTS
-    # =========================================================================
-    'ch7': {
-        'title': '7. Aspects',
-
-        'intro': 'Aspects are elements that cross through the story transversally. They\'re not part of the linear narrative sequence, but connect to it at various points. Tramando defines five types of aspects, each with a distinctive color.',
-
-        's1_title': 'Characters',
-        's1_color': 'Color: red (#c44a4a)',
-        's1_p1': 'Characters are the entities that inhabit your narrative world. Each character can have a profile with their description, and you can create sub-elements to organize information: physical appearance, background, narrative arc, relationships with other characters.',
-        's1_p2': 'By connecting a character to the scenes where they appear, you\'ll always know where and when they intervene in the story, making consistency checks easier.',
-
-        's2_title': 'Places',
-        's2_color': 'Color: green (#4a9a6a)',
-        's2_p1': 'Places are the spaces where things happen. You can organize them hierarchically: a Country contains Cities, which contain Districts, which contain Buildings, which contain Rooms.',
-        's2_p2': 'Each place can have its detailed description, and by connecting it to scenes you\'ll always know where each moment of the story takes place.',
-
-        's3_title': 'Themes',
-        's3_color': 'Color: orange (#b87333)',
-        's3_p1': 'Themes are the recurring ideas and motifs of your story: revenge, redemption, love, betrayal, personal growth. By defining them as aspects and connecting them to relevant scenes, you can track how each theme develops through the narrative.',
-        's3_p2': 'This is particularly useful during revision, when you want to ensure a theme has been adequately developed or hasn\'t been abandoned mid-story.',
-
-        's4_title': 'Sequences',
-        's4_color': 'Color: purple (#8a5ac2)',
-        's4_p1': 'Sequences are cause-and-effect chains that cross through the story. Unlike narrative structure (which follows reading order), sequences follow the internal logic of events.',
-        's4_p2': 'For example, a "Marco\'s Revenge" sequence might have as children: "Discovery of betrayal" > "Planning" > "First failed attempt" > "Success" > "Consequences". These steps might be scattered across different chapters, but the sequence keeps them connected.',
-
-        's5_title': 'Timeline',
-        's5_color': 'Color: blue (#4a90c2)',
-        's5_p1': 'The timeline contains events in actual chronological order, regardless of how they appear in the narrative. It\'s particularly useful when your story isn\'t linear: flashbacks, flash-forwards, or parallel narratives.',
-        's5_p2': 'You can use dates or timestamps in event titles (e.g., "2024-03-15 08:00 - Awakening") to maintain the correct order.',
-        's5_tip': '<i>Tip: use ISO date format (YYYY-MM-DD) in timeline titles for alphabetical sorting that matches chronological order.</i>',
-
-        's6_title': 'Creating Aspects',
-        's6_p1': 'To create a new aspect, click the <b>"+ New aspect"</b> button in the sidebar, under the desired category. Each aspect will have its own unique ID and you can give it a descriptive title.',
-
-        's7_title': 'Aspect Priority',
-        's7_p1': 'Each aspect can have a <b>priority</b> from 0 (low) to 10 (high). This lets you distinguish between main and minor elements of your story.',
-        's7_items': [
-            'In the aspect editor, you\'ll find the <b>Priority</b> field with a numeric value',
-            'Higher priority aspects appear first in the sidebar',
-            'You can use the threshold to hide minor aspects',
-        ],
-
-        's8_title': 'Threshold Filter',
-        's8_p1': 'In each aspect category (Characters, Places, etc.) you\'ll find a <b>threshold</b> widget with −0+ buttons. This sets the minimum priority level visible:',
-        's8_items': [
-            'If threshold is <b>0</b>, all aspects are visible',
-            'If threshold is <b>3</b>, only aspects with priority >= 3 are visible',
-            'Filtered aspects don\'t appear in sidebar or radial map',
-            'Tags for filtered aspects appear faded in the editor',
-        ],
-        's8_tip': '<i>Tip: use priorities to focus on main characters while writing, then lower the threshold during revision to check that minor characters are also consistent.</i>',
-    },
-
-    # =========================================================================
-    # CHAPTER 8: CONNECTIONS
-    # =========================================================================
-    'ch8': {
-        'title': '8. Connections',
-
-        'intro': 'Tramando\'s real power lies in the connections between narrative structure and aspects. By connecting scenes to characters, places, and themes, you create a network of relationships that lets you navigate and analyze your story in ways impossible with traditional tools.',
-
-        's1_title': '[@id] Syntax',
-        's1_p1': 'The most direct way to create a connection is to write <b>[@id]</b> in the scene\'s text, where "id" is the identifier of the aspect you want to connect.',
-        's1_p2': 'For example, if you have a character with ID "elena", writing [@elena] in a scene automatically creates a connection. This method is particularly useful when you want to mark the exact point where an element appears in the text.',
-
-        's2_title': 'Tag Method',
-        's2_p1': 'An alternative is to use the visual tags above the editor:',
-        's2_items': [
-            'Select the scene you want to connect',
-            'Click the <b>"+ Aspect"</b> button above the editor',
-            'Choose the aspect from the menu that appears',
-            'The tag will appear below the scene\'s title',
-        ],
-        's2_p2': 'To remove a connection, click the <b>x</b> next to the tag.',
-
-        's3_title': '"Used by" Tab',
-        's3_p1': 'When you select an aspect (character, place, theme...), the "Used by" tab shows you all the scenes that reference it. It\'s a quick way to answer the question: "Where does this element appear in the story?"',
-
-        's4_title': 'Count in Sidebar',
-        's4_p1': 'In the sidebar, next to each aspect, you see a number in parentheses (e.g., "Elena (6)"). This indicates how many scenes the element is connected to, giving you an immediate idea of its importance in the story.',
-
-        's5_title': 'Best Practices',
-        's5_items': [
-            'Use short and meaningful IDs: "elena" is better than "character-001"',
-            'Create connections as you write, not after - it\'s easier and maintains consistency',
-            'Don\'t overdo it: only connect aspects that are truly relevant to each scene',
-            'Use tags for recurring aspects, [@id] in text for specific references',
-        ],
-    },
-
-    # =========================================================================
-    # CHAPTER 9: ANNOTATIONS
-    # =========================================================================
-    'ch9': {
-        'title': '9. Annotations',
-
-        'intro': 'Annotations are notes you leave for yourself during writing. They\'re visible in Tramando but will never appear in the final exported product. They\'re your space for notes, reminders, and flags.',
-
-        's1_title': 'Annotation Types',
-        's1_items': [
-            '<b>TODO</b> - Things to do: "add location description", "develop the dialogue", "research historical details"',
-            '<b>NOTE</b> - Notes and reflections: "verify this date", "idea for sequel", "perhaps too long"',
-            '<b>FIX</b> - Problems to fix: "inconsistency with chapter 3", "name error", "timeline doesn\'t work"',
-        ],
-
-        's2_title': 'Creating Annotations',
-        's2_p1': 'There are two ways to create an annotation:',
-        's2_items': [
-            'Select the text to annotate, right-click, and choose the annotation type from the menu',
-            'Write the syntax directly in the text',
-        ],
-
-        's3_title': 'The Syntax',
-        's3_p1': 'The annotation format is:',
-        's3_code': '[!TYPE:text:priority:comment]',
-        's3_examples_title': 'Examples:',
-        's3_examples': [
-            '[!TODO:rewrite this dialogue:1:too formal]',
-            '[!NOTE:verify historical date::check encyclopedia]',
-            '[!FIX:Marco is called Luca here:3:]',
-        ],
-
-        's4_title': 'Annotations Panel',
-        's4_p1': 'In the sidebar, the ANNOTATIONS section collects all project annotations, grouped by type (TODO, FIX, NOTE). Clicking an annotation takes you directly to the point in the text where it\'s located.',
-        's4_p2': 'The badge in the top bar shows the total number of annotations, always giving you visibility on how much revision work awaits.',
-
-        's5_note': '<b>Important:</b> annotations do NOT appear in PDF export. They\'re exclusively for the author during the writing process.',
-    },
-
-    # =========================================================================
-    # CHAPTER 10: SEARCH AND REPLACE
-    # =========================================================================
-    'ch10': {
-        'title': '10. Search and Replace',
-
-        'intro': 'Tramando offers powerful search tools for navigating even the largest projects. There are two levels of search: global (across the entire project) and local (on the current chunk).',
-
-        's1_title': 'Global Filter',
-        's1_p1': 'The search field at the top of the sidebar filters the entire project. As you type, the sidebar shows only elements that contain the searched text, both in title and content.',
-        's1_features': [
-            '<b>[Aa]</b> - Toggle for case-sensitive search',
-            '<b>[.*]</b> - Toggle to enable regular expressions',
-            'Results appear as a flat list with the full path',
-            'Clicking a result opens it in the editor with matches highlighted',
-        ],
-
-        's2_title': 'Local Search',
-        's2_p1': 'Press <b>Ctrl+F</b> (or <b>Cmd+F</b> on Mac) to open the search bar above the editor. This searches only in the current chunk.',
-        's2_features': [
-            'All matches are highlighted in yellow',
-            'The current match is highlighted in more intense orange',
-            'The <b>&lt;</b> and <b>&gt;</b> arrows navigate between matches',
-            'The <b>up/down arrow</b> keys work as an alternative',
-            'The counter (e.g., "3/12") shows current position out of total',
-        ],
-
-        's3_title': 'Replace',
-        's3_p1': 'Press <b>Ctrl+H</b> (or <b>Cmd+H</b> on Mac) to open the replace bar. A second field appears for the replacement text.',
-        's3_features': [
-            '<b>Replace</b> - Changes the current match and moves to the next',
-            '<b>Replace all</b> - Changes all occurrences at once',
-            'A message confirms how many replacements were made',
-            '<b>Ctrl+Z</b> undoes the replacements',
-        ],
-
-        's4_title': 'Regular Expressions',
-        's4_p1': 'By activating the [.*] toggle you can use regular expressions for advanced searches:',
-        's4_examples': [
-            '<b>\\bword\\b</b> - Finds "word" as a whole word, not as part of other words',
-            '<b>chap[ter]</b> - Finds both "chapter" and "chaptor"',
-            '<b>\\d{4}</b> - Finds 4-digit sequences (useful for searching years)',
-            '<b>^beginning</b> - Finds "beginning" only at the start of a line',
-        ],
-    },
-
-    # =========================================================================
-    # CHAPTER 11: RADIAL MAP
-    # =========================================================================
-    'ch11': {
-        'title': '11. Radial Map',
-
-        'intro': 'The radial map is a graphical visualization of your story. It lets you "see" the plot as a whole, with all the connections between structure and aspects represented visually.',
-
-        's1_title': 'Reading the Map',
-        's1_items': [
-            '<b>Center</b> - The project title',
-            '<b>Inner ring (gray)</b> - The narrative structure: chapters and scenes',
-            '<b>Outer rings</b> - The aspects, each with its color (red characters, green places, etc.)',
-            '<b>Lines</b> - The connections between scenes and aspects',
-        ],
-
-        's2_title': 'Interaction',
-        's2_items': [
-            '<b>Scroll</b> - Zoom in and out',
-            '<b>Click</b> - Select an element',
-            '<b>Hover</b> - Shows details in the info panel',
-            '<b>Drag</b> - Move the view when zoomed in',
-        ],
-
-        's3_title': 'Info Panel',
-        's3_p1': 'At the bottom left of the map you\'ll find the info panel, divided into two sections:',
-        's3_items': [
-            '<b>HOVER</b> - Shows information about the element under the cursor',
-            '<b>SELECTION</b> - Shows information about the element selected by clicking',
-        ],
-        's3_p2': 'For each element you see: name, type, ID, and number of connections.',
-
-        's4_title': 'What It\'s For',
-        's4_p1': 'The radial map is useful for:',
-        's4_items': [
-            'Seeing character distribution in the story',
-            'Identifying overloaded scenes (too many lines = too many elements)',
-            'Discovering isolated elements (aspects defined but never used)',
-            'Understanding relationships between different elements',
-            'Getting an overview for structural decisions',
-        ],
-    },
-
-    # =========================================================================
-    # CHAPTER 12: PDF, WORD AND MARKDOWN EXPORT
-    # =========================================================================
-    'ch12': {
-        'title': '12. PDF, Word and Markdown Export',
-
-        's1_title': 'How to Export',
-        's1_items': [
-            'Click on <b>"Export"</b> in the top bar',
-            'Choose the desired format: <b>PDF</b>, <b>Word (.docx)</b> or <b>Markdown</b>',
-            'The file is generated and downloaded automatically',
-        ],
-
-        's2_title': 'What\'s Included',
-        's2_items': [
-            'Title page with title and author (taken from project metadata)',
-            'Chapters with title at top and page break',
-            'Scenes separated by <b>***</b> centered',
-            'Markdown formatting: bold, italic, headings, lists',
-        ],
-
-        's3_title': 'What\'s Excluded',
-        's3_items': [
-            'YAML frontmatter (technical metadata)',
-            '[@id] aspect references',
-            'Chunk IDs and metadata',
-            'Annotations (TODO, NOTE, FIX)',
-            'Aspect containers and their content',
-        ],
-
-        's4_note': '<b>In practice:</b> the export contains only clean narrative, ready for reading or printing. All the "behind the scenes" remains hidden.',
-
-        's5_title': 'PDF Format - Technical Specs',
-        's5_table': [
-            ['Property', 'Value'],
-            ['Page format', 'A5'],
-            ['Margins', '60pt top, 70pt bottom, 50pt sides'],
-            ['Font', 'Roboto'],
-            ['Chapter title', '18pt bold'],
-            ['Body text', '11pt, justified'],
-            ['Line spacing', '1.4'],
-            ['Page numbers', 'Centered at bottom'],
-        ],
-
-        's6_title': 'Word Export (.docx)',
-        's6_p1': 'The Word export generates a .docx document compatible with Microsoft Word, LibreOffice and Google Docs. It maintains basic formatting (bold, italic, headings) and is ideal for revision with editors or literary agents.',
-
-        's7_title': 'Markdown Export',
-        's7_p1': 'The Markdown export generates a plain text .md file. Useful for importing text into other programs (Scrivener, Obsidian, etc.) or for having a readable text backup.',
-    },
-
-    # =========================================================================
-    # CHAPTER 13: SETTINGS
-    # =========================================================================
-    'ch13': {
-        'title': '13. Settings',
-
-        's1_title': 'Themes',
-        's1_p1': 'Tramando includes four preset themes:',
-        's1_table': [
-            ['Theme', 'Description'],
-            ['Tessuto', 'Warm beige with paper texture (default)'],
-            ['Dark', 'Dark theme with pink accents, for night writing'],
-            ['Light', 'Light and minimal theme'],
-            ['Sepia', 'Vintage and warm tones, simulates aged paper'],
-        ],
-
-        's2_title': 'Autosave',
-        's2_p1': 'A slider lets you set the autosave interval from 1 to 10 seconds. The default value is 3 seconds. Autosave occurs N seconds after the last modification.',
-
-        's3_title': 'Language',
-        's3_p1': 'Tramando is available in Italian and English. Changing the language only modifies the interface; your project content is not altered.',
-
-        's4_title': 'Import/Export Settings',
-        's4_p1': 'You can export your settings to an .edn file and reimport them on another device. Useful for maintaining the same theme and configuration across multiple computers.',
-
-        's5_title': 'Tutorial',
-        's5_p1': 'The "Review tutorial" button reopens the interactive guide you saw on first launch. Useful if you want to refresh your memory on the features.',
-    },
-
-    # =========================================================================
-    # CHAPTER 14: THE .TRMD FILE FORMAT
-    # =========================================================================
-    'ch14': {
-        'title': '14. The .trmd File Format',
-
-        'intro': '.trmd files are pure text files, readable with any editor. This ensures your data is always accessible, even without Tramando.',
-
-        's1_title': 'General Structure',
-        's1_items': [
-            '<b>YAML Frontmatter</b> - Project metadata, enclosed between ---',
-            '<b>Content</b> - Chunks with their hierarchy',
-        ],
-
-        's2_title': 'Frontmatter',
-        's2_p1': 'The frontmatter contains project metadata:',
-        's2_code': '''---
-title: "My Novel"
-author: "Author Name"
-language: "en"
-year: 2024
-isbn: ""
-publisher: ""
-custom:
-  genre: "Thriller"
----''',
-
-        's3_title': 'Chunk Syntax',
-        's3_code': '''[C:id"Chunk Title"][@aspect1][@aspect2]
-Chunk content here...
-
-  [C:child"Child Title"]
-  Child content indented with 2 spaces''',
-        's3_items': [
-            '<b>[C:id"title"]</b> defines a chunk with its ID and title',
-            '<b>[@id]</b> creates a connection to an aspect',
-            '<b>2 spaces</b> of indentation = 1 level of nesting',
-        ],
-
-        's4_title': 'Reserved IDs',
-        's4_p1': 'Some IDs are reserved for aspect containers:',
-        's4_items': ['personaggi', 'luoghi', 'temi', 'sequenze', 'timeline'],
-        's4_note': 'These IDs cannot be used for other elements.',
-
-        's5_title': 'Annotations in File',
-        's5_code': 'Text with [!TODO:to complete:1:urgent] annotation.',
-
-        's6_title': 'Extended Metadata (v2.0)',
-        's6_p1': 'Starting from version 2.0, chunks can have additional metadata:',
-        's6_table': [
-            ['Syntax', 'Meaning'],
-            ['[#owner:username]', 'Chunk owner (collaborative mode)'],
-            ['[#priority:N]', 'Aspect priority (0-10)'],
-            ['[!DISCUSSION:base64]', 'Base64-encoded discussions'],
-            ['[!PROPOSAL:original_text:proposed_text]', 'Inline edit proposal'],
-        ],
-        's6_note': '<i>These metadata are used internally and usually don\'t need manual editing.</i>',
-    },
-
-    # =========================================================================
-    # CHAPTER 15: KEYBOARD SHORTCUTS
-    # =========================================================================
-    'ch15': {
-        'title': '15. Keyboard Shortcuts',
-
-        's1_table': [
-            ['Shortcut', 'Action'],
-            ['Ctrl/Cmd + Z', 'Undo'],
-            ['Ctrl/Cmd + Shift + Z', 'Redo'],
-            ['Escape', 'Close modals and search bar'],
-            ['Ctrl/Cmd + F', 'Open search in chunk'],
-            ['Ctrl/Cmd + H', 'Open search and replace'],
-            ['Ctrl/Cmd + Shift + F', 'Focus on global filter'],
-            ['Up/Down arrow', 'Navigate search results'],
-            ['F3 / Shift + F3', 'Next/previous result'],
-        ],
-
-        's2_note': '<i>Note: Cmd is for macOS, Ctrl is for Windows/Linux.</i>',
-
-        's3_title': 'Undo History',
-        's3_p1': 'Tramando keeps the last 100 changes in the undo history. You can freely undo and redo with the shortcuts indicated above.',
-    },
-
-    # =========================================================================
-    # CHAPTER 16: AI ASSISTANT
-    # =========================================================================
-    'ch16': {
-        'title': '16. AI Assistant (optional)',
-
-        # Introduction
-        's1_title': 'Introduction',
-        's1_p1': 'The AI Assistant is a completely optional feature. Tramando works perfectly without it, and many writers prefer to work without AI support. If you\'re not interested, you can simply skip this chapter.',
-        's1_p2': 'If you decide to try it, know that Tramando\'s approach is non-invasive: the AI proposes, you always decide. No automatic changes to your text. Every suggestion goes through your approval. You can disable it at any time.',
-        's1_items': [
-            'Overcome creative blocks',
-            'Explore phrase variations',
-            'Generate character sheet drafts',
-            'Verify narrative consistency',
-        ],
-        's1_note': '<i>Remember: AI is a tool, not a co-author. The story remains yours.</i>',
-
-        # Configuration
-        's2_title': 'Configuration',
-        's2_p1': 'To enable the AI Assistant, go to Settings (gear icon) and find the "AI Assistant" section. Check "Enable AI assistant" to activate the feature.',
-        's2_sub1': 'Choosing a provider',
-        's2_table': [
-            ['Provider', 'Cost', 'Pros', 'Cons'],
-            ['Ollama', 'Free', 'Local, private', 'Requires installation'],
-            ['Groq', 'Free', 'Fast, good models', 'Usage limits'],
-            ['Anthropic', 'Paid', 'Excellent models', '~$3/million tokens'],
-            ['OpenAI', 'Paid', 'Excellent models', '~$2.50/million tokens'],
-        ],
-        's2_sub2': 'Ollama (free, local)',
-        's2_ollama': 'Ollama runs AI models on your computer. No data leaves your machine. Install Ollama from ollama.ai, start it, select "Ollama (local)" in Tramando, and download a model with: ollama pull llama3.2',
-        's2_sub3': 'Groq (free, cloud)',
-        's2_groq': 'Groq offers free APIs with fast Llama models. Register at console.groq.com, create an API Key, and paste it in Tramando selecting "Groq (Llama, fast)".',
-        's2_sub4': 'Anthropic and OpenAI (paid)',
-        's2_paid': 'For Anthropic (Claude) register at console.anthropic.com, for OpenAI at platform.openai.com. Add credit ($5 minimum), create an API key and paste it in Tramando. For normal use you\'ll spend a few cents per day.',
-
-        # Using AI without API
-        's3_title': 'Using AI without API',
-        's3_p1': 'If you don\'t want to configure APIs, you can use Tramando with Claude chat (claude.ai) or ChatGPT (chat.openai.com) using a manual workflow.',
-        's3_items': [
-            '<b>Step 1</b>: Select text, open the AI panel, write your request',
-            '<b>Step 2</b>: Click "Copy for chat" - the prompt is copied to clipboard',
-            '<b>Step 3</b>: Paste in external chat, wait for response, copy it',
-            '<b>Step 4</b>: Return to Tramando, click "Inject response", paste and confirm',
-        ],
-        's3_note': 'Tramando will process the response as if it arrived via API.',
-
-        # The panel
-        's4_title': 'The AI Assistant panel',
-        's4_p1': 'The panel opens with the AI button in the top bar or the shortcut Ctrl+Shift+A (Cmd+Shift+A on Mac).',
-        's4_items': [
-            '<b>Chat area</b>: shows the conversation with the AI',
-            '<b>Input field</b>: write your request',
-            '<b>Context selector</b>: choose what information to send to the AI',
-            '<b>Word indicator</b>: shows context size (green/yellow/red)',
-        ],
-        's4_sub1': 'The context selector',
-        's4_context': 'AI works better with context about your story. Quick presets: <b>Minimal</b> (current chunk only), <b>Scene</b> (+ linked characters/places), <b>Narrative</b> (+ sequences/timeline), <b>Complete</b> (everything). You can also customize individual options.',
-
-        # AI Actions
-        's5_title': 'Available AI actions',
-        's5_p1': 'Select text in the editor, right-click, and choose "AI Assistant":',
-        's5_sub1': 'Actions that propose alternatives',
-        's5_items1': [
-            '<b>Expand/develop</b>: enriches text with details',
-            '<b>Rephrase</b>: proposes alternative versions',
-            '<b>Make more...</b>: changes tone (dark, light, formal, casual, poetic)',
-        ],
-        's5_sub2': 'Actions that respond in chat',
-        's5_items2': [
-            '<b>Suggest conflict</b>: proposes narrative tensions',
-            '<b>Analyze consistency</b>: looks for inconsistencies',
-        ],
-        's5_sub3': 'Actions on aspects',
-        's5_items3': [
-            '<b>Create character/place sheet</b>: generates a sheet from text',
-            '<b>Extract info for...</b>: enriches an existing sheet with new information',
-        ],
-
-        # AI Annotations
-        's6_title': 'AI annotations',
-        's6_p1': 'When you ask the AI to rephrase or expand text, Tramando creates a special annotation.',
-        's6_flow': [
-            'Select text and ask "Rephrase"',
-            'An annotation [!NOTE:text:AI:] appears in the text',
-            'The request is sent (or you copy it for external chat)',
-            'When the response arrives, the annotation becomes [!NOTE:text:AI-DONE:...]',
-            'The proposed alternatives are stored in the annotation',
-        ],
-        's6_sub1': 'Choosing an alternative',
-        's6_choose': 'Right-click on the annotation. A menu appears with alternatives (radio buttons). Select the one you prefer, then "Apply selection" to replace the text, or "Cancel changes" to return to the original.',
-        's6_note': 'You can change your mind as many times as you want before confirming.',
-
-        # Tips
-        's7_title': 'Tips for better results',
-        's7_items': [
-            '<b>Right context</b>: Minimal for rephrasing, Scene for developing, Complete for consistency',
-            '<b>Right model</b>: large models (70B, Claude, GPT-4) for complex tasks',
-            '<b>AI as assistant</b>: use AI to explore possibilities, not to write for you',
-            '<b>Better prompts</b>: be specific, give context, ask for alternatives',
-        ],
-    },
-
-    # =========================================================================
-    # CHAPTER 17: COLLABORATIVE MODE
-    # =========================================================================
-    'ch17': {
-        'title': '17. Collaborative Mode',
-
-        'intro': 'Collaborative mode allows multiple authors to work together on the same project. This feature requires a Tramando server and a user account.',
-
-        's1_title': 'Requirements',
-        's1_items': [
-            'An active Tramando server (self-hosted or cloud)',
-            'A user account on the server',
-            'Internet connection during work',
-        ],
-
-        's2_title': 'Login and Projects',
-        's2_p1': 'From the welcome screen, in the <b>Server</b> section, enter your account credentials. After login, you\'ll see the list of projects you have access to.',
-        's2_items': [
-            '<b>Your projects</b> - Projects created by you',
-            '<b>Shared projects</b> - Projects you\'ve been invited to as a collaborator',
-        ],
-
-        's3_title': 'Roles and Permissions',
-        's3_p1': 'In each collaborative project there are three roles:',
-        's3_table': [
-            ['Role', 'Permissions'],
-            ['Owner', 'Full control: edit everything, manage collaborators, transfer ownership'],
-            ['Admin', 'Can edit everything, but cannot manage collaborators'],
-            ['Collaborator', 'Can only edit chunks they own'],
-        ],
-
-        's4_title': 'Chunk Ownership',
-        's4_p1': 'In collaborative mode, each chunk has an <b>owner</b>. This determines who can modify the content:',
-        's4_items': [
-            'When you create a new chunk, you automatically become its owner',
-            'Only the owner, an Admin, or the project Owner can modify a chunk',
-            'Ownership can be transferred to another collaborator',
-            'In the editor, the "Owner" field shows who owns the chunk',
-        ],
-
-        's5_title': 'Proposals (PROPOSAL)',
-        's5_p1': 'If you\'re not the owner of a chunk but want to suggest a change, you can create a <b>proposal</b>:',
-        's5_items': [
-            'Select the text you want to modify',
-            'Use the context menu and choose "Propose edit"',
-            'Write the alternative text you suggest',
-            'The proposal will appear highlighted in the text',
-        ],
-        's5_p2': 'The chunk owner will see the proposal and can <b>accept</b> (text is replaced) or <b>reject</b> it (proposal is removed).',
-
-        's6_title': 'Discussions',
-        's6_p1': 'Each chunk has a <b>Discussion</b> section where collaborators can leave comments and discuss the content without modifying the main text.',
-        's6_items': [
-            'Click the "Discussion" tab in the editor',
-            'Write your comment in the field below',
-            'Messages show author and date',
-            'Useful for feedback, questions, or coordination',
-        ],
-
-        's7_title': 'Project Chat',
-        's7_p1': 'In the top bar, the <b>chat</b> button (speech bubble icon) opens the general project chat. Here you can communicate with all collaborators in real time, regardless of which chunk you\'re working on.',
-
-        's8_title': 'Synchronization',
-        's8_p1': 'Changes are automatically synchronized with the server. In the top bar you\'ll see a status indicator:',
-        's8_items': [
-            '<b>Synchronized</b> - All changes have been saved',
-            '<b>Syncing...</b> - Synchronization in progress',
-            '<b>Error</b> - Connection problem (retry or check network)',
-        ],
-
-        's9_title': 'Managing Collaborators',
-        's9_p1': 'If you\'re the project Owner, you can manage collaborators:',
-        's9_items': [
-            'Click the collaborators icon in the top bar',
-            'To add: enter username and select role',
-            'To remove: click the X next to the name',
-            'To change role: use the dropdown next to the name',
-        ],
-        's9_note': '<i>Only the project Owner can add or remove collaborators.</i>',
-    },
-
-    # =========================================================================
-    # APPENDIX
-    # =========================================================================
-    'appendix': {
-        'title': 'Appendix: Quick Reference',
-
-        's1_title': 'Base Syntax',
-        's1_table': [
-            ['Element', 'Syntax'],
-            ['Chunk', '[C:id"Title"]'],
-            ['Aspect reference', '[@id]'],
-            ['TODO', '[!TODO:text:priority:comment]'],
-            ['NOTE', '[!NOTE:text:priority:comment]'],
-            ['FIX', '[!FIX:text:priority:comment]'],
-            ['Arabic number', '[:ORD]'],
-            ['Uppercase Roman', '[:ORD-ROM]'],
-            ['Lowercase Roman', '[:ORD-rom]'],
-            ['Uppercase letter', '[:ORD-ALPHA]'],
-            ['Lowercase letter', '[:ORD-alpha]'],
-        ],
-
-        's1b_title': 'v2.0 Syntax',
-        's1b_table': [
-            ['Element', 'Syntax'],
-            ['Chunk owner', '[#owner:username]'],
-            ['Aspect priority', '[#priority:N]'],
-            ['Proposal', '[!PROPOSAL:original:proposed]'],
-            ['Discussion', '[!DISCUSSION:base64]'],
-        ],
-
-        's2_title': 'Reserved IDs',
-        's2_table': [
-            ['ID', 'Type'],
-            ['personaggi', 'Characters container'],
-            ['luoghi', 'Places container'],
-            ['temi', 'Themes container'],
-            ['sequenze', 'Sequences container'],
-            ['timeline', 'Timeline container'],
-        ],
-
-        's3_title': 'Map Colors',
-        's3_table': [
-            ['Type', 'Color', 'Hex'],
-            ['Structure', 'Blue', '#4a90c2'],
-            ['Characters', 'Red', '#c44a4a'],
-            ['Places', 'Green', '#4a9a6a'],
-            ['Themes', 'Orange', '#b87333'],
-            ['Sequences', 'Purple', '#8a5ac2'],
-            ['Timeline', 'Blue', '#4a90c2'],
-        ],
-
-        's4_title': 'Technical Limits',
-        's4_items': [
-            'Undo history: 100 states',
-            'Roman numerals: 1-3999',
-            '.trmd projects are text files saved to disk. There is no practical size limit: a complete novel with all aspects typically takes less than 1 MB.',
-        ],
-
-        'footer': 'Tramando - Weave your story',
-    },
-}
 
 # =============================================================================
 # BUILD MANUAL
 # =============================================================================
 
-def build_chapter_1(story, T, styles, lang):
-    """Capitolo 1: Introduzione"""
-    ch = T['ch1']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-
-    # Cos'e Tramando
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    story.append(Paragraph(ch['s1_p2'], styles['Body']))
-    story.append(Paragraph(ch['s1_p3'], styles['Body']))
-
-    # Origine del nome
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-
-    # Filosofia
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    story.append(Paragraph(ch['s3_p2'], styles['Body']))
-
-    # Per chi e
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s4_items'], styles)
-
-    story.append(PageBreak())
-
-
-def build_chapter_2(story, T, styles, lang):
-    """Capitolo 2: Modalita di utilizzo"""
-    ch = T['ch2_modes']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Desktop
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    add_bullet_list(story, ch['s1_items'], styles)
-    story.append(Paragraph(ch['s1_note'], styles['Note']))
-
-    # Webapp locale
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    add_bullet_list(story, ch['s2_items'], styles)
-
-    # Collaborativa
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    add_bullet_list(story, ch['s3_items'], styles)
-    story.append(Paragraph(ch['s3_note'], styles['Note']))
-
-    # Tabella differenze
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(make_table(ch['s4_table'], col_widths=[4*cm, 3*cm, 3*cm, 4*cm]))
-    story.append(Spacer(1, 0.3*cm))
-
-    # Quale scegliere
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s5_items'], styles)
-
-    story.append(PageBreak())
-
-
-def build_chapter_3(story, T, styles, lang):
-    """Capitolo 3: Primi passi"""
-    ch = T['ch3']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-
-    # Avviare
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    add_bullet_list(story, ch['s1_items'], styles)
-    story.append(Spacer(1, 0.3*cm))
-    add_image(story, lang, 'splash_tauri.png', T['captions']['splash_tauri'], styles, width=13*cm)
-
-    # Primo progetto
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    story.append(Paragraph(ch['s2_p2'], styles['Body']))
-
-    # Salvare
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    story.append(Paragraph(ch['s3_p2'], styles['Body']))
-    story.append(Paragraph(ch['s3_tip'], styles['Note']))
-
-    # Versioni e backup
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    add_bullet_list(story, ch['s4_items'], styles)
-    story.append(Paragraph(ch['s4_p2'], styles['Body']))
-    story.append(Paragraph(ch['s4_note'], styles['Note']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_4(story, T, styles, lang):
-    """Capitolo 4: Cos'e il markup"""
-    ch = T['ch4']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Formattazione vs markup
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    story.append(Paragraph(ch['s1_p2'], styles['Body']))
-    story.append(Paragraph(ch['s1_code'], styles['CodeBlock']))
-    story.append(Paragraph(ch['s1_result'], styles['Body']))
-
-    # Perche markup
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s2_items'], styles)
-
-    # Markdown
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    story.append(Paragraph(ch['s3_table_title'], styles['Body']))
-    story.append(Spacer(1, 0.2*cm))
-    story.append(make_table(ch['s3_table'], col_widths=[5*cm, 4*cm, 5*cm]))
-    story.append(Spacer(1, 0.3*cm))
-
-    # Markup Tramando
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    story.append(Spacer(1, 0.2*cm))
-    story.append(make_table(ch['s4_table'], col_widths=[4.5*cm, 6*cm, 5*cm]))
-    story.append(Spacer(1, 0.3*cm))
-
-    # Rassicurazione
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s5_p1'], styles['Body']))
-    story.append(Paragraph(ch['s5_tip'], styles['Note']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_5(story, T, styles, lang):
-    """Capitolo 5: L'interfaccia"""
-    ch = T['ch5']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    add_image(story, lang, 'main.png', T['captions']['main'], styles, width=16*cm)
-
-    # Barra superiore
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    add_bullet_list(story, ch['s1_items'], styles)
-
-    # Sidebar
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    story.append(Paragraph(ch['s2_sub1'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s2_sub1_p'], styles['Body']))
-    story.append(Paragraph(ch['s2_sub2'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s2_sub2_p'], styles['Body']))
-    story.append(Paragraph(ch['s2_sub3'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s2_sub3_p'], styles['Body']))
-
-    # Editor
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    add_bullet_list(story, ch['s3_items'], styles)
-    story.append(Paragraph(ch['s3_p2'], styles['Body']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_6(story, T, styles, lang):
-    """Capitolo 6: La Struttura narrativa"""
-    ch = T['ch6']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-
-    # Organizzazione
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    story.append(Paragraph(ch['s1_p2'], styles['Body']))
-
-    # Creare elementi
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s2_items'], styles)
-
-    # Numerazione
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    story.append(Spacer(1, 0.2*cm))
-    story.append(make_table(ch['s3_table'], col_widths=[4*cm, 5*cm, 5*cm]))
-    story.append(Spacer(1, 0.3*cm))
-    story.append(Paragraph(ch['s3_example'], styles['Note']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_7(story, T, styles, lang):
-    """Capitolo 7: Gli Aspetti"""
-    ch = T['ch7']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Personaggi
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(f"<i>{ch['s1_color']}</i>", styles['Note']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    story.append(Paragraph(ch['s1_p2'], styles['Body']))
-
-    # Luoghi
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(f"<i>{ch['s2_color']}</i>", styles['Note']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    story.append(Paragraph(ch['s2_p2'], styles['Body']))
-
-    # Temi
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(f"<i>{ch['s3_color']}</i>", styles['Note']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    story.append(Paragraph(ch['s3_p2'], styles['Body']))
-
-    # Sequenze
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(f"<i>{ch['s4_color']}</i>", styles['Note']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    story.append(Paragraph(ch['s4_p2'], styles['Body']))
-
-    # Timeline
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    story.append(Paragraph(f"<i>{ch['s5_color']}</i>", styles['Note']))
-    story.append(Paragraph(ch['s5_p1'], styles['Body']))
-    story.append(Paragraph(ch['s5_p2'], styles['Body']))
-    story.append(Paragraph(ch['s5_tip'], styles['Note']))
-
-    # Creare aspetti
-    story.append(Paragraph(ch['s6_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s6_p1'], styles['Body']))
-
-    # Priorita (v2.0)
-    story.append(Paragraph(ch['s7_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s7_p1'], styles['Body']))
-    add_bullet_list(story, ch['s7_items'], styles)
-    story.append(Spacer(1, 0.3*cm))
-    add_image(story, lang, 'priority_editor.png', T['captions']['priority_editor'], styles, width=10*cm)
-
-    # Filtro soglia (v2.0)
-    story.append(Paragraph(ch['s8_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s8_p1'], styles['Body']))
-    add_bullet_list(story, ch['s8_items'], styles)
-    story.append(Spacer(1, 0.3*cm))
-    add_image(story, lang, 'priority_sidebar.png', T['captions']['priority_sidebar'], styles, width=8*cm)
-    story.append(Paragraph(ch['s8_tip'], styles['Note']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_8(story, T, styles, lang):
-    """Capitolo 8: I collegamenti"""
-    ch = T['ch8']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Sintassi [@id]
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    story.append(Paragraph(ch['s1_p2'], styles['Body']))
-
-    # Metodo tag
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    add_numbered_list(story, ch['s2_items'], styles)
-    story.append(Paragraph(ch['s2_p2'], styles['Body']))
-
-    # Tab Usato da
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-
-    # Conteggio
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-
-    # Best practices
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s5_items'], styles)
-
-    story.append(PageBreak())
-
-
-def build_chapter_9(story, T, styles, lang):
-    """Capitolo 9: Le annotazioni"""
-    ch = T['ch9']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Tipi
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s1_items'], styles)
-
-    # Creare
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    add_numbered_list(story, ch['s2_items'], styles)
-
-    # Sintassi
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    story.append(Paragraph(ch['s3_code'], styles['CodeBlock']))
-    story.append(Paragraph(ch['s3_examples_title'], styles['Body']))
-    for ex in ch['s3_examples']:
-        story.append(Paragraph(ex, styles['CodeBlock']))
-
-    # Pannello
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    story.append(Paragraph(ch['s4_p2'], styles['Body']))
-
-    # Nota importante
-    story.append(Spacer(1, 0.3*cm))
-    story.append(Paragraph(ch['s5_note'], styles['Note']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_10(story, T, styles, lang):
-    """Capitolo 10: Cerca e sostituisci"""
-    ch = T['ch10']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    add_image(story, lang, 'filter.png', T['captions']['filter'], styles, width=14*cm)
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Filtro globale
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    add_bullet_list(story, ch['s1_features'], styles)
-
-    # Ricerca locale
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    add_bullet_list(story, ch['s2_features'], styles)
-
-    # Sostituisci
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    add_bullet_list(story, ch['s3_features'], styles)
-
-    # Regex
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    add_bullet_list(story, ch['s4_examples'], styles)
-
-    story.append(PageBreak())
-
-
-def build_chapter_11(story, T, styles, lang):
-    """Capitolo 11: La mappa radiale"""
-    ch = T['ch11']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    add_image(story, lang, 'map.png', T['captions']['map'], styles, width=14*cm)
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Leggere la mappa
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s1_items'], styles)
-
-    # Interazione
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s2_items'], styles)
-
-    # Pannello info
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    add_bullet_list(story, ch['s3_items'], styles)
-    story.append(Paragraph(ch['s3_p2'], styles['Body']))
-
-    # A cosa serve
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    add_bullet_list(story, ch['s4_items'], styles)
-
-    story.append(PageBreak())
-
-
-def build_chapter_12(story, T, styles, lang):
-    """Capitolo 12: Export PDF, Word e Markdown"""
-    ch = T['ch12']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-
-    # Come esportare
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    add_numbered_list(story, ch['s1_items'], styles)
-
-    # Cosa incluso
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s2_items'], styles)
-
-    # Cosa escluso
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s3_items'], styles)
-
-    story.append(Paragraph(ch['s4_note'], styles['Note']))
-
-    # Formato PDF tecnico
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    story.append(make_table(ch['s5_table'], col_widths=[6*cm, 8*cm]))
-    story.append(Spacer(1, 0.3*cm))
-
-    # Word
-    story.append(Paragraph(ch['s6_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s6_p1'], styles['Body']))
-
-    # Markdown
-    story.append(Paragraph(ch['s7_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s7_p1'], styles['Body']))
-
-    story.append(PageBreak())
-
+def build_cover(story, T, styles, lang):
+    """Copertina"""
+    body = styles['Body']
+    cover_title = styles['CoverTitle']
+    cover_subtitle = styles['CoverSubtitle']
+    append = story.append
+
+    append(spacer(4*cm))
+    append(_para("Tramando", cover_title))
+    append(_para(T['tagline'], cover_subtitle))
+    append(spacer(0.5*cm))
+    append(_para(T['manual_title'], cover_subtitle))
+    append(spacer(1*cm))
+    add_image(story, lang, 'splash_tauri.png', '', styles, width=12*cm)
+    append(spacer(1*cm))
+    append(_para(T['version'], body))
+    append(PAGE_BREAK)
+
+
+def build_toc(story, T, styles, lang):
+    """Indice"""
+    chapter_title = styles['ChapterTitle']
+    toc_entry = styles['TOCEntry']
+    append = story.append
+
+    append(_para(T['toc_title'], chapter_title))
+    append(spacer(0.5*cm))
+    append(_para('<br/>'.join(T['chapters']), toc_entry))
+    append(PAGE_BREAK)
+
+
+def render_chapter(story, T, styles, lang, key, steps):
+    """Aggiunge allo story un capitolo descritto in CHAPTERS."""
+    ch = T[key]
+    append = story.append
+
+    append(_para(ch['title'], styles['ChapterTitle']))
+
+    for op, *args in steps:
+        if op == 'bullets':
+            add_bullet_list(story, ch[args[0]], styles)
+        elif op == 'numbers':
+            add_numbered_list(story, ch[args[0]], styles)
+        elif op == 'table':
+            append(make_table(ch[args[0]], col_widths=list(args[1])))
+        elif op == 'spacer':
+            append(spacer(args[0]))
+        elif op == 'image':
+            filename, caption, width = args
+            add_image(story, lang, filename, T['captions'][caption], styles, width=width)
+        elif op == 'italic':
+            append(_para(f"<i>{ch[args[1]]}</i>", styles[args[0]]))
+        elif op == 'code_lines':
+            append(_para(ch[args[0]].replace('\n', '<br/>'), styles['CodeBlock']))
+        elif op == 'each':
+            style = styles[args[0]]
+            story.extend(_para(item, style) for item in ch[args[1]])
+        else:
+            add_paragraphs(story, ch, args, styles[op])
 
-def build_chapter_13(story, T, styles, lang):
-    """Capitolo 13: Impostazioni"""
-    ch = T['ch13']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    add_image(story, lang, 'settings.png', T['captions']['settings'], styles, width=10*cm)
 
-    # Temi
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    story.append(make_table(ch['s1_table'], col_widths=[4*cm, 10*cm]))
-    story.append(Spacer(1, 0.3*cm))
+def iter_story(T, styles, lang):
+    """Genera i flowable del manuale, una sezione alla volta."""
+    for builder in (build_cover, build_toc):
+        part = []
+        builder(part, T, styles, lang)
+        yield from part
 
-    # Autosave
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-
-    # Lingua
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-
-    # Import/Export
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-
-    # Tutorial
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s5_p1'], styles['Body']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_14(story, T, styles, lang):
-    """Capitolo 14: Il formato file .trmd"""
-    ch = T['ch14']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Struttura generale
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s1_items'], styles)
-
-    # Frontmatter
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    story.append(Paragraph(ch['s2_code'].replace('\n', '<br/>'), styles['CodeBlock']))
-
-    # Sintassi chunk
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_code'].replace('\n', '<br/>'), styles['CodeBlock']))
-    add_bullet_list(story, ch['s3_items'], styles)
-
-    # ID riservati
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    add_bullet_list(story, ch['s4_items'], styles)
-    story.append(Paragraph(ch['s4_note'], styles['Note']))
-
-    # Annotazioni
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s5_code'], styles['CodeBlock']))
-
-    # Metadati estesi (v2.0)
-    story.append(Paragraph(ch['s6_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s6_p1'], styles['Body']))
-    story.append(make_table(ch['s6_table'], col_widths=[6*cm, 8*cm]))
-    story.append(Spacer(1, 0.3*cm))
-    story.append(Paragraph(ch['s6_note'], styles['Note']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_15(story, T, styles, lang):
-    """Capitolo 15: Scorciatoie da tastiera"""
-    ch = T['ch15']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-
-    story.append(make_table(ch['s1_table'], col_widths=[6*cm, 8*cm]))
-    story.append(Spacer(1, 0.3*cm))
-
-    story.append(Paragraph(ch['s2_note'], styles['Note']))
-
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-
-    story.append(PageBreak())
-
-
-def build_chapter_16(story, T, styles, lang):
-    """Capitolo 16: Assistente AI"""
-    ch = T['ch16']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-
-    # Introduzione
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s1_p1'], styles['Body']))
-    story.append(Paragraph(ch['s1_p2'], styles['Body']))
-    add_bullet_list(story, ch['s1_items'], styles)
-    story.append(Paragraph(ch['s1_note'], styles['Note']))
-
-    # Configurazione
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    story.append(Paragraph(ch['s2_sub1'], styles['SubsectionTitle']))
-    story.append(make_table(ch['s2_table'], col_widths=[3*cm, 3*cm, 4*cm, 4*cm]))
-    story.append(Spacer(1, 0.3*cm))
-    story.append(Paragraph(ch['s2_sub2'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s2_ollama'], styles['Body']))
-    story.append(Paragraph(ch['s2_sub3'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s2_groq'], styles['Body']))
-    story.append(Paragraph(ch['s2_sub4'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s2_paid'], styles['Body']))
-
-    # Usare AI senza API
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    add_bullet_list(story, ch['s3_items'], styles)
-    story.append(Paragraph(ch['s3_note'], styles['Note']))
-
-    # Il pannello
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    add_bullet_list(story, ch['s4_items'], styles)
-    story.append(Paragraph(ch['s4_sub1'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s4_context'], styles['Body']))
-
-    # Azioni AI
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s5_p1'], styles['Body']))
-    story.append(Paragraph(ch['s5_sub1'], styles['SubsectionTitle']))
-    add_bullet_list(story, ch['s5_items1'], styles)
-    story.append(Paragraph(ch['s5_sub2'], styles['SubsectionTitle']))
-    add_bullet_list(story, ch['s5_items2'], styles)
-    story.append(Paragraph(ch['s5_sub3'], styles['SubsectionTitle']))
-    add_bullet_list(story, ch['s5_items3'], styles)
-
-    # Annotazioni AI
-    story.append(Paragraph(ch['s6_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s6_p1'], styles['Body']))
-    add_bullet_list(story, ch['s6_flow'], styles)
-    story.append(Paragraph(ch['s6_sub1'], styles['SubsectionTitle']))
-    story.append(Paragraph(ch['s6_choose'], styles['Body']))
-    story.append(Paragraph(ch['s6_note'], styles['Note']))
-
-    # Consigli
-    story.append(Paragraph(ch['s7_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s7_items'], styles)
-
-    story.append(PageBreak())
-
-
-def build_chapter_17(story, T, styles, lang):
-    """Capitolo 17: Modalita collaborativa"""
-    ch = T['ch17']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-    story.append(Paragraph(ch['intro'], styles['Body']))
-
-    # Requisiti
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s1_items'], styles)
-
-    # Login e progetti
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s2_p1'], styles['Body']))
-    add_bullet_list(story, ch['s2_items'], styles)
-
-    # Ruoli e permessi
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s3_p1'], styles['Body']))
-    story.append(make_table(ch['s3_table'], col_widths=[3*cm, 11*cm]))
-    story.append(Spacer(1, 0.3*cm))
-
-    # Ownership
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s4_p1'], styles['Body']))
-    add_bullet_list(story, ch['s4_items'], styles)
-
-    # Proposte
-    story.append(Paragraph(ch['s5_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s5_p1'], styles['Body']))
-    add_numbered_list(story, ch['s5_items'], styles)
-    story.append(Paragraph(ch['s5_p2'], styles['Body']))
-
-    # Discussioni
-    story.append(Paragraph(ch['s6_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s6_p1'], styles['Body']))
-    add_bullet_list(story, ch['s6_items'], styles)
-
-    # Chat
-    story.append(Paragraph(ch['s7_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s7_p1'], styles['Body']))
-
-    # Sincronizzazione
-    story.append(Paragraph(ch['s8_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s8_p1'], styles['Body']))
-    add_bullet_list(story, ch['s8_items'], styles)
-
-    # Gestire collaboratori
-    story.append(Paragraph(ch['s9_title'], styles['SectionTitle']))
-    story.append(Paragraph(ch['s9_p1'], styles['Body']))
-    add_bullet_list(story, ch['s9_items'], styles)
-    story.append(Paragraph(ch['s9_note'], styles['Note']))
-
-    story.append(PageBreak())
-
-
-def build_appendix(story, T, styles, lang):
-    """Appendice: Riferimento rapido"""
-    ch = T['appendix']
-    story.append(Paragraph(ch['title'], styles['ChapterTitle']))
-
-    # Sintassi base
-    story.append(Paragraph(ch['s1_title'], styles['SectionTitle']))
-    story.append(make_table(ch['s1_table'], col_widths=[5*cm, 9*cm]))
-    story.append(Spacer(1, 0.3*cm))
-
-    # Sintassi v2.0
-    story.append(Paragraph(ch['s1b_title'], styles['SectionTitle']))
-    story.append(make_table(ch['s1b_table'], col_widths=[5*cm, 9*cm]))
-    story.append(Spacer(1, 0.5*cm))
-
-    # ID riservati
-    story.append(Paragraph(ch['s2_title'], styles['SectionTitle']))
-    story.append(make_table(ch['s2_table'], col_widths=[5*cm, 9*cm]))
-    story.append(Spacer(1, 0.5*cm))
-
-    # Colori mappa
-    story.append(Paragraph(ch['s3_title'], styles['SectionTitle']))
-    story.append(make_table(ch['s3_table'], col_widths=[4*cm, 4*cm, 4*cm]))
-    story.append(Spacer(1, 0.5*cm))
-
-    # Limiti
-    story.append(Paragraph(ch['s4_title'], styles['SectionTitle']))
-    add_bullet_list(story, ch['s4_items'], styles)
-
-    # Footer
-    story.append(Spacer(1, 2*cm))
-    story.append(Paragraph(f"<i>{ch['footer']}</i>", styles['Caption']))
+    # Ogni capitolo inizia su una nuova pagina
+    for i, (key, steps) in enumerate(CHAPTERS):
+        if i:
+            yield PAGE_BREAK
+        part = []
+        render_chapter(part, T, styles, lang, key, steps)
+        yield from part
 
 
 def build_manual(lang):
     """Costruisce il manuale completo."""
-    T = IT if lang == 'it' else EN
+    T = get_contents(lang)
     styles = create_styles()
 
-    # Cambia directory di lavoro per trovare le immagini
-    os.chdir(SCRIPT_DIR)
-
+    # Il PDF viene prodotto in memoria e scritto su disco in un'unica volta
+    buffer = io.BytesIO()
     doc = SimpleDocTemplate(
-        T['filename'],
+        buffer,
         pagesize=A4,
         leftMargin=MARGIN,
         rightMargin=MARGIN,
         topMargin=MARGIN,
-        bottomMargin=MARGIN
+        bottomMargin=MARGIN,
+        pageCompression=1,
+        invariant=1  # Niente data e ID casuali: PDF identico se i contenuti non cambiano
     )
 
-    story = []
-
-    # COPERTINA
-    story.append(Spacer(1, 4*cm))
-    story.append(Paragraph("Tramando", styles['CoverTitle']))
-    story.append(Paragraph(T['tagline'], styles['CoverSubtitle']))
-    story.append(Spacer(1, 0.5*cm))
-    story.append(Paragraph(T['manual_title'], styles['CoverSubtitle']))
-    story.append(Spacer(1, 1*cm))
-    add_image(story, lang, 'splash_tauri.png', '', styles, width=12*cm)
-    story.append(Spacer(1, 1*cm))
-    story.append(Paragraph(T['version'], styles['Body']))
-    story.append(PageBreak())
-
-    # INDICE
-    story.append(Paragraph(T['toc_title'], styles['ChapterTitle']))
-    story.append(Spacer(1, 0.5*cm))
-    for ch in T['chapters']:
-        story.append(Paragraph(ch, styles['TOCEntry']))
-    story.append(PageBreak())
-
-    # CAPITOLI
-    build_chapter_1(story, T, styles, lang)
-    build_chapter_2(story, T, styles, lang)
-    build_chapter_3(story, T, styles, lang)
-    build_chapter_4(story, T, styles, lang)
-    build_chapter_5(story, T, styles, lang)
-    build_chapter_6(story, T, styles, lang)
-    build_chapter_7(story, T, styles, lang)
-    build_chapter_8(story, T, styles, lang)
-    build_chapter_9(story, T, styles, lang)
-    build_chapter_10(story, T, styles, lang)
-    build_chapter_11(story, T, styles, lang)
-    build_chapter_12(story, T, styles, lang)
-    build_chapter_13(story, T, styles, lang)
-    build_chapter_14(story, T, styles, lang)
-    build_chapter_15(story, T, styles, lang)
-    build_chapter_16(story, T, styles, lang)
-    build_chapter_17(story, T, styles, lang)
-    build_appendix(story, T, styles, lang)
-
-    # BUILD
-    doc.build(story)
+    # BUILD (SimpleDocTemplate richiede una lista)
+    doc.build(list(iter_story(T, styles, lang)))
+    with open(os.path.join(SCRIPT_DIR, T['filename']), 'wb') as f:
+        f.write(buffer.getbuffer())
     print(f"  Generato: {T['filename']}")
 
 
@@ -2826,13 +1121,23 @@ def main():
     print("  Tramando - Generatore Manuale Utente")
     print("=" * 50)
 
+    langs = []
     for lang in args:
         if lang in ['it', 'en']:
             print(f"\nGenerazione manuale {lang.upper()}...")
-            build_manual(lang)
+            langs.append(lang)
         else:
             print(f"[!] Lingua non supportata: {lang}")
 
+    # Le lingue sono indipendenti: se ci sono piu' CPU, un processo ciascuna
+    workers = min(len(langs), os.cpu_count() or 1)
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(build_manual, langs))
+    else:
+        for lang in langs:
+            build_manual(lang)
+
     print("\nCompletato!")
     print("=" * 50)
 